@@ -191,7 +191,7 @@ def _(mo):
 
 @app.cell
 async def _(DOI, mo, session):
-    papers = await session.queries.publications_by_doi(session, DOI)
+    papers, _ = await session.queries.publications_by_doi(session, DOI)
     paper = papers[0] if papers else None
     paper
     return (paper,)
@@ -53,7 +53,7 @@ def _():
 
 @app.cell
 async def _(mo, q, session):
-    _papers = await q.publications_by_doi(
+    _papers, _missing = await q.publications_by_doi(
         session,
         "10.1038/s41586-024-07386-0",
         "10.1038/s41586-024-07891-0",
@@ -77,7 +77,7 @@ async def _(mo, q, session):
     ## 1. Publications by DOI
 
     `q.publications_by_doi(session, *dois)` — fetch research products
-    for one or more DOIs.
+    for one or more DOIs, and the DOIs that matched none.
 
     Found **{len(_papers)}** results:
     """
@@ -311,7 +311,7 @@ def _(mo):
 
 | # | Function | Signature |
 |---|----------|-----------|
-| 1 | `publications_by_doi` | `(session, *dois) → list[ResearchProduct]` |
+| 1 | `publications_by_doi` | `(session, *dois) → PublicationsByDoi(products, missing)` |
 | 2 | `publications_by_organization` | `(session, identifier, *, search_on, type, from_publication_date, to_publication_date, open_access_only, sort_by, limit) → list[ResearchProduct]` |
 | 3 | `publications_by_author` | `(session, identifier, *, search_on, type, sort_by, limit) → list[ResearchProduct]` |
 | 4 | `publications_by_project` | `(session, identifier, *, search_on, type, sort_by, limit) → list[ResearchProduct]` |
@@ -0,0 +1,132 @@
+"""Benchmark cached computed fields on research products.
+
+Compares ``ResearchProduct``, whose derived fields (``doi``,
+``publication_year``, ...) are cached per instance, with a variant that
+recomputes them on every access, as they were before. The workloads run on
+freshly validated records each round:
+
+* ``read once``: each cached field read once, where caching only adds the
+  cost of storing the value;
+* ``dedupe/join``: the reads of a dedupe pass followed by a join, which
+  look up ``doi``, ``all_dois`` and ``publication_year`` repeatedly;
+* ``dedupe/join + model_dump``: the same, then serializing the record.
+
+On the synthetic page, runs vary between about these ranges:
+
+* ``read once``: 0.67-0.87x. Storing the value costs more than computing it
+  a single time.
+* ``dedupe/join``: 1.2-1.7x.
+* ``dedupe/join + model_dump``: 0.7-1.03x. Serialization dominates, so the
+  result mostly reflects noise between runs.
+
+Assigning a field of a model that caches also goes through a Python-level
+``__setattr__``, which checks whether the field is an input of a cached
+value. Models without cached fields keep pydantic's own ``__setattr__``.
+
+Record real pages first (see ``benchmark_decoding.py``) and pass them as
+arguments. Without arguments a synthetic page is used.
+
+Usage::
+
+    uv run python scripts/benchmark_computed_fields.py [page.json ...] [--rounds N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from benchmark_decoding import synthetic_page
+from pydantic import computed_field
+
+from aireloom.models import ResearchProduct
+from aireloom.models.base import computed_getter
+
+#: Attribute reads per record in the ``dedupe/join`` workload.
+READS = (
+    ("doi", "all_dois", "publication_year")
+    + ("doi", "publication_year")
+    + ("doi", "all_dois")
+)
+#: The computed fields that ``ResearchProduct`` caches.
+CACHED = sorted(ResearchProduct._cached_fields)
+
+
+def uncached(model: type[ResearchProduct]) -> type[ResearchProduct]:
+    """*model* with its cached computed fields turned into plain properties."""
+    namespace: dict[str, Any] = {"__module__": __name__}
+    for name in CACHED:
+        info = model.model_computed_fields[name]
+        namespace[name] = computed_field(property(computed_getter(info)))
+    return type(f"Uncached{model.__name__}", (model,), namespace)
+
+
+def read_once(product: ResearchProduct) -> Any:
+    return [getattr(product, name) for name in CACHED]
+
+
+def dedupe_join(product: ResearchProduct) -> Any:
+    return [getattr(product, name) for name in READS]
+
+
+def dedupe_join_and_dump(product: ResearchProduct) -> Any:
+    return dedupe_join(product), product.model_dump()
+
+
+WORKLOADS: dict[str, Callable[[ResearchProduct], Any]] = {
+    "read once": read_once,
+    "dedupe/join": dedupe_join,
+    "dedupe/join + model_dump": dedupe_join_and_dump,
+}
+
+
+def bench(
+    model: type[ResearchProduct],
+    work: Callable[[ResearchProduct], Any],
+    records: list[dict[str, Any]],
+    rounds: int,
+) -> float:
+    """Best seconds per record over *rounds*; validation is not timed."""
+    timings = []
+    for _ in range(rounds):
+        products = [model.model_validate(r) for r in records]
+        start = time.perf_counter()
+        for product in products:
+            work(product)
+        timings.append((time.perf_counter() - start) / len(products))
+    return min(timings)
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages", nargs="*", type=Path, help="Recorded page files")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    pages = [p.read_bytes() for p in args.pages] or [synthetic_page()]
+    records = [r for p in pages for r in json.loads(p).get("results") or []]
+    source = f"{len(args.pages)} recorded page(s)" if args.pages else "synthetic page"
+    print(f"{source}, {len(records)} record(s), {args.rounds} rounds\n")
+
+    models = {"recomputed": uncached(ResearchProduct), "cached": ResearchProduct}
+    for label, work in WORKLOADS.items():
+        expected = [work(models["recomputed"].model_validate(r)) for r in records]
+        baseline = None
+        for name, model in models.items():
+            if [work(model.model_validate(r)) for r in records] != expected:
+                print(f"warning: {name} produced different values")
+            seconds = bench(model, work, records, args.rounds)
+            baseline = baseline or seconds
+            print(
+                f"{label + ', ' + name:40} {seconds * 1e6:8.1f} us/record  "
+                f"{baseline / seconds:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
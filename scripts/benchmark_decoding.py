@@ -0,0 +1,213 @@
+"""Benchmark response decoding paths for research-product pages.
+
+Compares, per page:
+
+* ``model_validate(json.loads(body))`` — the stdlib path;
+* ``model_validate(orjson.loads(body))`` — the default when orjson is
+  installed;
+* ``model_validate_json(body)`` — single-pass validation from bytes.
+
+Decoding alone is reported as well, to show how much of the time is spent
+in validation, followed by a projection-style pipeline over decoded records
+(validating each and reading ``id``, ``doi``, ``publication_year`` and
+``citation_count``) with ``ResearchProduct``, ``LazyResearchProduct`` and a
+``fields=`` projection.
+
+Record real pages first, for example::
+
+    curl -s 'https://api.openaire.eu/graph/v2/researchProducts?search=climate&pageSize=100' \
+        > page1.json
+
+and pass them as arguments. Without arguments a synthetic 100-record page
+is used.
+
+Usage::
+
+    uv run python scripts/benchmark_decoding.py [page.json ...] [--rounds N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from aireloom.models import (
+    LazyResearchProduct,
+    ResearchProduct,
+    ResearchProductResponse,
+    projected_model,
+)
+
+#: Fields that the projection pipeline needs when parsed with ``fields=``.
+PROJECTION = frozenset({"pids", "publicationDate", "indicators"})
+
+
+def synthetic_record(i: int) -> dict[str, Any]:
+    """A research product with the nesting typical of Graph API records."""
+    return {
+        "id": f"doi_dedup___::{i:032x}",
+        "originalIds": [f"50|doiboost____::{i:032x}", f"10.1234/bench.{i}"],
+        "pids": [{"scheme": "doi", "value": f"10.1234/bench.{i}"}],
+        "type": "publication",
+        "mainTitle": f"Benchmark record {i} on decoding throughput",
+        "authors": [
+            {
+                "fullName": f"Author {i}-{n}",
+                "name": "Author",
+                "surname": f"{i}-{n}",
+                "rank": n + 1,
+                "pid": {"id": {"scheme": "orcid", "value": "0000-0002-1825-0097"}},
+            }
+            for n in range(8)
+        ],
+        "bestAccessRight": {"code": "c_abf2", "label": "OPEN", "scheme": "coar"},
+        "description": "Lorem ipsum dolor sit amet. " * 40,
+        "publicationDate": "2023-06-15",
+        "publisher": "Bench Press",
+        "dateOfCollection": "2024-01-05T10:00:00Z",
+        "lastUpdateTimeStamp": 1704448800000 + i,
+        "indicators": {
+            "citationImpact": {
+                "influence": 3.1e-9,
+                "influenceClass": "C4",
+                "citationCount": 12,
+                "citationClass": "C4",
+                "popularity": 7.2e-9,
+                "popularityClass": "C4",
+                "impulse": 4.0,
+                "impulseClass": "C4",
+            },
+            "usageCounts": {"downloads": 10, "views": 40},
+        },
+        "instances": [
+            {
+                "accessRight": {"code": "c_abf2", "label": "OPEN", "scheme": "coar"},
+                "collectedFrom": {"name": "Crossref", "id": "openaire____::crossref"},
+                "hostedBy": {"name": "Bench Journal", "id": "issn___::1234-5678"},
+                "publicationDate": "2023-06-15",
+                "refereed": "peerReviewed",
+                "type": "Article",
+                "urls": [f"https://doi.org/10.1234/bench.{i}"],
+            }
+            for _ in range(3)
+        ],
+        "subjects": [
+            {"subject": {"scheme": "keyword", "value": f"topic {n}"}} for n in range(6)
+        ],
+        "container": {"name": "Bench Journal", "issnPrinted": "1234-5678"},
+    }
+
+
+def synthetic_page(size: int = 100) -> bytes:
+    page = {
+        "header": {"numFound": size, "pageSize": size, "page": 1},
+        "results": [synthetic_record(i) for i in range(size)],
+    }
+    return json.dumps(page).encode()
+
+
+def decoders() -> dict[str, Callable[[bytes], ResearchProductResponse]]:
+    model = ResearchProductResponse
+    paths: dict[str, Callable[[bytes], ResearchProductResponse]] = {
+        "json.loads + model_validate": lambda b: model.model_validate(json.loads(b)),
+    }
+    try:
+        import orjson  # noqa: PLC0415 — optional
+    except ImportError:
+        pass
+    else:
+        paths["orjson.loads + model_validate"] = lambda b: model.model_validate(
+            orjson.loads(b)
+        )
+    paths["model_validate_json"] = model.model_validate_json
+    return paths
+
+
+def decode_only() -> dict[str, Callable[[bytes], Any]]:
+    paths: dict[str, Callable[[bytes], Any]] = {"json.loads": json.loads}
+    try:
+        import orjson  # noqa: PLC0415 — optional
+    except ImportError:
+        pass
+    else:
+        paths["orjson.loads"] = orjson.loads
+    return paths
+
+
+def projections() -> dict[str, Callable[[list[Any]], Any]]:
+    """Validate decoded records and read four fields of each."""
+
+    def project(model: type[Any]) -> Callable[[list[Any]], Any]:
+        def run(records: list[Any]) -> list[tuple[Any, ...]]:
+            return [
+                (p.id, p.doi, p.publication_year, p.citation_count)
+                for p in map(model.model_validate, records)
+            ]
+
+        return run
+
+    slim = projected_model(ResearchProduct, PROJECTION)
+    return {
+        "ResearchProduct": project(ResearchProduct),
+        "LazyResearchProduct": project(LazyResearchProduct),
+        "fields=" + ",".join(sorted(PROJECTION)): project(slim),
+    }
+
+
+def bench(fn: Callable[[Any], Any], pages: list[Any], rounds: int) -> float:
+    """Return the best seconds per page over *rounds* passes, as timeit does."""
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for body in pages:
+            fn(body)
+        timings.append((time.perf_counter() - start) / len(pages))
+    return min(timings)
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages", nargs="*", type=Path, help="Recorded page files")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    pages = [p.read_bytes() for p in args.pages] or [synthetic_page()]
+    source = f"{len(args.pages)} recorded page(s)" if args.pages else "synthetic page"
+    records = sum(len(json.loads(p).get("results") or []) for p in pages)
+    print(f"{source}, {records} record(s), {args.rounds} rounds\n")
+
+    paths = decoders()
+    reference = [paths["json.loads + model_validate"](p) for p in pages]
+    baseline = None
+    for name, fn in paths.items():
+        if [fn(p) for p in pages] != reference:
+            print(f"warning: {name} produced different models")
+        seconds = bench(fn, pages, args.rounds)
+        baseline = baseline or seconds
+        print(f"{name:40} {seconds * 1e3:8.2f} ms/page  {baseline / seconds:5.2f}x")
+
+    print("\ndecoding only")
+    for name, fn in decode_only().items():
+        seconds = bench(fn, pages, args.rounds)
+        print(f"{name:40} {seconds * 1e3:8.2f} ms/page")
+
+    print("\nprojection (decoded records): id, doi, publication_year, citation_count")
+    decoded = [json.loads(p).get("results") or [] for p in pages]
+    projectors = projections()
+    expected = [projectors["ResearchProduct"](r) for r in decoded]
+    baseline = None
+    for name, fn in projectors.items():
+        if [fn(r) for r in decoded] != expected:
+            print(f"warning: {name} produced different values")
+        seconds = bench(fn, decoded, args.rounds)
+        baseline = baseline or seconds
+        print(f"{name:40} {seconds * 1e3:8.2f} ms/page  {baseline / seconds:5.2f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,106 @@
+"""Measure the memory held by research products as models and compact records.
+
+Decodes and validates every record of the given pages and reports the
+memory retained per record (traced with ``tracemalloc``, decoded strings
+included) when kept as:
+
+* ``ResearchProduct`` models, as returned by ``iterate``;
+* compact records, as returned by ``iterate(compact=True)``;
+* compact records of a ``fields=`` projection;
+
+each with string interning of vocabulary fields off and on (see
+``set_string_interning``).
+
+Record real pages first (see ``benchmark_decoding.py``) and pass them as
+arguments. Without arguments synthetic pages are used.
+
+Usage::
+
+    uv run python scripts/benchmark_memory.py [page.json ...] [--copies N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from benchmark_decoding import PROJECTION, synthetic_page
+
+from aireloom import set_string_interning
+from aireloom.models import ResearchProduct, projected_model, to_compact
+
+
+def retained(build: Callable[[], list[Any]]) -> tuple[list[Any], int]:
+    """Return the result of *build* and the bytes it still holds."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, size
+
+
+def parse_pages(
+    pages: list[bytes], convert: Callable[[dict[str, Any]], Any]
+) -> list[Any]:
+    """Decode *pages* and keep ``convert(record)`` for each of their records."""
+    held = []
+    for page in pages:
+        held.extend(map(convert, json.loads(page).get("results") or []))
+    return held
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pages", nargs="*", type=Path, help="Recorded page files")
+    parser.add_argument(
+        "--copies", type=int, default=10, help="Times to hold each page's records"
+    )
+    args = parser.parse_args(argv)
+
+    pages = [p.read_bytes() for p in args.pages] or [synthetic_page()]
+    # Decode each copy separately, as harvesting the pages again would.
+    pages *= args.copies
+    count = sum(len(json.loads(p).get("results") or []) for p in pages)
+    source = f"{len(args.pages)} recorded page(s)" if args.pages else "synthetic page"
+    print(f"{source} x {args.copies}, {count} record(s)\n")
+
+    slim = projected_model(ResearchProduct, PROJECTION)
+    layouts: dict[str, Callable[[dict[str, Any]], Any]] = {
+        "ResearchProduct": ResearchProduct.model_validate,
+        "compact ResearchProduct": lambda r: to_compact(
+            ResearchProduct.model_validate(r)
+        ),
+        "compact fields=" + ",".join(sorted(PROJECTION)): lambda r: to_compact(
+            slim.model_validate(r)
+        ),
+    }
+    baseline = None
+    for interning in (False, True):
+        set_string_interning(enabled=interning)
+        for name, convert in layouts.items():
+            # Warm up, so that building the record types is not measured.
+            convert(json.loads(pages[0])["results"][0])
+            held, size = retained(partial(parse_pages, pages, convert))
+            del held
+            baseline = baseline or size
+            label = f"{name}{', interned' if interning else ''}"
+            print(
+                f"{label:58} {size / count:8.0f} B/record  "
+                f"{baseline / size:5.2f}x smaller"
+            )
+    set_string_interning(enabled=True)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
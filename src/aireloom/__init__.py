@@ -12,6 +12,7 @@ from bibliofabric.exceptions import (
     ValidationError,
 )
 
+from ._decoding import set_json_decoder
 from .client import AireloomClient
 from .constants import __version__
 from .models import (
@@ -25,6 +26,8 @@ from .models import (
     ResearchProduct,
     ScholixRelationship,
 )
+from .models.interning import set_string_interning
+from .resources import BatchGetError
 from .session import AireloomSession
 
 __all__ = [
@@ -41,6 +44,7 @@ __all__ = [
     "RateLimitError",
     "TimeoutError",
     "ValidationError",
+    "BatchGetError",
     # Key Models (consider reducing if needed)
     "ApiResponse",
     "BaseEntity",
@@ -51,4 +55,7 @@ __all__ = [
     "Project",
     "ResearchProduct",
     "ScholixRelationship",
+    # Configuration
+    "set_json_decoder",
+    "set_string_interning",
 ]
@@ -0,0 +1,87 @@
+"""Pluggable JSON decoding for API responses.
+
+Every response body goes through one decoder: ``orjson.loads`` when orjson
+is installed (``pip install aireloom[fast]``), ``json.loads`` otherwise, or
+whatever :func:`set_json_decoder` installed. Models are then validated from the decoded value.
+
+``model_validate_json`` would skip the intermediate Python objects, but the
+response models rely on ``mode="before"`` validators (``ApiResponse.results``,
+``ResearchProduct``'s title fallback and the ``Safe*`` field types), which
+need those objects anyway; measured with ``scripts/benchmark_decoding.py`` it
+is slower than decoding first, so the decoder is the part worth swapping.
+
+Responses without a bytes body (test doubles, for instance) fall back to
+``response.json()``.
+
+Example::
+
+    import msgspec.json
+    from aireloom import set_json_decoder
+
+    set_json_decoder(msgspec.json.decode)
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel
+
+#: Signature of a JSON decoder: raw body in, Python value out.
+JsonDecoder = Callable[[bytes | str], Any]
+
+
+def _default_decoder() -> JsonDecoder:
+    try:
+        import orjson  # noqa: PLC0415 — optional dependency
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+
+_decoder: JsonDecoder = _default_decoder()
+
+
+def set_json_decoder(decoder: JsonDecoder | None) -> None:
+    """Use *decoder* for all response bodies; None restores the default."""
+    global _decoder  # noqa: PLW0603 — process-wide setting
+    _decoder = decoder if decoder is not None else _default_decoder()
+
+
+def get_json_decoder() -> JsonDecoder:
+    """Return the decoder currently used by :func:`decode_json`."""
+    return _decoder
+
+
+def decode_json(raw: bytes | str) -> Any:
+    """Decode a JSON document with the configured decoder."""
+    return _decoder(raw)
+
+
+def response_body(response: Any) -> bytes | None:
+    """Return the raw body of *response*, or None if it has none."""
+    content = getattr(response, "content", None)
+    return content if isinstance(content, bytes) else None
+
+
+def response_bytes(response: Any) -> bytes:
+    """Return the raw body of *response*, re-encoding it if it has none."""
+    body = response_body(response)
+    if body is None:
+        return json.dumps(response.json()).encode()
+    return body
+
+
+def response_json(response: Any) -> Any:
+    """Decode the JSON body of *response*."""
+    body = response_body(response)
+    if body is None:
+        return response.json()
+    return decode_json(body)
+
+
+def validate_response[M: BaseModel](model: type[M], response: Any) -> M:
+    """Decode the JSON body of *response* and validate it as *model*."""
+    return model.model_validate(response_json(response))
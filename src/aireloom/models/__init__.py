@@ -1,7 +1,9 @@
 """Pydantic models for OpenAIRE API entities and responses."""
 
 from .base import ApiResponse, BaseEntity, Header
+from .compact import CompactMapping, compact_type, to_compact
 from .data_source import ControlledField, DataSource, DataSourceResponse
+from .interning import InternedStr, OptionalInternedStr
 from .organization import Country, Organization, OrganizationPid, OrganizationResponse
 from .person import Person, PersonResponse
 from .project import (
@@ -12,6 +14,7 @@ from .project import (
     Project,
     ProjectResponse,
 )
+from .projection import projected_model
 from .relation import (
     EntityRef,
     Identifier,
@@ -20,7 +23,12 @@ from .relation import (
     Relation,
     RelType,
 )
-from .research_product import ResearchProduct, ResearchProductResponse
+from .research_product import (
+    LazyResearchProduct,
+    LazyResearchProductResponse,
+    ResearchProduct,
+    ResearchProductResponse,
+)
 from .safe_types import SafeList, SafeStr
 from .scholix import (
     ScholixCreator,
@@ -38,6 +46,8 @@ __all__ = [
     "BaseEntity",
     "SafeList",
     "SafeStr",
+    "compact_type",
+    "CompactMapping",
     "ControlledField",
     "Country",
     "DataSource",
@@ -49,8 +59,12 @@ __all__ = [
     "H2020Programme",
     "Header",
     "Identifier",
+    "InternedStr",
+    "LazyResearchProduct",
+    "LazyResearchProductResponse",
     "LinksResponse",
     "Node",
+    "OptionalInternedStr",
     "Organization",
     "OrganizationPid",
     "OrganizationResponse",
@@ -58,6 +72,7 @@ __all__ = [
     "PersonResponse",
     "Project",
     "ProjectResponse",
+    "projected_model",
     "Relation",
     "RelType",
     "ResearchProduct",
@@ -70,4 +85,5 @@ __all__ = [
     "ScholixRelationship",
     "ScholixRelationshipNameValue",
     "ScholixResponse",
+    "to_compact",
 ]
@@ -7,10 +7,14 @@ These models provide data validation and a clear structure for API data.
 """
 
 import logging
-from typing import Any, TypeVar
+from collections.abc import Callable, Generator, Mapping
+from functools import cached_property
+from itertools import chain
+from typing import Any, ClassVar, Self, TypeVar
 
 from pydantic import BaseModel, Field, HttpUrl, field_validator  # Added Field
 from pydantic.config import ConfigDict  # Added ConfigDict
+from pydantic.fields import ComputedFieldInfo
 
 # Generic type for the entity contained within the response results
 EntityType = TypeVar("EntityType", bound="BaseEntity")
@@ -83,6 +87,16 @@ class BaseEntity(BaseModel):
     identifier across most OpenAIRE entities. It allows extra fields from the
     API to be captured without causing validation errors.
 
+    Computed fields declared with ``cached_property`` instead of ``property``
+    are computed once per instance, on first access or serialization. The
+    cached values are dropped when one of their inputs is reassigned or
+    replaced through ``model_copy(update=...)``; in-place changes to nested
+    values (e.g. appending to ``pids``) are not detected.
+
+    Subclasses list the fields each computed field reads in
+    ``_computed_inputs``, which projections (see ``projected_model``) and
+    the cache invalidation rely on.
+
     Attributes:
         id: The unique identifier for the entity.
     """
@@ -90,6 +104,68 @@ class BaseEntity(BaseModel):
     # Common identifier across most entities
     id: str
 
+    #: Names of the computed fields cached per instance.
+    _cached_fields: ClassVar[frozenset[str]] = frozenset()
+
+    #: Model fields read by each computed field.
+    _computed_inputs: ClassVar[Mapping[str, tuple[str, ...]]] = {}
+
+    #: Fields whose assignment drops the cached computed values.
+    _cache_inputs: ClassVar[frozenset[str]] = frozenset()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._cached_fields = frozenset(
+            name
+            for name, info in cls.model_computed_fields.items()
+            if isinstance(info.wrapped_property, cached_property)
+        )
+        for name, inputs in cls._computed_inputs.items():
+            unknown = {name} - cls.model_computed_fields.keys()
+            unknown |= set(inputs) - cls.model_fields.keys()
+            if unknown:
+                raise TypeError(
+                    f"{cls.__name__}._computed_inputs names unknown field(s): "
+                    f"{', '.join(sorted(unknown))}"
+                )
+        # Cached fields without declared inputs may read any field.
+        cls._cache_inputs = frozenset(
+            chain.from_iterable(
+                cls._computed_inputs.get(name, cls.model_fields)
+                for name in cls._cached_fields
+            )
+        )
+        if cls._cache_inputs and "__setattr__" not in vars(cls):
+            # Only models that cache get the slower __setattr__; the others
+            # keep pydantic's.
+            cls.__setattr__ = _setattr_dropping_cache
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._clear_cached_fields()
+        return copied
+
+    def _clear_cached_fields(self) -> None:
+        values = self.__dict__
+        for name in self._cached_fields:
+            values.pop(name, None)
+
+    def __iter__(self) -> Generator[tuple[str, Any], None, None]:
+        # Like BaseModel.__iter__, but cached computed values are not fields.
+        cached = self._cached_fields
+        yield from [
+            (k, v)
+            for k, v in self.__dict__.items()
+            if not k.startswith("_") and k not in cached
+        ]
+        extra = self.__pydantic_extra__
+        if extra:
+            yield from extra.items()
+
     def __repr__(self) -> str:
         cls = type(self).__name__
         parts = []
@@ -103,6 +179,22 @@ class BaseEntity(BaseModel):
     model_config = ConfigDict(extra="allow")
 
 
+def _setattr_dropping_cache(self: BaseEntity, name: str, value: Any) -> None:
+    BaseModel.__setattr__(self, name, value)
+    if name in self._cache_inputs:
+        self._clear_cached_fields()
+
+
+def computed_getter(info: ComputedFieldInfo) -> Callable[[Any], Any]:
+    """The getter function of a computed field, cached or not."""
+    wrapped = info.wrapped_property
+    if isinstance(wrapped, cached_property):
+        return wrapped.func
+    if wrapped.fget is None:
+        raise TypeError("Computed field property has no getter")
+    return wrapped.fget
+
+
 class ApiResponse[EntityType: "BaseEntity"](BaseModel):
     """Generic Pydantic model for standard OpenAIRE API list responses.
 
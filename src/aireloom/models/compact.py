@@ -0,0 +1,184 @@
+"""Compact, immutable record types for holding many results in memory.
+
+A validated Pydantic model carries an instance ``__dict__``, a
+``__pydantic_fields_set__`` set and, with ``extra="allow"``, a
+``__pydantic_extra__`` dict, and so does every nested ``Pid``, ``Author``
+or ``Instance``. :func:`to_compact` converts a model into a frozen slotted
+dataclass derived from it by :func:`compact_type`:
+
+* fields keep their names, nested models become compact records and lists
+  become tuples;
+* computed fields stay available as plain (uncached) properties (``doi``,
+  ``publication_year``, ...), as do the model's ``__str__`` and
+  ``__repr__``;
+* dict values (``Author.pid``, ``Subject.subject``) become read-only
+  :class:`CompactMapping` objects, which compare equal to the dicts;
+* extra API keys are kept in ``model_extra`` (None when there are none);
+* nested models left at their defaults (an absent ``container``, say)
+  share one record per type.
+
+Records are hashable, and convert back with ``to_model()``, which restores
+``model_fields_set`` as well. ``scripts/benchmark_memory.py`` measures the
+memory they save.
+
+Example::
+
+    records = [to_compact(p) for p in products]
+    records[0].doi, records[0].authors[0].fullName
+    product = records[0].to_model()
+"""
+
+from collections.abc import Iterator, Mapping
+from dataclasses import field, make_dataclass
+from functools import cache
+from itertools import chain, islice
+from typing import Any
+
+from pydantic import BaseModel
+
+from .base import computed_getter
+
+#: Name of the slot holding the extra (undeclared) keys of a record.
+EXTRA = "model_extra"
+#: Name of the slot holding the names of the explicitly set fields.
+FIELDS_SET = "model_fields_set"
+
+#: One instance of each distinct fields set, shared by the records.
+_fields_sets: dict[frozenset[str], frozenset[str]] = {}
+
+
+class CompactMapping(Mapping[str, Any]):
+    """Read-only, hashable mapping holding a dict value of a compact record.
+
+    Keys and values are kept in one flat tuple, about half the size of a
+    small dict. Lookups scan the tuple, which suits the few keys of the API's
+    dict values. Nested dicts and lists become mappings and tuples too.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, data: Mapping[str, Any]):
+        self._items = tuple(
+            chain.from_iterable((k, _compact_value(v)) for k, v in data.items())
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        items = self._items
+        for i in range(0, len(items), 2):
+            if items[i] == key:
+                return items[i + 1]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return islice(self._items, 0, None, 2)
+
+    def __len__(self) -> int:
+        return len(self._items) // 2
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.items()))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+def compact_type(model: type[BaseModel]) -> type:
+    """Return the compact record type for *model*, creating it once.
+
+    Raises:
+        ValueError: If *model* declares a field named ``model_extra`` or
+            ``model_fields_set``.
+    """
+    return _build(model)
+
+
+def to_compact(instance: BaseModel) -> Any:
+    """Convert a validated model into its compact record."""
+    model = type(instance)
+    if not instance.__pydantic_fields_set__ and not instance.__pydantic_extra__:
+        # Only defaults: share one record, which is safe as records are frozen.
+        return _default_record(model)
+    values = [_compact_value(getattr(instance, name)) for name in model.model_fields]
+    extra = instance.__pydantic_extra__
+    values.append(CompactMapping(extra) if extra else None)
+    fields_set = frozenset(instance.__pydantic_fields_set__)
+    values.append(_fields_sets.setdefault(fields_set, fields_set))
+    return _build(model)(*values)
+
+
+def _compact_value(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return to_compact(value)
+    if isinstance(value, list):
+        return tuple(map(_compact_value, value)) if value else ()
+    if isinstance(value, dict):
+        return CompactMapping(value)
+    return value
+
+
+def _model_value(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return [_model_value(item) for item in value]
+    if isinstance(value, CompactMapping):
+        return {k: _model_value(v) for k, v in value.items()}
+    if hasattr(type(value), "__model__"):
+        return value.to_model()
+    return value
+
+
+@cache
+def _default_record(model: type[BaseModel]) -> Any:
+    values = [_compact_value(value) for value in model().__dict__.values()]
+    return _build(model)(*values, None, frozenset())
+
+
+@cache
+def _build(model: type[BaseModel]) -> type:
+    for reserved in (EXTRA, FIELDS_SET):
+        if reserved in model.model_fields:
+            raise ValueError(f"{model.__name__} has a field named {reserved!r}")
+
+    def to_model(self: Any) -> BaseModel:
+        """Convert this record back into the Pydantic model."""
+        values = {
+            name: _model_value(getattr(self, name)) for name in model.model_fields
+        }
+        extra = getattr(self, EXTRA)
+        if extra:
+            values.update(_model_value(extra))
+        return model.model_construct(set(getattr(self, FIELDS_SET)), **values)
+
+    def reduce(self: Any) -> tuple[Any, ...]:
+        values = tuple(getattr(self, name) for name in self.__slots__)
+        return _rebuild, (model, values)
+
+    namespace: dict[str, Any] = {
+        "__module__": __name__,
+        "__doc__": f"Compact, immutable record of a {model.__name__}.",
+        "__model__": model,
+        "__reduce__": reduce,
+        "to_model": to_model,
+    }
+    for name, info in model.model_computed_fields.items():
+        namespace[name] = property(computed_getter(info), doc=info.description)
+    for method in ("__str__", "__repr__"):
+        defined = getattr(model, method)
+        if defined is not getattr(BaseModel, method):
+            namespace[method] = defined
+
+    fields = [(name, Any) for name in model.model_fields] + [
+        (EXTRA, Any),
+        (FIELDS_SET, frozenset[str], field(repr=False, compare=False)),
+    ]
+    return make_dataclass(
+        f"Compact{model.__name__}",
+        fields,
+        namespace=namespace,
+        frozen=True,
+        slots=True,
+        repr="__repr__" not in namespace,
+    )
+
+
+def _rebuild(model: type[BaseModel], values: tuple[Any, ...]) -> Any:
+    return _build(model)(*values)
@@ -7,7 +7,8 @@ for restricted string values based on the OpenAIRE data model documentation.
 Reference: https://graph.openaire.eu/docs/data-model/entities/data-source
 """
 
-from typing import Annotated, Literal
+from collections.abc import Mapping
+from typing import Annotated, ClassVar, Literal
 
 from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, computed_field
 
@@ -83,6 +84,8 @@ class DataSource(BaseEntity):
     missionStatementUrl: str | None = None
     journal: SafeContainer = Field(default_factory=Container)
 
+    _computed_inputs: ClassVar[Mapping[str, tuple[str, ...]]] = {"type_name": ("type",)}
+
     @computed_field
     @property
     def type_name(self) -> str | None:
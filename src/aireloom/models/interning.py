@@ -0,0 +1,56 @@
+"""Interning of repeated vocabulary strings during validation.
+
+Pid schemes (``doi``, ``handle``), access-right codes and labels,
+datasource names, country and language codes, instance types and
+relationship names take a handful of distinct values, yet each occurrence
+in a response is decoded into its own string object. Fields annotated with
+:data:`InternedStr` or :data:`OptionalInternedStr` pass their value through
+:func:`sys.intern` after validation, so all records kept in memory share a
+single object per distinct value; the decoded duplicates are freed with the
+response.
+
+Interning is on by default. :func:`set_string_interning` switches it off
+for the whole process, for workloads that do not keep records around.
+``Literal`` fields need no interning: Pydantic already returns the
+literal's own string.
+
+Example::
+
+    from aireloom import set_string_interning
+
+    set_string_interning(enabled=False)
+"""
+
+import sys
+from typing import Annotated, Any
+
+from pydantic import AfterValidator
+
+from .safe_types import SafeStr
+
+_enabled = True
+
+
+def set_string_interning(*, enabled: bool) -> None:
+    """Intern vocabulary fields of newly validated models, or stop doing so."""
+    global _enabled  # noqa: PLW0603 — process-wide setting
+    _enabled = enabled
+
+
+def string_interning_enabled() -> bool:
+    """Return whether vocabulary fields are currently interned."""
+    return _enabled
+
+
+def intern_value(value: Any) -> Any:
+    """Return the interned copy of a ``str`` *value* when interning is on."""
+    if _enabled and type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+InternedStr = Annotated[SafeStr, AfterValidator(intern_value)]
+"""``SafeStr`` for low-cardinality values, interned when enabled."""
+
+OptionalInternedStr = Annotated[str | None, AfterValidator(intern_value)]
+"""``str | None`` for low-cardinality values, interned when enabled."""
@@ -7,7 +7,9 @@ based on the OpenAIRE data model documentation.
 Reference: https://graph.openaire.eu/docs/data-model/entities/organization
 """
 
-from typing import Annotated
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Annotated, ClassVar
 
 from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, computed_field
 
@@ -75,8 +77,13 @@ class Organization(BaseEntity):
     country: SafeCountry = Field(default_factory=Country)
     pids: SafeList[OrganizationPid] = Field(default_factory=list)
 
+    _computed_inputs: ClassVar[Mapping[str, tuple[str, ...]]] = {
+        "ror_id": ("pids",),
+        "country_code": ("country",),
+    }
+
     @computed_field
-    @property
+    @cached_property
     def ror_id(self) -> str | None:
         for pid in self.pids:
             if pid.scheme and pid.scheme.lower() == "ror" and pid.value:
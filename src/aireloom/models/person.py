@@ -6,6 +6,10 @@ based on the OpenAIRE Graph API v1 persons endpoint.
 Reference: https://api.openaire.eu/graph/v1/persons
 """
 
+from collections.abc import Mapping
+from functools import cached_property
+from typing import ClassVar
+
 from pydantic import ConfigDict, Field, computed_field
 
 from .._helpers import extract_orcid
@@ -49,8 +53,13 @@ class Person(BaseEntity):
     consent: bool | None = None
     coAuthors: SafeList[str] = Field(default_factory=list)
 
+    _computed_inputs: ClassVar[Mapping[str, tuple[str, ...]]] = {
+        "orcid": ("originalId", "id"),
+        "full_name": ("givenName", "familyName"),
+    }
+
     @computed_field
-    @property
+    @cached_property
     def orcid(self) -> str | None:
         return extract_orcid(self.originalId, self.id)
 
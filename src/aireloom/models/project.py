@@ -7,7 +7,9 @@ based on the OpenAIRE data model documentation.
 Reference: https://graph.openaire.eu/docs/data-model/entities/project
 """
 
-from typing import Annotated, Any
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Annotated, Any, ClassVar
 
 from pydantic import (
     BaseModel,
@@ -136,6 +138,13 @@ class Project(BaseEntity):
     summary: SafeStr = ""
     websiteUrl: str | None = None
 
+    _computed_inputs: ClassVar[Mapping[str, tuple[str, ...]]] = {
+        "funder_name": ("fundings",),
+        "funder_jurisdiction": ("fundings",),
+        "start_year": ("startDate",),
+        "end_year": ("endDate",),
+    }
+
     @computed_field
     @property
     def funder_name(self) -> str | None:
@@ -152,7 +161,7 @@ class Project(BaseEntity):
         return None
 
     @computed_field
-    @property
+    @cached_property
     def start_year(self) -> int | None:
         if self.startDate and len(self.startDate) >= 4:
             try:
@@ -162,7 +171,7 @@ class Project(BaseEntity):
         return None
 
     @computed_field
-    @property
+    @cached_property
     def end_year(self) -> int | None:
         if self.endDate and len(self.endDate) >= 4:
             try:
@@ -0,0 +1,123 @@
+"""Slim models holding a subset of an entity model's fields.
+
+:func:`projected_model` derives, from an entity model and a set of field
+names, a model that declares only those fields (plus ``id``). Keys outside
+the projection are ignored during validation instead of being validated into
+nested sub-models, which saves CPU time and memory when a harvest needs only
+a few fields per record.
+
+The derived model keeps the original's field types, defaults, field
+validators and before/after model validators. Computed fields are kept when
+every field they read, as declared in the model's ``_computed_inputs``, is
+projected, so ``doi`` stays available with ``pids`` projected and
+``citation_count`` with ``indicators``. Private helper methods are copied
+along, for computed fields that call them.
+
+Example::
+
+    Slim = projected_model(
+        ResearchProduct, {"pids", "indicators"}
+    )
+    record = Slim.model_validate(raw)
+    record.doi, record.citation_count
+"""
+
+from collections.abc import Iterable
+from copy import copy
+from functools import cache, cached_property
+from inspect import isfunction
+from typing import Any
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    computed_field,
+    field_validator,
+    model_validator,
+)
+from pydantic.fields import ComputedFieldInfo
+
+from .base import BaseEntity, computed_getter
+
+
+def projected_model(model: type[BaseModel], fields: Iterable[str]) -> type[BaseModel]:
+    """Return a model with only *fields* of *model* (and ``id`` for entities).
+
+    Models are cached, so repeated calls with the same fields are cheap.
+
+    Raises:
+        ValueError: If a name in *fields* is not a field of *model*.
+    """
+    selected = frozenset(fields)
+    unknown = selected - model.model_fields.keys()
+    if unknown:
+        raise ValueError(
+            f"Unknown {model.__name__} field(s) in projection: "
+            f"{', '.join(sorted(unknown))}"
+        )
+    if issubclass(model, BaseEntity):
+        selected |= {"id"}
+    return _build(model, selected)
+
+
+@cache
+def _build(model: type[BaseModel], selected: frozenset[str]) -> type[BaseModel]:
+    base = BaseEntity if issubclass(model, BaseEntity) else BaseModel
+    annotations: dict[str, Any] = {}
+    namespace: dict[str, Any] = {
+        "__module__": model.__module__,
+        "__doc__": f"{model.__name__} projected to {', '.join(sorted(selected))}.",
+        "model_config": ConfigDict(**{**model.model_config, "extra": "ignore"}),
+    }
+    # Private helper methods, which computed fields may call.
+    for cls in reversed(model.__mro__[: model.__mro__.index(base)]):
+        namespace.update(
+            (name, value)
+            for name, value in vars(cls).items()
+            if _is_helper(name, value)
+        )
+    # Declaration order of the original, so dumps list fields the same way.
+    for name, field in model.model_fields.items():
+        if name in selected:
+            annotations[name] = field.annotation
+            namespace[name] = copy(field)
+    namespace["__annotations__"] = annotations
+
+    decorators = model.__pydantic_decorators__
+    for name, decorator in decorators.field_validators.items():
+        kept = [f for f in decorator.info.fields if f in selected]
+        if kept:
+            namespace[name] = field_validator(*kept, mode=decorator.info.mode)(
+                _unbound(decorator.func)
+            )
+    for name, decorator in decorators.model_validators.items():
+        if decorator.info.mode in ("before", "after"):
+            namespace[name] = model_validator(mode=decorator.info.mode)(
+                _unbound(decorator.func)
+            )
+    inputs = getattr(model, "_computed_inputs", {})
+    for name, info in model.model_computed_fields.items():
+        if name in inputs and selected.issuperset(inputs[name]):
+            namespace[name] = computed_field(description=info.description)(
+                _descriptor(info)
+            )
+
+    name = f"{model.__name__}Projection"
+    return type(name, (base,), namespace)
+
+
+def _unbound(func: Any) -> Any:
+    """The plain function behind a (class)method recorded by pydantic."""
+    return getattr(func, "__func__", func)
+
+
+def _is_helper(name: str, value: Any) -> bool:
+    return name.startswith("_") and not name.startswith("__") and isfunction(value)
+
+
+def _descriptor(info: ComputedFieldInfo) -> property | cached_property[Any]:
+    """A fresh descriptor for a computed field; cached fields stay cached."""
+    getter = computed_getter(info)
+    if isinstance(info.wrapped_property, cached_property):
+        return cached_property(getter)
+    return property(getter)
@@ -3,6 +3,7 @@
 from pydantic import BaseModel, ConfigDict, Field
 
 from .base import Header
+from .interning import OptionalInternedStr
 from .safe_types import SafeList, SafeStr
 
 
@@ -10,7 +11,7 @@ class Identifier(BaseModel):
     """An identifier with id, scheme, and url."""
 
     id: str | None = None
-    idScheme: str | None = None
+    idScheme: OptionalInternedStr = None
     idUrl: str | None = None
     model_config = ConfigDict(extra="allow")
 
@@ -27,8 +28,8 @@ class Node(BaseModel):
     """A node (source or target) in a relation link."""
 
     title: SafeStr = ""
-    type: str | None = None
-    instanceType: str | None = None
+    type: OptionalInternedStr = None
+    instanceType: OptionalInternedStr = None
     publicationDate: str | None = None
     identifiers: SafeList[Identifier] = Field(default_factory=list)
     authors: SafeList[EntityRef] = Field(default_factory=list)
@@ -39,9 +40,9 @@ class Node(BaseModel):
 class RelType(BaseModel):
     """Relation type information."""
 
-    name: str | None = None
-    type: str | None = None
-    typeSchema: str | None = None
+    name: OptionalInternedStr = None
+    type: OptionalInternedStr = None
+    typeSchema: OptionalInternedStr = None
     model_config = ConfigDict(extra="allow")
 
 
@@ -10,20 +10,28 @@ Reference: https://graph.openaire.eu/docs/data-model/entities/research-product
 """
 
 import logging
-from typing import Annotated, Any, Literal
+from collections.abc import Mapping
+from functools import cache, cached_property
+from typing import Annotated, Any, ClassVar, Literal, Self
 
 from pydantic import (
     BaseModel,
     BeforeValidator,
     ConfigDict,
     Field,
+    ModelWrapValidatorHandler,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    TypeAdapter,
     computed_field,
     field_validator,
+    model_serializer,
     model_validator,
 )
 
 from .._helpers import extract_all_pids_by_scheme, extract_pid_by_scheme
 from .base import ApiResponse, BaseEntity
+from .interning import InternedStr, OptionalInternedStr
 from .safe_types import SafeList, SafeStr
 
 OpenAccessRouteType = Literal["gold", "green", "hybrid", "bronze"]
@@ -49,7 +57,7 @@ class Pid(BaseModel):
         value: The actual value of the PID.
     """
 
-    scheme: SafeStr = ""
+    scheme: InternedStr = ""
     value: SafeStr = ""
 
     model_config = ConfigDict(extra="allow")
@@ -86,9 +94,9 @@ class BestAccessRight(BaseModel):
         scheme: The scheme or vocabulary defining the access right code.
     """
 
-    code: SafeStr = ""
-    label: SafeStr = ""
-    scheme: SafeStr = ""
+    code: InternedStr = ""
+    label: InternedStr = ""
+    scheme: InternedStr = ""
 
     model_config = ConfigDict(extra="allow")
 
@@ -106,8 +114,8 @@ class ResultCountry(BaseModel):
         label: The human-readable name of the country.
     """
 
-    code: SafeStr = ""
-    label: SafeStr = ""
+    code: InternedStr = ""
+    label: InternedStr = ""
 
     model_config = ConfigDict(extra="allow")
 
@@ -222,10 +230,10 @@ class AccessRight(BaseModel):
         scheme: The scheme defining the access right codes.
     """
 
-    code: SafeStr = ""
-    label: SafeStr = ""
+    code: InternedStr = ""
+    label: InternedStr = ""
     openAccessRoute: OpenAccessRouteType | None = None
-    scheme: SafeStr = ""
+    scheme: InternedStr = ""
 
     model_config = ConfigDict(extra="allow")
 
@@ -244,7 +252,7 @@ class ArticleProcessingCharge(BaseModel):
     """
 
     amount: str | None = None
-    currency: SafeStr = ""
+    currency: InternedStr = ""
 
     model_config = ConfigDict(extra="allow")
 
@@ -260,7 +268,7 @@ class ResultPid(BaseModel):
         value: The value of the PID.
     """
 
-    scheme: SafeStr = ""
+    scheme: InternedStr = ""
     value: SafeStr = ""
 
     model_config = ConfigDict(extra="allow")
@@ -278,8 +286,8 @@ class License(BaseModel):
         label: A human-readable label for the license.
     """
 
-    code: SafeStr = ""
-    label: SafeStr = ""
+    code: InternedStr = ""
+    label: InternedStr = ""
 
     model_config = ConfigDict(extra="allow")
 
@@ -287,8 +295,8 @@ class License(BaseModel):
 class CollectedFrom(BaseModel):
     """Represents the data source from which an instance was collected."""
 
-    name: SafeStr = ""
-    id: str | None = None
+    name: InternedStr = ""
+    id: OptionalInternedStr = None
 
     model_config = ConfigDict(extra="allow")
 
@@ -301,8 +309,8 @@ SafeCollectedFrom = Annotated[
 class HostedBy(BaseModel):
     """Represents the data source hosting an instance."""
 
-    name: SafeStr = ""
-    id: str | None = None
+    name: InternedStr = ""
+    id: OptionalInternedStr = None
 
     model_config = ConfigDict(extra="allow")
 
@@ -339,7 +347,7 @@ class Instance(BaseModel):
     accessRight: SafeAccessRight = Field(default_factory=AccessRight)
     alternateIdentifier: list[dict[str, str]] = Field(default_factory=list)
     articleProcessingCharge: ArticleProcessingCharge | None = None
-    license: str | None = None
+    license: OptionalInternedStr = None
     collectedFrom: SafeCollectedFrom = Field(default_factory=CollectedFrom)
     hostedBy: SafeHostedBy = Field(default_factory=HostedBy)
     distributionLocation: str | None = None
@@ -347,7 +355,7 @@ class Instance(BaseModel):
     instanceId: str | None = None
     publicationDate: str | None = None
     refereed: RefereedType | None = None
-    type: SafeStr = ""
+    type: InternedStr = ""
     urls: list[str] = Field(default_factory=list)
 
     model_config = ConfigDict(extra="allow")
@@ -361,8 +369,8 @@ class Language(BaseModel):
         label: The human-readable name of the language (e.g., "English").
     """
 
-    code: SafeStr = ""
-    label: SafeStr = ""
+    code: InternedStr = ""
+    label: InternedStr = ""
 
     model_config = ConfigDict(extra="allow")
 
@@ -611,14 +619,26 @@ class ResearchProduct(BaseEntity):
 
     # ── Computed fields ─────────────────────────────────────────────────
 
+    _computed_inputs: ClassVar[Mapping[str, tuple[str, ...]]] = {
+        "doi": ("pids",),
+        "all_dois": ("pids",),
+        "is_open_access": ("bestAccessRight",),
+        "open_access_url": ("instances",),
+        "citation_count": ("indicators",),
+        "publication_year": ("publicationDate",),
+        "journal_name": ("container",),
+        "author_names": ("authors",),
+        "license": ("instances",),
+    }
+
     @computed_field
-    @property
+    @cached_property
     def doi(self) -> str | None:
         """First DOI from the pids list."""
         return extract_pid_by_scheme(self.pids, "doi")
 
     @computed_field
-    @property
+    @cached_property
     def all_dois(self) -> list[str]:
         """All DOI values from the pids list."""
         return extract_all_pids_by_scheme(self.pids, "doi")
@@ -630,7 +650,7 @@ class ResearchProduct(BaseEntity):
         return self.bestAccessRight.label.upper() == "OPEN"
 
     @computed_field
-    @property
+    @cached_property
     def open_access_url(self) -> str | None:
         """URL of the first instance whose access right is OPEN."""
         for inst in self.instances:
@@ -650,7 +670,7 @@ class ResearchProduct(BaseEntity):
         return self.indicators.citationImpact.citationCount
 
     @computed_field
-    @property
+    @cached_property
     def publication_year(self) -> int | None:
         """Year parsed from publicationDate."""
         if self.publicationDate and len(self.publicationDate) >= 4:
@@ -667,13 +687,13 @@ class ResearchProduct(BaseEntity):
         return self.container.name or None
 
     @computed_field
-    @property
+    @cached_property
     def author_names(self) -> list[str]:
         """Non-empty full names of all authors."""
         return [a.fullName for a in self.authors if a.fullName]
 
     @computed_field
-    @property
+    @cached_property
     def license(self) -> str | None:
         """First non-empty license string found across instances."""
         for inst in self.instances:
@@ -695,3 +715,131 @@ class ResearchProduct(BaseEntity):
 # Define the specific response type for ResearchProduct results
 ResearchProductResponse = ApiResponse[ResearchProduct]
 """Type alias for an API response containing a list of `ResearchProduct` entities."""
+
+
+@cache
+def _field_adapter(name: str) -> TypeAdapter[Any]:
+    """Validator for a single `ResearchProduct` field, including its Safe* hooks."""
+    return TypeAdapter(ResearchProduct.model_fields[name].rebuild_annotation())
+
+
+@cache
+def _lazy_placeholders() -> dict[str, Any]:
+    """Cheap, already-valid values for `LazyResearchProduct._lazy_fields`."""
+    return {
+        name: _field_adapter(name).validate_python(None)
+        for name in LazyResearchProduct._lazy_fields
+    }
+
+
+class LazyResearchProduct(ResearchProduct):
+    """A `ResearchProduct` that validates nested sub-models on first access.
+
+    Scalar fields are validated up front, exactly as in `ResearchProduct`.
+    The raw values of the nested fields listed in `_lazy_fields` (authors,
+    instances, subjects, indicators, ...) are kept and only validated when the
+    attribute, or a computed field that reads it, is first accessed; the
+    result is cached on the instance. Pipelines that read a few fields per
+    record (``id``, ``doi``, ``publication_year``, ``citation_count``) thus
+    skip most of the validation work: on such a pipeline it is about 1.5-1.9x
+    faster than `ResearchProduct` (``scripts/benchmark_decoding.py``). For a
+    several-fold speed-up, project the records instead (``fields=`` on the
+    client methods, see `projected_model`), which skips the unread scalar
+    fields as well.
+
+    Serialization, comparison, iteration and pickling validate all pending
+    fields first, so they behave as for `ResearchProduct`. Unlike the eager
+    model, invalid nested data raises `ValidationError` on access rather than
+    when the record is parsed.
+    """
+
+    _lazy_fields: ClassVar[frozenset[str]] = frozenset(
+        {
+            "pids",
+            "authors",
+            "bestAccessRight",
+            "country",
+            "countries",
+            "indicators",
+            "instances",
+            "language",
+            "subjects",
+            "container",
+            "geoLocation",
+            "geoLocations",
+            "collectedFrom",
+        }
+    )
+    _pending: dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def defer_nested_fields(
+        cls, data: Any, handler: ModelWrapValidatorHandler[Self]
+    ) -> Self:
+        """Validates everything but the lazy fields and keeps their raw values.
+
+        The lazy fields are handed to the inner validator as prebuilt
+        placeholders, which pass validation without building the nested
+        default models; absent fields are deferred as None, which the Safe*
+        types turn into the same defaults on access.
+        """
+        if not isinstance(data, dict):
+            return handler(data)
+        placeholders = _lazy_placeholders()
+        deferred = {name: data.get(name) for name in cls._lazy_fields}
+        product = handler({**data, **placeholders})
+        values = product.__dict__
+        for name in deferred:
+            del values[name]
+        product.__pydantic_fields_set__.difference_update(
+            name for name in deferred if name not in data
+        )
+        product._pending = deferred
+        return product
+
+    def __getattr__(self, name: str) -> Any:
+        if not name.startswith("_"):
+            pending = self._pending
+            if name in pending:
+                value = _field_adapter(name).validate_python(pending[name])
+                self.__dict__[name] = value
+                return value
+        return super().__getattr__(name)  # ty: ignore[unresolved-attribute]
+
+    def materialize(self) -> Self:
+        """Validates all pending fields now and returns this instance."""
+        values = self.__dict__
+        missing = [name for name in self._pending if name not in values]
+        if missing:
+            for name in missing:
+                getattr(self, name)
+            # Restore declaration order so serialized output matches the eager model.
+            ordered = {name: values[name] for name in type(self).model_fields}
+            values.clear()
+            values.update(ordered)
+        return self
+
+    @model_serializer(mode="wrap")
+    def _serialize_materialized(self, handler: SerializerFunctionWrapHandler) -> Any:
+        return handler(self.materialize())
+
+    def __eq__(self, other: object) -> bool:
+        self.materialize()
+        if isinstance(other, LazyResearchProduct):
+            other.materialize()
+        return super().__eq__(other)
+
+    __hash__ = None  # unhashable, like ResearchProduct
+
+    def __iter__(self) -> Any:
+        self.materialize()
+        return super().__iter__()
+
+    def __getstate__(self) -> dict[Any, Any]:
+        self.materialize()
+        return super().__getstate__()
+
+
+LazyResearchProductResponse = ApiResponse[LazyResearchProduct]
+"""Type alias for an API response containing `LazyResearchProduct` entities."""
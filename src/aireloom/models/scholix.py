@@ -9,10 +9,11 @@ and DDI-CDI Codi Model: https://ddi-alliance.github.io/DDI-CDI/current/Model/
 """
 
 from datetime import datetime
-from typing import Literal
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
 
+from .interning import InternedStr, OptionalInternedStr, intern_value
 from .safe_types import SafeList, SafeStr
 
 ScholixEntityTypeName = Literal["publication", "dataset", "software", "other"]
@@ -60,7 +61,7 @@ class ScholixIdentifier(BaseModel):
     """
 
     id_val: SafeStr = Field(alias="ID", default="")
-    id_scheme: SafeStr = Field(alias="IDScheme", default="")
+    id_scheme: InternedStr = Field(alias="IDScheme", default="")
     id_url: str | None = Field(alias="IDURL", default=None)
 
     model_config = ConfigDict(populate_by_name=True, extra="allow")
@@ -88,7 +89,7 @@ class ScholixPublisher(BaseModel):
         identifier: An optional list of `ScholixIdentifier` objects for the publisher.
     """
 
-    name: SafeStr = Field(alias="Name", default="")
+    name: InternedStr = Field(alias="Name", default="")
     identifier: list[ScholixIdentifier] | None = Field(alias="Identifier", default=None)
 
     model_config = ConfigDict(populate_by_name=True, extra="allow")
@@ -111,7 +112,7 @@ class ScholixEntity(BaseModel):
         alias="Identifier", default_factory=list
     )
     type: ScholixEntityTypeName = Field(alias="Type")
-    sub_type: str | None = Field(alias="SubType", default=None)
+    sub_type: OptionalInternedStr = Field(alias="SubType", default=None)
     title: SafeStr = Field(alias="Title", default="")
     creator: SafeList[ScholixCreator] = Field(alias="Creator", default_factory=list)
     publication_date: str | None = Field(alias="PublicationDate", default=None)
@@ -131,9 +132,11 @@ class ScholixRelationshipType(BaseModel):
         sub_type_schema: An optional schema identifier (may be a URL or a short string like 'datacite').
     """
 
-    name: ScholixRelationshipNameValue | str = Field(alias="Name", default="")
-    sub_type: str | None = Field(alias="SubType", default=None)
-    sub_type_schema: str | None = Field(alias="SubTypeSchema", default=None)
+    name: Annotated[
+        ScholixRelationshipNameValue | str, AfterValidator(intern_value)
+    ] = Field(alias="Name", default="")
+    sub_type: OptionalInternedStr = Field(alias="SubType", default=None)
+    sub_type_schema: OptionalInternedStr = Field(alias="SubTypeSchema", default=None)
 
     model_config = ConfigDict(populate_by_name=True, extra="allow")
 
@@ -146,7 +149,7 @@ class ScholixLinkProvider(BaseModel):
         identifier: An optional list of `ScholixIdentifier` objects for the provider.
     """
 
-    name: SafeStr = Field(alias="Name", default="")
+    name: InternedStr = Field(alias="Name", default="")
     identifier: SafeList[ScholixIdentifier] = Field(
         alias="Identifier", default_factory=list
     )
@@ -10,20 +10,24 @@ Usage::
     from aireloom.queries import publications_by_doi
 
     async with AireloomSession() as session:
-        papers = await publications_by_doi(
+        papers, missing = await publications_by_doi(
             session, "10.1234/example"
         )
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+import asyncio
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
 
 from .endpoints import (
     ProjectsFilters,
     ResearchProductsFilters,
     ScholixFilters,
 )
+from .resources._batch import BatchGetError
+from .resources._identifiers import canonical_id
 
 if TYPE_CHECKING:
     from .models import (
@@ -41,25 +45,66 @@ if TYPE_CHECKING:
 # ---------------------------------------------------------------------------
 
 
+class PublicationsByDoi(NamedTuple):
+    """Result of :func:`publications_by_doi`."""
+
+    products: list[ResearchProduct]
+    missing: list[str]
+
+
 async def publications_by_doi(
     session: AireloomSession,
     *dois: str,
-) -> list[ResearchProduct]:
+    max_concurrency: int = 4,
+) -> PublicationsByDoi:
     """Fetch research products by DOI(s).
 
+    DOIs are looked up in batches of up to ten per request via
+    ``batch_stream``, with up to *max_concurrency* requests in flight. Every
+    product matching a DOI is returned, also when several records share it.
+
     Args:
         session: Active AireloomSession.
         *dois: One or more DOI strings.
+        max_concurrency: Max batch requests in flight at once.
 
     Returns:
-        List of matching ResearchProduct instances.
+        A :class:`PublicationsByDoi` tuple: the matching products in the
+        order of *dois*, each listed once, and the DOIs that matched none.
+
+    Raises:
+        BatchGetError: If some batches failed; its ``results`` maps each DOI
+            that was found to its products.
     """
-    results: list[ResearchProduct] = []
+    if not dois:
+        return PublicationsByDoi([], [])
+    # Keyed in canonical form, so that every spelling of a DOI finds them.
+    by_canon: dict[str, list[ResearchProduct]] = {}
+    pairs = session.research_products.batch_stream(
+        dois, filter_param="pid", max_concurrency=max_concurrency
+    )
+    try:
+        async for doi, product in pairs:
+            by_canon.setdefault(canonical_id(doi), []).append(product)
+    except BatchGetError as e:
+        found = {
+            d: by_canon[canonical_id(d)] for d in dois if canonical_id(d) in by_canon
+        }
+        raise BatchGetError(found, e.failures) from e
+
+    products: list[ResearchProduct] = []
+    missing: list[str] = []
+    seen: set[str] = set()
     for doi in dois:
-        filters = ResearchProductsFilters(pid=doi)
-        items = await session.research_products.collect(filters=filters)
-        results.extend(items)
-    return results
+        matches = by_canon.get(canonical_id(doi))
+        if not matches:
+            missing.append(doi)
+            continue
+        for product in matches:
+            if product.id not in seen:
+                seen.add(product.id)
+                products.append(product)
+    return PublicationsByDoi(products, missing)
 
 
 async def publications_by_organization(
@@ -379,39 +424,77 @@ async def all_links(
 ) -> list[ScholixRelationship]:
     """Fetch all Scholix links involving a DOI.
 
+    With ``direction="both"`` the source-side and target-side links are
+    fetched concurrently and merged, source side first. Links returned by
+    both sides (self-links, for instance) appear once; links are identified
+    by source PID, target PID and relationship name.
+
     Args:
         session: Active AireloomSession.
         doi: DOI to search for.
         direction: Search as ``"source"``, ``"target"``, or ``"both"``.
         sort_by: Sort expression.
-        limit: Maximum results.
+        limit: Maximum results, shared across both directions.
 
     Returns:
         List of ScholixRelationship instances.
     """
-    results: list[ScholixRelationship] = []
-
+    filters: list[ScholixFilters] = []
     if direction in ("source", "both"):
-        filters = ScholixFilters(sourcePid=doi)
-        items = await session.scholix.collect(
-            filters=filters,
-            sort_by=sort_by,
-            limit=limit,
+        filters.append(ScholixFilters(sourcePid=doi))
+    if direction in ("target", "both"):
+        filters.append(ScholixFilters(targetPid=doi))
+
+    groups = await asyncio.gather(
+        *(
+            session.scholix.collect(filters=f, sort_by=sort_by, limit=limit)
+            for f in filters
         )
-        results.extend(items)
+    )
+    return _merge_links(groups, limit=limit)
 
-    if direction in ("target", "both"):
-        filters = ScholixFilters(targetPid=doi)
-        remaining = (limit - len(results)) if limit else None
-        if remaining is None or remaining > 0:
-            items = await session.scholix.collect(
-                filters=filters,
-                sort_by=sort_by,
-                limit=remaining,
-            )
-            results.extend(items)
 
-    return results
+class CitationsAndDatasets(NamedTuple):
+    """Result of :func:`citations_and_datasets`."""
+
+    citing: list[ScholixRelationship]
+    datasets: list[ScholixRelationship]
+
+
+async def citations_and_datasets(
+    session: AireloomSession,
+    doi: str,
+    *,
+    source_type: Literal["Publication", "Dataset", "Software", "Other"] | None = None,
+    sort_by: str | None = None,
+    limit: int | None = None,
+) -> CitationsAndDatasets:
+    """Fetch :func:`citing_works` and :func:`related_datasets` concurrently.
+
+    Each list is deduplicated like :func:`all_links`, and a link present in
+    both is only kept in ``citing``.
+
+    Args:
+        session: Active AireloomSession.
+        doi: DOI of the work.
+        source_type: Filter citing work type.
+        sort_by: Sort expression.
+        limit: Maximum results per list.
+
+    Returns:
+        A :class:`CitationsAndDatasets` tuple.
+    """
+    citing, datasets = await asyncio.gather(
+        citing_works(
+            session, doi, source_type=source_type, sort_by=sort_by, limit=limit
+        ),
+        related_datasets(session, doi, sort_by=sort_by, limit=limit),
+    )
+    seen: set[tuple[Any, ...]] = set()
+    return CitationsAndDatasets(
+        _merge_links([citing], limit=limit, seen=seen),
+        _merge_links([datasets], limit=limit, seen=seen),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -461,3 +544,49 @@ def _resolve_identifier(
     name_value = getattr(identifier, obj_name_field, None)
     if name_value:
         filter_kwargs[str_map["name"]] = name_value
+
+
+def _merge_links(
+    groups: Iterable[Iterable[ScholixRelationship]],
+    *,
+    limit: int | None = None,
+    seen: set[tuple[Any, ...]] | None = None,
+) -> list[ScholixRelationship]:
+    """Concatenate link lists, dropping repeated links, up to *limit* items.
+
+    *seen* collects the keys of links already returned and may be shared
+    between calls to deduplicate across them.
+    """
+    seen = set() if seen is None else seen
+    merged: list[ScholixRelationship] = []
+    for link in (link for group in groups for link in group):
+        if limit and len(merged) >= limit:
+            break
+        key = _link_key(link)
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+        merged.append(link)
+    return merged
+
+
+def _link_key(link: ScholixRelationship) -> tuple[str, str, str] | None:
+    """Identify a link by source PID, target PID and relationship name.
+
+    Returns None when either end has no identifier, so such links are
+    never treated as duplicates.
+    """
+    source = _first_pid(link.source)
+    target = _first_pid(link.target)
+    if source is None or target is None:
+        return None
+    return source, target, str(link.relationship_type.name).lower()
+
+
+def _first_pid(entity: Any) -> str | None:
+    for identifier in getattr(entity, "identifier", None) or ():
+        value = getattr(identifier, "id_val", None)
+        if isinstance(value, str) and value:
+            return canonical_id(value)
+    return None
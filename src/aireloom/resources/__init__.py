@@ -1,6 +1,12 @@
 # aireloom/resources/__init__.py
 """Exposes the resource client classes."""
 
+from ._batch import BatchGetError, ChunkFailure
+from ._checkpoint import Checkpoint, CheckpointStore, FileCheckpointStore
+from ._counting import CountCache
+from ._loader import BatchLoader
+from ._negative_cache import NegativeCache
+from ._sync import HighWaterMark, SyncResult, SyncState
 from .data_sources_client import DataSourcesClient
 from .organizations_client import OrganizationsClient
 from .persons_client import PersonsClient
@@ -9,10 +15,21 @@ from .research_products_client import ResearchProductsClient
 from .scholix_client import ScholixClient
 
 __all__ = [
+    "BatchGetError",
+    "BatchLoader",
+    "Checkpoint",
+    "CheckpointStore",
+    "ChunkFailure",
+    "CountCache",
     "DataSourcesClient",
+    "FileCheckpointStore",
+    "HighWaterMark",
+    "NegativeCache",
     "OrganizationsClient",
     "PersonsClient",
     "ProjectsClient",
     "ResearchProductsClient",
     "ScholixClient",
+    "SyncResult",
+    "SyncState",
 ]
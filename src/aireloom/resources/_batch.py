@@ -4,7 +4,15 @@ OpenAIRE supports comma-separated filter values with OR semantics::
 
     ?pid=10.1038/a,10.1038/b,10.1038/c
 
-The maximum practical batch size is **10** identifiers per request.
+The maximum practical batch size is **10** identifiers per request. Within
+that limit, chunk sizes adapt to the API's behaviour: a failing chunk is
+bisected to isolate the identifiers that break it, the size shrinks after
+errors or slow responses and grows back after fast ones, and a chunk is also
+cut short when its encoded filter value would make the URL too long.
+
+Attaching a :class:`~aireloom.resources._negative_cache.NegativeCache` as
+``negative_cache`` makes batch lookups skip identifiers that recently
+resolved to nothing.
 
 Subclasses that declare ``_batch_fields`` (a dict mapping a friendly name
 to an OpenAIRE filter parameter) automatically get ``batch_get_by_<name>()``
@@ -27,26 +35,161 @@ Example::
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Any
-
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Iterable, Iterator
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from functools import partial
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
+
+from bibliofabric.exceptions import APIError, BibliofabricError, RateLimitError
 from pydantic import BaseModel
 
+from ._concurrency import windowed
+from ._identifiers import IdentifierIndex, canonical_id, identifier_kind
+
+if TYPE_CHECKING:
+    from ._loader import BatchLoader
+    from ._negative_cache import NegativeCache
+
 #: Maximum identifiers per comma-separated filter (OpenAIRE practical limit).
 BATCH_GET_SIZE = 10
 
+#: Maximum URL-encoded length of one comma-separated filter value. Keeps the
+#: request line well below common proxy/server limits for long originalIds.
+MAX_FILTER_VALUE_LENGTH = 2000
+
+#: A chunk slower than this (seconds, retries included) shrinks the next one.
+SLOW_CHUNK_SECONDS = 5.0
+
+#: Page size of chunk searches, the largest the Graph API serves. An
+#: identifier may match several records, so a chunk can return more results
+#: than it has identifiers.
+CHUNK_PAGE_SIZE = 100
+
+
+@dataclass(frozen=True)
+class ChunkFailure:
+    """A batch chunk whose search request failed.
+
+    Attributes:
+        index: Position of the chunk in dispatch order (0-based).
+        identifiers: The identifiers that were sent in the failed request.
+        error: The exception raised by the request.
+    """
+
+    index: int
+    identifiers: list[str]
+    error: BaseException
+
+
+class BatchGetError(BibliofabricError):
+    """Raised by ``batch_get`` when one or more chunks failed.
+
+    Every chunk is attempted before this is raised, so ``results`` holds
+    everything that could be resolved and ``failures`` lists the chunks that
+    could not, ordered by chunk index.
+
+    Attributes:
+        results: Entities resolved by the chunks that succeeded.
+        failures: One :class:`ChunkFailure` per failed chunk.
+    """
+
+    def __init__(self, results: dict[str, Any], failures: list[ChunkFailure]):
+        self.results = results
+        self.failures = failures
+        failed = sum(len(f.identifiers) for f in failures)
+        super().__init__(
+            f"{len(failures)} batch chunk(s) failed ({failed} identifiers); "
+            f"{len(results)} entities resolved. First error: {failures[0].error}"
+        )
+
+
+#: Canonical lookup form of an identifier (see :func:`canonical_id`).
+_normalize_id = canonical_id
+
+
+@dataclass
+class _ChunkOutcome:
+    """Everything one dispatched chunk produced, including bisected parts."""
+
+    index: int
+    identifiers: list[str]
+    entities: list[Any] = field(default_factory=list)
+    failures: list[ChunkFailure] = field(default_factory=list)
+    #: Identifiers of parts whose results fell short of ``numFound``.
+    truncated: list[str] = field(default_factory=list)
+
+
+class _ChunkSizer:
+    """Additive-increase / multiplicative-decrease control of chunk sizes.
+
+    One instance lives for one ``batch_get``/``batch_stream`` call. The size
+    starts at *max_size*, halves after a failed request, drops by one after a
+    slow one and grows back by one after a fast one. Independently of the
+    size, a chunk is closed early once its URL-encoded filter value would
+    exceed *max_value_length*.
+    """
 
-def _normalize_id(raw: str) -> str:
-    """Lowercase and strip common URL prefixes for consistent key matching."""
-    key = raw.strip().lower()
-    for prefix in (
-        "https://doi.org/",
-        "http://doi.org/",
-        "https://ror.org/",
-        "http://ror.org/",
+    def __init__(
+        self,
+        max_size: int = BATCH_GET_SIZE,
+        *,
+        max_value_length: int = MAX_FILTER_VALUE_LENGTH,
+        slow_seconds: float = SLOW_CHUNK_SECONDS,
     ):
-        key = key.removeprefix(prefix)
-    return key
+        self.max_size = max(1, min(max_size, BATCH_GET_SIZE))
+        self.size = self.max_size
+        self.max_value_length = max_value_length
+        self.slow_seconds = slow_seconds
+
+    def record_success(self, elapsed: float) -> None:
+        if elapsed > self.slow_seconds:
+            self.size = max(1, self.size - 1)
+        else:
+            self.size = min(self.max_size, self.size + 1)
+
+    def record_failure(self) -> None:
+        self.size = max(1, self.size // 2)
+
+    def chunks(self, identifiers: Iterable[str]) -> Iterator[list[str]]:
+        """Split *identifiers* lazily, reading the current size per chunk."""
+        chunk: list[str] = []
+        length = 0
+        for identifier in identifiers:
+            cost = len(quote(identifier, safe=""))
+            if chunk and (
+                len(chunk) >= self.size
+                or length + len(_ENCODED_COMMA) + cost > self.max_value_length
+            ):
+                yield chunk
+                chunk, length = [], 0
+            length += cost + (len(_ENCODED_COMMA) if chunk else 0)
+            chunk.append(identifier)
+        if chunk:
+            yield chunk
+
+
+_ENCODED_COMMA = quote(",", safe="")
+
+
+def _is_splittable(error: Exception) -> bool:
+    """Whether bisecting the chunk could isolate the cause of *error*.
+
+    API errors (4xx/5xx after retries) may be caused by one identifier in
+    the list; rate limiting, timeouts and network errors are not, and
+    bisecting would only multiply the load.
+    """
+    return isinstance(error, APIError) and not isinstance(error, RateLimitError)
+
+
+# Filter parameter for each identifier kind, and the order in which
+# parameters are tried for identifiers of no recognisable shape.
+_KIND_PARAMS = {"openaire_id": "id", "doi": "pid", "pid": "pid"}
+_FALLBACK_PARAMS = ("originalId", "code", "pid", "id")
 
 
 def _make_batch_getter(suffix: str, filter_param: str) -> Any:
@@ -69,10 +212,15 @@ class BatchMixin:
     - Also inherit from a ``SearchableMixin`` provider (from bibliofabric).
     - Set ``_entity_model`` to the Pydantic model class for a single entity.
     - Optionally declare ``_batch_fields`` for auto-generated methods.
+
+    Attributes:
+        negative_cache: Optional :class:`NegativeCache` consulted and updated
+            by batch lookups. None (the default) disables it.
     """
 
     _batch_fields: dict[str, str] = {}
     _entity_model: type[BaseModel] | None = None
+    negative_cache: NegativeCache | None = None
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
@@ -81,6 +229,28 @@ class BatchMixin:
             if not hasattr(cls, method_name):
                 setattr(cls, method_name, _make_batch_getter(suffix, filter_param))
 
+    def loader(self, field: str = "doi", **kwargs: Any) -> BatchLoader:
+        """Return a :class:`BatchLoader` that coalesces lookups on *field*.
+
+        Args:
+            field: A ``_batch_fields`` name (``"doi"``, ``"openaire_id"``, …)
+                or a raw filter parameter (``"pid"``, ``"id"``, …).
+            **kwargs: Passed to :class:`BatchLoader` (``window``,
+                ``max_concurrency``, …).
+
+        Raises:
+            ValueError: If *field* is not a batchable field of this client.
+        """
+        from ._loader import BatchLoader  # noqa: PLC0415 — _loader imports this module
+
+        filter_param = self._batch_fields.get(field, field)
+        if filter_param not in self._batch_fields.values():
+            raise ValueError(
+                f"{type(self).__name__} cannot batch on {field!r}; "
+                f"expected one of {sorted(self._batch_fields)}"
+            )
+        return BatchLoader(self, filter_param, **kwargs)
+
     async def batch_get(
         self,
         identifiers: list[str],
@@ -88,15 +258,28 @@ class BatchMixin:
         filter_param: str = "pid",
         key_fn: Callable[[Any], str | None] | None = None,
         batch_size: int = BATCH_GET_SIZE,
+        max_concurrency: int = 1,
+        split_on_failure: bool = True,
     ) -> dict[str, Any]:
         """Retrieve multiple entities by identifier in batched queries.
 
-        Splits *identifiers* into groups of *batch_size* (default 10, the
-        OpenAIRE practical maximum) and issues one ``search`` per group
-        using comma-separated OR filter syntax.
+        Splits *identifiers* into groups of at most *batch_size* (default 10,
+        the OpenAIRE practical maximum) and issues one ``search`` per group
+        using comma-separated OR filter syntax. Up to *max_concurrency*
+        groups are in flight at once. Group sizes adapt as described in the
+        module docstring.
 
-        Results are returned as ``{normalized_identifier: entity}``;
-        identifiers not found are omitted.
+        Results are returned as ``{identifier: entity}``, keyed by the
+        caller's own spelling of each identifier; identifiers not found are
+        omitted, and of several records matching one identifier the last is
+        kept (:meth:`batch_stream` yields them all). Inputs are matched case-insensitively and regardless of
+        resolver prefixes (``https://doi.org/``, ``doi:``, ``https://ror.org/``
+        …) against each entity's ``pids``, ``originalIds`` and ``id``.
+
+        With a :attr:`negative_cache` attached, identifiers cached as missing
+        are not sent, and identifiers absent from a successful response are
+        added to the cache when the call ends (a file-backed cache is then
+        saved once).
 
         Args:
             identifiers: Values to look up (DOIs, OpenAIRE IDs, etc.).
@@ -105,29 +288,338 @@ class BatchMixin:
             key_fn: Optional function to extract the lookup key from a
                 parsed entity. Defaults to a scheme-aware resolver.
             batch_size: Max identifiers per API call (1–10).
+            max_concurrency: Max chunk requests in flight at once. The
+                default of 1 sends chunks one after another.
+            split_on_failure: Bisect a chunk rejected with an API error until
+                the offending identifiers are isolated, so one bad value
+                does not lose the rest of its chunk.
 
         Returns:
             Dict mapping each *identifier* to its parsed entity (Pydantic model).
+
+        Raises:
+            BatchGetError: If any chunk failed. All other chunks are still
+                attempted; the exception carries their merged ``results``
+                and a per-chunk ``failures`` report.
         """
         if not identifiers:
             return {}
-        batch_size = max(1, min(batch_size, BATCH_GET_SIZE))
+        index = IdentifierIndex(identifiers)
         results: dict[str, Any] = {}
-        for i in range(0, len(identifiers), batch_size):
-            batch = identifiers[i : i + batch_size]
-            comma_value = ",".join(batch)
-            response = await self.search(  # ty: ignore[unresolved-attribute]
-                page=1,
-                page_size=batch_size,
-                filters={filter_param: comma_value},
+        failures: list[ChunkFailure] = []
+        outcomes = self._dispatch_chunks(
+            identifiers,
+            filter_param=filter_param,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            split_on_failure=split_on_failure,
+            ordered=True,
+        )
+        missing: list[str] = []
+        try:
+            async with aclosing(outcomes):
+                async for outcome in outcomes:
+                    failures.extend(outcome.failures)
+                    found: list[str] = []
+                    for entity in outcome.entities:
+                        key = _resolve_key(entity, filter_param, key_fn, index)
+                        if key is not None:
+                            results[key] = entity
+                            found.append(key)
+                    missing.extend(self._chunk_misses(outcome, found))
+        finally:
+            self._record_missing(filter_param, missing)
+        if failures:
+            raise BatchGetError(results, failures) from failures[0].error
+        return results
+
+    async def resolve_many(
+        self,
+        identifiers: Iterable[str],
+        *,
+        batch_size: int = BATCH_GET_SIZE,
+        max_concurrency: int = 1,
+        split_on_failure: bool = True,
+    ) -> dict[str, Any]:
+        """Resolve a mixed list of identifiers in one call.
+
+        Each identifier is classified by shape (see
+        :meth:`_classify_identifier`) and routed to one of this client's
+        ``_batch_fields`` filters: OpenAIRE ids to ``id``, DOIs and other
+        PIDs to ``pid``, and anything else to ``originalId`` or ``code``. The
+        per-filter :meth:`batch_get` calls run concurrently.
+
+        Args:
+            identifiers: Values to look up, in any mix of supported kinds.
+            batch_size: Max identifiers per API call (1–10).
+            max_concurrency: Max chunk requests in flight per filter group.
+            split_on_failure: Bisect chunks rejected with an API error, as in
+                :meth:`batch_get`.
+
+        Returns:
+            Dict mapping each identifier, in the caller's spelling and input
+            order, to its parsed entity; identifiers not found are omitted.
+
+        Raises:
+            BatchGetError: If any chunk of any group failed. ``results``
+                holds everything resolved across all groups.
+        """
+        groups: dict[str, list[str]] = {}
+        ordered: list[str] = []
+        for identifier in identifiers:
+            ordered.append(identifier)
+            groups.setdefault(self._classify_identifier(identifier), []).append(
+                identifier
             )
-            entities = _extract_results(response)
-            for entity in entities:
-                key = _resolve_key(entity, filter_param, key_fn, identifiers)
-                if key is not None:
-                    results[key] = entity
+        outcomes = await asyncio.gather(
+            *(
+                self.batch_get(
+                    group,
+                    filter_param=filter_param,
+                    batch_size=batch_size,
+                    max_concurrency=max_concurrency,
+                    split_on_failure=split_on_failure,
+                )
+                for filter_param, group in groups.items()
+            ),
+            return_exceptions=True,
+        )
+        merged: dict[str, Any] = {}
+        failures: list[ChunkFailure] = []
+        for outcome in outcomes:
+            if isinstance(outcome, BatchGetError):
+                merged.update(outcome.results)
+                failures.extend(outcome.failures)
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                merged.update(outcome)
+        results = {i: merged[i] for i in ordered if i in merged}
+        if failures:
+            raise BatchGetError(results, failures) from failures[0].error
         return results
 
+    def _classify_identifier(self, identifier: str) -> str:
+        """Return the filter parameter *identifier* should be looked up by.
+
+        Uses :func:`~aireloom.resources._identifiers.identifier_kind` and
+        only returns parameters present in ``_batch_fields``. Identifiers of
+        no recognisable kind go to the first available of ``originalId``,
+        ``code``, ``pid`` and ``id``. Override to customise routing.
+
+        Raises:
+            ValueError: If the client declares no ``_batch_fields``.
+        """
+        params = set(self._batch_fields.values())
+        preferred = _KIND_PARAMS.get(identifier_kind(identifier))
+        if preferred in params:
+            return preferred
+        for param in _FALLBACK_PARAMS:
+            if param in params:
+                return param
+        raise ValueError(f"{type(self).__name__} declares no batchable fields")
+
+    async def batch_stream(
+        self,
+        identifiers: Iterable[str],
+        *,
+        filter_param: str = "pid",
+        key_fn: Callable[[Any], str | None] | None = None,
+        batch_size: int = BATCH_GET_SIZE,
+        max_concurrency: int = 1,
+        split_on_failure: bool = True,
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Stream ``(identifier, entity)`` pairs as each chunk completes.
+
+        Streaming counterpart of :meth:`batch_get` for very large inputs:
+        *identifiers* may be any iterable (including a generator) and is
+        chunked lazily, and nothing is accumulated between chunks. At most
+        *max_concurrency* chunk requests are in flight, and new chunks are
+        only dispatched as the consumer pulls results, so a slow consumer
+        holds back the dispatch of new requests.
+
+        Pairs are yielded in chunk completion order. Keys are resolved the
+        same way as in :meth:`batch_get`; identifiers not found are skipped.
+
+        Args:
+            identifiers: Values to look up (DOIs, OpenAIRE IDs, etc.).
+            filter_param: Filter parameter name (``"pid"``, ``"id"``,
+                ``"originalId"``, ``"code"``).
+            key_fn: Optional function to extract the lookup key from a
+                parsed entity. Defaults to a scheme-aware resolver.
+            batch_size: Max identifiers per API call (1–10).
+            max_concurrency: Max chunk requests in flight at once.
+            split_on_failure: Bisect chunks rejected with an API error, as in
+                :meth:`batch_get`.
+
+        Yields:
+            ``(identifier, entity)`` tuples.
+
+        Raises:
+            BatchGetError: After every chunk has been attempted and its pairs
+                yielded, if any chunk (partly) failed. ``results`` is empty
+                (the pairs were already yielded) and ``failures`` lists every
+                failed part, ordered by chunk index.
+        """
+        outcomes = self._dispatch_chunks(
+            identifiers,
+            filter_param=filter_param,
+            batch_size=batch_size,
+            max_concurrency=max_concurrency,
+            split_on_failure=split_on_failure,
+            ordered=False,
+        )
+        missing: list[str] = []
+        failures: list[ChunkFailure] = []
+        try:
+            # Closing the dispatcher cancels chunk requests still in flight
+            # when the consumer stops early.
+            async with aclosing(outcomes):
+                async for outcome in outcomes:
+                    chunk_keys = IdentifierIndex(outcome.identifiers)
+                    pairs: list[tuple[str, Any]] = []
+                    for entity in outcome.entities:
+                        key = _resolve_key(entity, filter_param, key_fn, chunk_keys)
+                        if key is not None:
+                            pairs.append((key, entity))
+                    # Before yielding, so that a consumer stopping mid-chunk
+                    # still records the chunk's misses.
+                    missing.extend(self._chunk_misses(outcome, [k for k, _ in pairs]))
+                    failures.extend(outcome.failures)
+                    for pair in pairs:
+                        yield pair
+        finally:
+            self._record_missing(filter_param, missing)
+        if failures:
+            failures.sort(key=lambda f: f.index)
+            raise BatchGetError({}, failures) from failures[0].error
+
+    def _dispatch_chunks(
+        self,
+        identifiers: Iterable[str],
+        *,
+        filter_param: str,
+        batch_size: int,
+        max_concurrency: int,
+        split_on_failure: bool,
+        ordered: bool,
+    ) -> AsyncGenerator[_ChunkOutcome]:
+        """Run chunk searches through :func:`windowed` and yield their outcomes."""
+        sizer = _ChunkSizer(batch_size)
+        cache = self.negative_cache
+        if cache is not None:
+            identifiers = (
+                i for i in identifiers if not cache.contains(filter_param, i)
+            )
+        return windowed(
+            (
+                partial(
+                    self._run_chunk,
+                    index,
+                    chunk,
+                    filter_param,
+                    sizer,
+                    split_on_failure=split_on_failure,
+                )
+                for index, chunk in enumerate(sizer.chunks(identifiers))
+            ),
+            window=max_concurrency,
+            ordered=ordered,
+        )
+
+    def _chunk_misses(self, outcome: _ChunkOutcome, found: list[str]) -> list[str]:
+        """Return the identifiers of *outcome* that its search did not return.
+
+        An identifier counts as answered if it is one of the keys *found* in
+        this chunk or if any returned entity carries it, so a custom
+        ``key_fn`` cannot make found identifiers look missing. Only the
+        chunk's own identifiers are indexed, keeping the check proportional
+        to the chunk. Identifiers of failed parts, and of parts that returned
+        fewer results than their ``numFound``, are never misses. Empty
+        without a :attr:`negative_cache`.
+        """
+        if self.negative_cache is None:
+            return []
+        sent = IdentifierIndex(outcome.identifiers)
+        answered = IdentifierIndex(found)
+        answered_keys = {sent.match(entity) for entity in outcome.entities}
+        unknown = IdentifierIndex(
+            [i for f in outcome.failures for i in f.identifiers] + outcome.truncated
+        )
+        return [
+            i
+            for i in outcome.identifiers
+            if i not in answered_keys and i not in answered and i not in unknown
+        ]
+
+    def _record_missing(self, filter_param: str, missing: list[str]) -> None:
+        """Add the misses of a whole call to the cache, saving it at most once."""
+        if self.negative_cache is not None and missing:
+            self.negative_cache.add(filter_param, missing)
+
+    async def _search_chunk(
+        self, chunk: list[str], filter_param: str
+    ) -> tuple[list[Any], bool]:
+        """Run one comma-separated OR search and return all of its entities.
+
+        Pages are requested until the response's ``numFound`` is covered
+        (or, without a header, until a short page). The flag is False when
+        the pages ran out before ``numFound`` was reached.
+        """
+        filters = {filter_param: ",".join(chunk)}
+        entities: list[Any] = []
+        page = 1
+        while True:
+            response = await self.search(  # ty: ignore[unresolved-attribute]
+                page=page, page_size=CHUNK_PAGE_SIZE, filters=filters
+            )
+            results = _extract_results(response)
+            entities.extend(results)
+            total = _num_found(response)
+            if total is None:
+                if len(results) < CHUNK_PAGE_SIZE:
+                    return entities, True
+            elif len(entities) >= total:
+                return entities, True
+            if not results:
+                return entities, False
+            page += 1
+
+    async def _run_chunk(
+        self,
+        index: int,
+        chunk: list[str],
+        filter_param: str,
+        sizer: _ChunkSizer,
+        *,
+        split_on_failure: bool,
+    ) -> _ChunkOutcome:
+        """Search one chunk, bisecting it on splittable errors.
+
+        Never raises for request errors: they are captured as
+        :class:`ChunkFailure` entries on the outcome.
+        """
+        outcome = _ChunkOutcome(index, chunk)
+        parts = deque([chunk])
+        while parts:
+            part = parts.popleft()
+            started = time.monotonic()
+            try:
+                entities, complete = await self._search_chunk(part, filter_param)
+            except Exception as e:  # noqa: BLE001 — reported via BatchGetError
+                sizer.record_failure()
+                if split_on_failure and len(part) > 1 and _is_splittable(e):
+                    middle = len(part) // 2
+                    parts.extendleft((part[middle:], part[:middle]))
+                    continue
+                outcome.failures.append(ChunkFailure(index, part, e))
+                continue
+            sizer.record_success(time.monotonic() - started)
+            outcome.entities.extend(entities)
+            if not complete:
+                outcome.truncated.extend(part)
+        return outcome
+
 
 def _extract_results(response: Any) -> list[Any]:
     """Pull the results list from a search response (model or raw dict)."""
@@ -138,97 +630,52 @@ def _extract_results(response: Any) -> list[Any]:
     return []
 
 
+def _num_found(response: Any) -> int | None:
+    """The ``numFound`` of a search response's header, if it has one."""
+    if isinstance(response, dict):
+        header = response.get("header")
+        total = header.get("numFound") if isinstance(header, dict) else None
+    else:
+        total = getattr(getattr(response, "header", None), "numFound", None)
+    return total if isinstance(total, int) else None
+
+
 def _resolve_key(
     entity: Any,
     filter_param: str,
     key_fn: Callable[[Any], str | None] | None,
-    input_identifiers: list[str],
+    index: IdentifierIndex,
 ) -> str | None:
-    """Derive the lookup key from a parsed entity."""
+    """Derive the lookup key from a parsed entity.
+
+    Returns the caller's original spelling of the matching input identifier.
+    For non-``pid`` filters, an entity that matches no input (e.g. a custom
+    ``filter_param``) falls back to its own normalized filter value.
+    """
     if key_fn is not None:
         return key_fn(entity)
 
-    if filter_param == "id":
-        # OpenAIRE id → entity.id directly
-        raw = getattr(entity, "id", None)
-        if raw is None and isinstance(entity, dict):
-            raw = entity.get("id")
-        return _normalize_id(str(raw)) if raw else None
-
-    if filter_param == "pid":
-        # pid filter is matched against entity.pids[].value
-        # We need to find which input identifier matches this entity
-        return _match_pid_entity(entity, input_identifiers)
+    original = index.match(entity)
+    if original is not None or filter_param == "pid":
+        return original
 
     if filter_param == "code":
-        raw = getattr(entity, "code", None)
-        if raw is None and isinstance(entity, dict):
-            raw = entity.get("code")
+        raw = _entity_value(entity, "code")
         return str(raw).strip() if raw else None
 
     if filter_param == "originalId":
-        # Match against originalId/originalIds
-        raw_ids = getattr(entity, "originalId", None) or getattr(
-            entity, "originalIds", None
+        raw = _entity_value(entity, "originalId") or _entity_value(
+            entity, "originalIds"
         )
-        if raw_ids is None and isinstance(entity, dict):
-            raw_ids = entity.get("originalId") or entity.get("originalIds")
-        if isinstance(raw_ids, list) and raw_ids:
-            return _normalize_id(str(raw_ids[0]))
-        return None
-
-    # Generic: try entity.<filter_param>
-    raw = getattr(entity, filter_param, None)
-    if raw is None and isinstance(entity, dict):
-        raw = entity.get(filter_param)
-    if raw is None:
-        return None
+    else:
+        raw = _entity_value(entity, filter_param)
     if isinstance(raw, list):
         raw = raw[0] if raw else None
-        if raw is None:
-            return None
-    return _normalize_id(str(raw))
-
+    return _normalize_id(str(raw)) if raw else None
 
-def _match_pid_entity(entity: Any, input_identifiers: list[str]) -> str | None:
-    """Find which input identifier matches an entity's pids or id field.
 
-    OpenAIRE's pid filter matches against the entity's pid/pids values.
-    We normalize all input identifiers and check if any match.
-    """
-    # Build set of normalized inputs for O(1) lookup
-    normalized_inputs = {_normalize_id(id_) for id_ in input_identifiers}
-
-    # Check pids field (list of Pid objects with scheme/value)
-    pids = getattr(entity, "pids", None)
-    if pids:
-        for pid in pids:
-            value = getattr(pid, "value", None)
-            if value:
-                nv = _normalize_id(str(value))
-                if nv in normalized_inputs:
-                    return nv
-
-    # Check pid field (single or list)
-    pid = getattr(entity, "pid", None)
-    if pid:
-        if isinstance(pid, list):
-            for p in pid:
-                v = getattr(p, "value", None) or (p if isinstance(p, str) else None)
-                if v:
-                    nv = _normalize_id(str(v))
-                    if nv in normalized_inputs:
-                        return nv
-        else:
-            nv = _normalize_id(str(pid))
-            if nv in normalized_inputs:
-                return nv
-
-    # Fallback: check entity.id (OpenAIRE IDs like doi_dedup___::hash)
-    eid = getattr(entity, "id", None)
-    if eid:
-        neid = _normalize_id(str(eid))
-        if neid in normalized_inputs:
-            return neid
-
-    return None
+def _entity_value(entity: Any, name: str) -> Any:
+    raw = getattr(entity, name, None)
+    if raw is None and isinstance(entity, dict):
+        raw = entity.get(name)
+    return raw
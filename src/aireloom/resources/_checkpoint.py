@@ -0,0 +1,136 @@
+"""Checkpoints that let long iterations resume after an interruption.
+
+``iterate()`` on the Graph clients and ``iterate_links()`` on the Scholix and
+research-product links endpoints accept ``checkpoint=``: a path or any
+:class:`CheckpointStore`. After each page has been fully consumed, the
+position of the next page (a Graph ``nextCursor`` or a page number), the
+number of items delivered so far and a fingerprint of the query are saved.
+Starting the same query again resumes from that position; a checkpoint whose
+fingerprint does not match the query is ignored and overwritten. The
+checkpoint is cleared once the iteration completes.
+
+Delivery is at-least-once: if the consumer stops part-way through a page,
+that page is delivered again on resume.
+
+Example::
+
+    async for product in client.research_products.iterate(
+        filters=filters, checkpoint="harvest.ckpt.json"
+    ):
+        store(product)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Protocol, runtime_checkable
+
+from bibliofabric.log_config import logger
+
+from ._storage import read_json, write_json_atomic
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """Saved position of an interrupted iteration.
+
+    Attributes:
+        fingerprint: Hash of the endpoint and query the position belongs to.
+        position: Where to continue: a cursor string or a page number.
+        items: Number of items delivered before *position*.
+    """
+
+    fingerprint: str
+    position: str | int
+    items: int = 0
+
+
+@runtime_checkable
+class CheckpointStore(Protocol):
+    """Persistence for a single :class:`Checkpoint`."""
+
+    def load(self) -> Checkpoint | None: ...
+
+    def save(self, checkpoint: Checkpoint) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class FileCheckpointStore:
+    """Stores a checkpoint as a JSON file, written atomically.
+
+    Args:
+        path: File to read and write. Parent directories are created.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        self.path = Path(path).expanduser()
+
+    def load(self) -> Checkpoint | None:
+        data = read_json(self.path, what="checkpoint")
+        if data is None:
+            return None
+        try:
+            return Checkpoint(**data)
+        except TypeError:
+            logger.warning(f"Ignoring checkpoint {self.path}: unknown format")
+            return None
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        write_json_atomic(self.path, asdict(checkpoint))
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+
+
+def as_checkpoint_store(
+    checkpoint: str | os.PathLike[str] | CheckpointStore | None,
+) -> CheckpointStore | None:
+    """Accept a path or a store for ``checkpoint=`` arguments."""
+    if checkpoint is None or isinstance(checkpoint, CheckpointStore):
+        return checkpoint
+    return FileCheckpointStore(checkpoint)
+
+
+def query_fingerprint(endpoint: str, params: dict[str, Any]) -> str:
+    """Return a stable hash of *endpoint* and the query *params*.
+
+    Pagination parameters must be left out of *params* by the caller.
+    """
+    canonical = json.dumps([endpoint, params], sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class CheckpointTracker:
+    """Binds a store to one query and records progress page by page."""
+
+    def __init__(self, store: CheckpointStore, fingerprint: str):
+        self._store = store
+        self._fingerprint = fingerprint
+        self.items = 0
+
+    def resume(self) -> str | int | None:
+        """Return the saved position for this query, if any."""
+        saved = self._store.load()
+        if saved is None:
+            return None
+        if saved.fingerprint != self._fingerprint:
+            logger.warning("Checkpoint belongs to a different query; starting over")
+            return None
+        logger.info(f"Resuming at {saved.position!r} after {saved.items} item(s)")
+        self.items = saved.items
+        return saved.position
+
+    def page_done(self, count: int, next_position: str | int | None) -> None:
+        """Record a consumed page and the position of the one after it."""
+        self.items += count
+        if next_position is not None:
+            self._store.save(Checkpoint(self._fingerprint, next_position, self.items))
+
+    def finish(self) -> None:
+        """Clear the checkpoint once the iteration has run to completion."""
+        self._store.clear()
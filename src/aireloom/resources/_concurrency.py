@@ -0,0 +1,215 @@
+"""Bounded-concurrency helpers shared by the resource clients.
+
+The OpenAIRE endpoints are latency-bound: most time is spent waiting for the
+server, not parsing. These helpers run a stream of request coroutines with a
+fixed number in flight, while still letting the caller consume results one at
+a time. Work is only scheduled as results are consumed, so a slow consumer
+naturally throttles dispatch (backpressure).
+
+:func:`windowed` runs independent requests side by side; :func:`prefetch`
+runs a sequential source (cursor pagination) ahead of its consumer;
+:func:`interleave` drains several sequential sources side by side.
+
+Rate limiting, retries and caching remain the responsibility of
+``AireloomClient.request``; these helpers only control how many requests are
+outstanding at once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from contextlib import aclosing
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class _Failure:
+    """An exception raised by a background source, for its consumer to raise.
+
+    Background sources hand their consumer a 1-tuple per item (the item
+    itself may be None), a ``_Failure``, or None once they are exhausted.
+    """
+
+    error: Exception
+
+
+async def windowed[T](
+    factories: Iterable[Callable[[], Awaitable[T]]],
+    *,
+    window: int,
+    ordered: bool = True,
+) -> AsyncGenerator[T]:
+    """Run awaitables with at most *window* in flight and yield their results.
+
+    *factories* is consumed lazily: a new factory is only called when a slot
+    frees up, so generators whose next item depends on earlier results (for
+    example adaptive chunk sizes) see up-to-date state.
+
+    Args:
+        factories: Zero-argument callables returning awaitables.
+        window: Maximum number of awaitables running concurrently (min 1).
+        ordered: Yield results in submission order when True, otherwise in
+            completion order.
+
+    Yields:
+        The result of each awaitable.
+
+    Raises:
+        Exception: The first exception raised by an awaitable (in yield
+            order). Outstanding work is cancelled before it propagates.
+    """
+    window = max(1, window)
+    source = iter(factories)
+    pending: deque[asyncio.Future[T]] = deque()
+    running: set[asyncio.Future[T]] = set()
+
+    def _fill() -> None:
+        while len(running) < window:
+            factory = next(source, None)
+            if factory is None:
+                return
+            task = asyncio.ensure_future(factory())
+            pending.append(task)
+            running.add(task)
+
+    try:
+        _fill()
+        while running:
+            if ordered:
+                task = pending.popleft()
+                await asyncio.wait({task})
+            else:
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                task = done.pop()
+                pending.remove(task)
+            running.discard(task)
+            result = task.result()
+            # Refill before handing the result over so the next requests are
+            # already on the wire while the consumer works.
+            _fill()
+            yield result
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+
+
+async def prefetch[T](source: AsyncGenerator[T], *, depth: int) -> AsyncGenerator[T]:
+    """Drive *source* in a background task, up to *depth* items ahead.
+
+    For sequential sources (such as cursor pagination, where each request
+    needs the previous response) this overlaps fetching the next items with
+    the consumer's processing of the current one. At most *depth* items are
+    fetched or being fetched beyond the one the consumer holds.
+
+    Args:
+        source: The async generator to drive. It is closed when the consumer
+            stops early.
+        depth: Maximum items buffered ahead. Values below 1 disable
+            buffering and iterate *source* directly.
+
+    Yields:
+        The items of *source*, in order.
+
+    Raises:
+        Exception: Whatever *source* raised, once the items produced before
+            the error have been consumed.
+    """
+    if depth < 1:
+        async with aclosing(source):
+            async for item in source:
+                yield item
+        return
+
+    slots = asyncio.Semaphore(depth)
+    queue: asyncio.Queue[tuple[T] | _Failure | None] = asyncio.Queue()
+
+    async def _produce() -> None:
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    item = await anext(source)
+                except StopAsyncIteration:
+                    break
+                queue.put_nowait((item,))
+        except Exception as e:  # noqa: BLE001 — re-raised by the consumer
+            queue.put_nowait(_Failure(e))
+            return
+        queue.put_nowait(None)
+
+    producer = asyncio.ensure_future(_produce())
+    try:
+        while True:
+            entry = await queue.get()
+            if entry is None:
+                return
+            if isinstance(entry, _Failure):
+                raise entry.error
+            slots.release()
+            yield entry[0]
+    finally:
+        producer.cancel()
+        await asyncio.gather(producer, return_exceptions=True)
+        await source.aclose()
+
+
+async def interleave[T](
+    sources: Iterable[Callable[[], AsyncGenerator[T]]],
+    *,
+    window: int,
+) -> AsyncGenerator[T]:
+    """Drain several async generators concurrently and merge their items.
+
+    At most *window* sources are active at once; a new source is opened as
+    soon as an active one is exhausted. Items are yielded in arrival order.
+    Each active source runs at most one item ahead of the consumer, so memory
+    stays bounded by *window* items.
+
+    Args:
+        sources: Zero-argument callables returning async generators, opened
+            lazily.
+        window: Maximum number of sources drained concurrently (min 1).
+
+    Yields:
+        Items from all sources, interleaved.
+
+    Raises:
+        Exception: The first exception raised by a source. Other sources are
+            cancelled before it propagates.
+    """
+    window = max(1, window)
+    pending = iter(sources)
+    queue: asyncio.Queue[tuple[T] | _Failure | None] = asyncio.Queue(maxsize=window)
+
+    async def _worker() -> None:
+        try:
+            for factory in pending:
+                async with aclosing(factory()) as source:
+                    async for item in source:
+                        await queue.put((item,))
+        except Exception as e:  # noqa: BLE001 — re-raised by the consumer
+            await queue.put(_Failure(e))
+            return
+        await queue.put(None)
+
+    workers = [asyncio.ensure_future(_worker()) for _ in range(window)]
+    try:
+        active = len(workers)
+        while active:
+            entry = await queue.get()
+            if entry is None:
+                active -= 1
+            elif isinstance(entry, _Failure):
+                raise entry.error
+            else:
+                yield entry[0]
+    finally:
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,145 @@
+"""Identifier canonicalization and lookup for batch key resolution.
+
+Batch lookups send the caller's identifiers to OpenAIRE as comma-separated
+filters and then have to work out which returned entity answers which input.
+:class:`IdentifierIndex` is built once per batch from the caller's inputs; it
+maps each canonical form (lowercase, without resolver URL or ``doi:``-style
+prefixes) to the spelling the caller used, and matches an entity by scanning
+its ``pids``, ``originalIds`` and ``id`` in a single pass.
+
+:func:`identifier_kind` classifies a raw identifier by its shape so that a
+mixed list can be routed to the right filter parameter.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+# Resolver URLs and URI-style prefixes that do not change an identifier's
+# identity: DOI, ROR, ORCID and Handle.
+_PREFIX_RE = re.compile(
+    r"^(?:https?://(?:www\.)?(?:dx\.)?"
+    r"(?:doi\.org|ror\.org|orcid\.org|hdl\.handle\.net)/"
+    r"|doi:|hdl:|orcid:)"
+)
+
+
+# OpenAIRE graph ids: a 12-character namespace prefix and an MD5 hash, with
+# the legacy ``50|`` entity-type prefix tolerated.
+_OPENAIRE_ID_RE = re.compile(r"^(?:\d{2}\|)?[A-Za-z0-9_]{12}::[0-9a-f]{32}$")
+_DOI_RE = re.compile(r"^10\.\d{4,9}/\S+$")
+_ORCID_RE = re.compile(r"^\d{4}-\d{4}-\d{4}-\d{3}[\dx]$")
+_ROR_RE = re.compile(r"^0[a-z0-9]{6}\d{2}$")
+
+
+def canonical_id(raw: str) -> str:
+    """Return the canonical lookup form of an identifier.
+
+    Lowercases, strips surrounding whitespace and removes one resolver prefix
+    (``https://doi.org/``, ``http://dx.doi.org/``, ``https://ror.org/``,
+    ``https://orcid.org/``, ``https://hdl.handle.net/``, ``doi:``, ``hdl:``,
+    ``orcid:``).
+    """
+    return _PREFIX_RE.sub("", raw.strip().lower(), count=1)
+
+
+def identifier_kind(raw: str) -> str:
+    """Classify *raw* as ``"openaire_id"``, ``"doi"``, ``"pid"`` or ``"other"``.
+
+    ``"pid"`` covers non-DOI persistent identifiers recognised by their
+    resolver prefix or shape (ORCID, ROR, Handle). Anything else, such as
+    repository OAI identifiers or project codes, is ``"other"``.
+    """
+    stripped = raw.strip()
+    if _OPENAIRE_ID_RE.match(stripped):
+        return "openaire_id"
+    canonical = canonical_id(stripped)
+    if _DOI_RE.match(canonical):
+        return "doi"
+    if (
+        canonical != stripped.lower()
+        or _ORCID_RE.match(canonical)
+        or _ROR_RE.match(canonical)
+    ):
+        return "pid"
+    return "other"
+
+
+def _field(entity: Any, name: str) -> Any:
+    value = getattr(entity, name, None)
+    if value is None and isinstance(entity, dict):
+        value = entity.get(name)
+    return value
+
+
+def entity_identifiers(entity: Any) -> Iterator[str]:
+    """Yield every identifier value an entity carries, most specific first.
+
+    Covers ``pids``/``pid`` (``Pid``-like objects, dicts or strings),
+    ``originalIds``/``originalId``, ``code`` and ``id``. Works on parsed
+    models and on raw dicts.
+    """
+    for name in ("pids", "pid"):
+        pids = _field(entity, name)
+        if not pids:
+            continue
+        for pid in pids if isinstance(pids, list) else [pids]:
+            value = pid if isinstance(pid, str) else _field(pid, "value")
+            if value:
+                yield str(value)
+    for name in ("originalIds", "originalId"):
+        original_ids = _field(entity, name)
+        if not original_ids:
+            continue
+        if isinstance(original_ids, str):
+            yield original_ids
+        else:
+            yield from (str(v) for v in original_ids if v)
+    for name in ("code", "id"):
+        value = _field(entity, name)
+        if value:
+            yield str(value)
+
+
+class IdentifierIndex:
+    """Maps canonical identifiers back to the caller's original spelling.
+
+    Build one per batch from the input identifiers, then call :meth:`match`
+    for each returned entity. If several inputs share a canonical form, the
+    first spelling wins.
+
+    Example::
+
+        index = IdentifierIndex(["https://doi.org/10.1/ABC"])
+        index.lookup("10.1/abc")  # -> "https://doi.org/10.1/ABC"
+    """
+
+    __slots__ = ("_originals",)
+
+    def __init__(self, identifiers: Iterable[str] = ()):
+        self._originals: dict[str, str] = {}
+        for identifier in identifiers:
+            self._originals.setdefault(canonical_id(identifier), identifier)
+
+    def __len__(self) -> int:
+        return len(self._originals)
+
+    def __contains__(self, identifier: object) -> bool:
+        return (
+            isinstance(identifier, str) and canonical_id(identifier) in self._originals
+        )
+
+    def lookup(self, value: str) -> str | None:
+        """Return the caller's spelling of *value*, or None if not indexed."""
+        return self._originals.get(canonical_id(value))
+
+    def match(self, entity: Any) -> str | None:
+        """Return the input identifier that *entity* answers, if any."""
+        originals = self._originals
+        for value in entity_identifiers(entity):
+            original = originals.get(canonical_id(value))
+            if original is not None:
+                return original
+        return None
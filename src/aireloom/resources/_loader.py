@@ -0,0 +1,160 @@
+"""BatchLoader — coalesce single-identifier lookups into batched queries.
+
+Code that resolves one identifier at a time from many concurrent coroutines
+(``await client.research_products.get(...)`` per request handler, say) sends
+one HTTP request per lookup. A :class:`BatchLoader` collects the individual
+``load()`` calls made within a short window and resolves them together via
+:meth:`BatchMixin.batch_get`, i.e. as comma-separated OR filters of up to
+``BATCH_GET_SIZE`` identifiers each.
+
+Example::
+
+    loader = client.research_products.loader("doi")
+
+    # Called from many coroutines at once — one request per 10 DOIs.
+    product = await loader.load("10.1038/nature12373")
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from bibliofabric.log_config import logger
+
+from ._batch import BATCH_GET_SIZE, BatchGetError
+from ._identifiers import canonical_id
+
+if TYPE_CHECKING:
+    from ._batch import BatchMixin
+
+#: Default time (seconds) a loader waits for more keys before dispatching.
+DEFAULT_LOADER_WINDOW = 0.005
+
+
+class BatchLoader:
+    """Coalesces concurrent single-identifier loads into batched filter queries.
+
+    Keys are matched in canonical form (see
+    :func:`~aireloom.resources._identifiers.canonical_id`), so ``load("10.1/A")`` and
+    ``load("https://doi.org/10.1/a")`` share one lookup. Identical keys that
+    are queued or in flight are deduplicated; nothing is cached once a lookup
+    has completed.
+
+    Args:
+        client: The resource client to load from (any ``BatchMixin``).
+        filter_param: OpenAIRE filter parameter used for the lookups.
+        window: Seconds to wait for more keys before dispatching a
+            partially filled batch. A full batch is dispatched immediately.
+        batch_size: Max identifiers per API call (1–10).
+        max_concurrency: Max chunk requests in flight per dispatch.
+        key_fn: Optional key extractor, passed through to ``batch_get``.
+    """
+
+    def __init__(
+        self,
+        client: BatchMixin,
+        filter_param: str = "pid",
+        *,
+        window: float = DEFAULT_LOADER_WINDOW,
+        batch_size: int = BATCH_GET_SIZE,
+        max_concurrency: int = 1,
+        key_fn: Callable[[Any], str | None] | None = None,
+    ):
+        self._client = client
+        self._filter_param = filter_param
+        self._window = window
+        self._batch_size = max(1, min(batch_size, BATCH_GET_SIZE))
+        self._max_concurrency = max_concurrency
+        self._key_fn = key_fn
+        # normalized key -> (identifier as first requested, shared future)
+        self._queue: dict[str, tuple[str, asyncio.Future[Any]]] = {}
+        self._in_flight: dict[str, asyncio.Future[Any]] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, identifier: str) -> Any | None:
+        """Resolve a single identifier, batching it with concurrent loads.
+
+        Args:
+            identifier: The value to look up (DOI, OpenAIRE ID, etc.).
+
+        Returns:
+            The parsed entity, or None if the API returned no match.
+
+        Raises:
+            BatchGetError: If the chunk containing *identifier* failed.
+            Exception: Any other error raised while dispatching the batch.
+        """
+        key = canonical_id(identifier)
+        future = self._in_flight.get(key)
+        if future is None and key in self._queue:
+            future = self._queue[key][1]
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._queue[key] = (identifier, future)
+            self._schedule()
+        # Shield so one cancelled caller does not cancel the shared lookup.
+        return await asyncio.shield(future)
+
+    async def load_many(self, identifiers: Iterable[str]) -> list[Any | None]:
+        """Resolve several identifiers; results follow the input order."""
+        return list(await asyncio.gather(*(self.load(i) for i in identifiers)))
+
+    def _schedule(self) -> None:
+        if len(self._queue) >= self._batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self._window, self._flush
+            )
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._queue = self._queue, {}
+        if not batch:
+            return
+        for key, (_, future) in batch.items():
+            self._in_flight[key] = future
+        task = asyncio.get_running_loop().create_task(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(
+        self, batch: dict[str, tuple[str, asyncio.Future[Any]]]
+    ) -> None:
+        identifiers = [identifier for identifier, _ in batch.values()]
+        logger.debug(
+            f"BatchLoader dispatching {len(identifiers)} key(s) "
+            f"on {self._filter_param!r}"
+        )
+        failed: dict[str, BaseException] = {}
+        try:
+            results = await self._client.batch_get(
+                identifiers,
+                filter_param=self._filter_param,
+                key_fn=self._key_fn,
+                batch_size=self._batch_size,
+                max_concurrency=self._max_concurrency,
+            )
+        except BatchGetError as e:
+            results = e.results
+            for failure in e.failures:
+                for identifier in failure.identifiers:
+                    failed[canonical_id(identifier)] = e
+        except Exception as e:  # noqa: BLE001 — forwarded to every waiter
+            results = {}
+            failed = dict.fromkeys(batch, e)
+
+        by_key = {canonical_id(k): v for k, v in results.items()}
+        for key, (_, future) in batch.items():
+            self._in_flight.pop(key, None)
+            if future.done():
+                continue
+            if key in failed:
+                future.set_exception(failed[key])
+            else:
+                future.set_result(by_key.get(key))
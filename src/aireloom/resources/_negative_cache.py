@@ -0,0 +1,159 @@
+"""NegativeCache — remember identifiers that OpenAIRE does not know.
+
+Reconciliation jobs often look up the same unknown DOIs on every run. When a
+:class:`NegativeCache` is attached to a batch-capable client, identifiers that
+were absent from a *successful* batch response are recorded, and later
+``batch_get``/``batch_stream`` calls skip them until their entry expires.
+
+Entries are keyed by filter parameter and canonical identifier (see
+:func:`~aireloom.resources._identifiers.canonical_id`), so a DOI missing under
+``pid`` says nothing about the same string under ``originalId``.
+
+Example::
+
+    cache = NegativeCache(
+        ttl=7 * 24 * 3600, path="~/.cache/aireloom/missing.json"
+    )
+    session.research_products.negative_cache = cache
+
+    await session.research_products.batch_get_by_doi(dois)
+    print(cache.hits, cache.misses)
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from bibliofabric.log_config import logger
+
+from ._identifiers import canonical_id
+from ._storage import read_json, write_json_atomic
+
+#: Default lifetime (seconds) of a negative entry: one day.
+DEFAULT_NEGATIVE_TTL = 24 * 3600.0
+
+_FORMAT_VERSION = 1
+
+
+class NegativeCache:
+    """TTL-bounded set of identifiers known to resolve to nothing.
+
+    Args:
+        ttl: Seconds an identifier stays cached after it was last found
+            missing.
+        path: Optional JSON file backing the cache. Unexpired entries are
+            loaded on creation and the file is rewritten atomically once
+            per :meth:`add`; batch lookups add all their misses in one call
+            when they end.
+        clock: Wall-clock time source (seconds since the epoch). Expiry
+            times are absolute so that they survive a reload from disk.
+
+    Attributes:
+        hits: Lookups skipped because the identifier was cached.
+        misses: Lookups that were not cached and went to the API.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_NEGATIVE_TTL,
+        *,
+        path: str | os.PathLike[str] | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        if ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl!r}")
+        self.ttl = ttl
+        self.path = Path(path).expanduser() if path is not None else None
+        self._clock = clock
+        # filter parameter -> canonical identifier -> expiry timestamp
+        self._entries: dict[str, dict[str, float]] = {}
+        self.hits = 0
+        self.misses = 0
+        if self.path is not None:
+            self._load(self.path)
+
+    def __len__(self) -> int:
+        now = self._clock()
+        return sum(
+            1
+            for entries in self._entries.values()
+            for expires in entries.values()
+            if expires > now
+        )
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache (0.0 when unused)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def contains(self, filter_param: str, identifier: str) -> bool:
+        """Return True if *identifier* is cached as missing under *filter_param*.
+
+        Every call counts towards :attr:`hits` or :attr:`misses`; expired
+        entries are dropped on access.
+        """
+        entries = self._entries.get(filter_param, {})
+        key = canonical_id(identifier)
+        expires = entries.get(key)
+        if expires is not None:
+            if expires > self._clock():
+                self.hits += 1
+                return True
+            del entries[key]
+        self.misses += 1
+        return False
+
+    def add(self, filter_param: str, identifiers: Iterable[str]) -> None:
+        """Record *identifiers* as missing and persist if file-backed."""
+        expires = self._clock() + self.ttl
+        entries = self._entries.setdefault(filter_param, {})
+        added = False
+        for identifier in identifiers:
+            entries[canonical_id(identifier)] = expires
+            added = True
+        if added and self.path is not None:
+            self.save()
+
+    def discard(self, filter_param: str, identifier: str) -> None:
+        """Forget *identifier*, e.g. after it was found by other means."""
+        entries = self._entries.get(filter_param)
+        if entries:
+            entries.pop(canonical_id(identifier), None)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics."""
+        self._entries.clear()
+        self.hits = self.misses = 0
+
+    def save(self) -> None:
+        """Write unexpired entries to :attr:`path`, replacing it atomically."""
+        if self.path is None:
+            raise ValueError("NegativeCache has no backing path")
+        now = self._clock()
+        payload = {
+            "version": _FORMAT_VERSION,
+            "entries": {
+                param: {k: v for k, v in entries.items() if v > now}
+                for param, entries in self._entries.items()
+            },
+        }
+        write_json_atomic(self.path, payload)
+
+    def _load(self, path: Path) -> None:
+        payload = read_json(path, what="negative cache")
+        if payload is None:
+            return
+        if not isinstance(payload, dict) or payload.get("version") != _FORMAT_VERSION:
+            logger.warning(f"Ignoring negative cache {path}: unknown format")
+            return
+        now = self._clock()
+        for param, entries in payload.get("entries", {}).items():
+            self._entries[param] = {
+                key: float(expires)
+                for key, expires in entries.items()
+                if float(expires) > now
+            }
@@ -0,0 +1,367 @@
+"""Cursor pagination with optional read-ahead for the Graph API clients.
+
+bibliofabric's ``CursorIterableMixin.iterate`` fetches a page, yields its
+entities, and only then requests the next page. That is the only option with
+cursor pagination (each request needs the previous ``nextCursor``), but it
+leaves the connection idle while the caller processes a page.
+:class:`ReadAheadCursorMixin` keeps the same request sequence and adds
+``read_ahead=K``: a background task follows the cursor chain up to *K* pages
+ahead of the consumer, so network time overlaps with the caller's work.
+``checkpoint=`` makes the iteration resumable (see :mod:`._checkpoint`), and
+``fields=`` parses each entity into a slim model holding only those fields
+(see :mod:`..models.projection`), and ``compact=True`` yields compact
+immutable records instead of models (see :mod:`..models.compact`).
+
+:class:`LimitedCollectMixin` sizes the pages requested by ``collect(limit=N)``
+(and hence ``first()``) to the limit instead of the iteration default, and
+closes the iteration, cancelling any read-ahead, once the limit is reached.
+
+Example::
+
+    async for product in client.research_products.iterate(
+        filters=filters, read_ahead=2
+    ):
+        expensive_processing(product)
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Iterable
+from contextlib import aclosing
+from functools import partial
+from typing import Any, NamedTuple
+
+from bibliofabric.exceptions import BibliofabricError
+from bibliofabric.log_config import logger
+from bibliofabric.resources import CursorIterableMixin
+from pydantic import BaseModel
+
+from .._decoding import response_bytes, response_json
+from ..models.compact import to_compact
+from ..models.projection import projected_model
+from ._checkpoint import (
+    CheckpointStore,
+    CheckpointTracker,
+    as_checkpoint_store,
+    query_fingerprint,
+)
+from ._concurrency import prefetch
+
+#: Cursor value that starts a cursor-paginated iteration.
+INITIAL_CURSOR = "*"
+
+
+def limited_page_size(page_size: int, limit: int | None) -> int:
+    """Return the page size to use when at most *limit* items are wanted.
+
+    Keeps the number of requests that *page_size* would need for *limit*
+    items but spreads the limit evenly over them, so the last page is not
+    padded with records that are discarded: ``limit=5`` requests 5 records,
+    ``limit=150`` with pages of 100 requests two pages of 75.
+    """
+    if limit is None:
+        return page_size
+    limit = max(1, limit)
+    pages = -(-limit // page_size)
+    return -(-limit // pages)
+
+
+class LimitedCollectMixin:
+    """``collect`` that right-sizes pages to ``limit`` and stops promptly.
+
+    bibliofabric's ``collect`` iterates with the full page size and leaves
+    the iterator to be garbage-collected after the limit is reached. This
+    version requests pages sized by :func:`limited_page_size` and closes the
+    iterator as soon as enough items have been collected.
+    """
+
+    async def collect(
+        self,
+        *,
+        filters: BaseModel | dict[str, Any] | None = None,
+        limit: int | None = None,
+        sort_by: str | None = None,
+        page_size: int = 100,
+        search: str | None = None,
+        **iterate_options: Any,
+    ) -> list[Any]:
+        """Collect results into a list, optionally limited.
+
+        Args:
+            filters: Filter criteria.
+            limit: Maximum number of results to collect. None = collect all.
+            sort_by: Field to sort by.
+            page_size: Largest number of results per page during iteration.
+            search: Optional free-text search query.
+            **iterate_options: Further keyword arguments for ``iterate``,
+                e.g. ``read_ahead`` or ``fields``.
+
+        Returns:
+            A list of entities (parsed models if ``_entity_model`` is set).
+        """
+        iterate_kwargs: dict[str, Any] = {
+            "page_size": limited_page_size(page_size, limit),
+            "sort_by": sort_by,
+            "filters": filters,
+            **iterate_options,
+        }
+        if search is not None:
+            iterate_kwargs["search"] = search
+        collected: list[Any] = []
+        stream = self.iterate(**iterate_kwargs)  # ty: ignore[unresolved-attribute]
+        async with aclosing(stream):
+            async for entity in stream:
+                collected.append(entity)
+                if limit is not None and len(collected) >= limit:
+                    break
+        return collected
+
+
+class CursorPage(NamedTuple):
+    """One page of a cursor-paginated iteration.
+
+    Attributes:
+        results: Raw (unparsed) entity dicts of the page; empty when the
+            page was read with ``bodies=True``.
+        next_cursor: Cursor for the following page, or None on the last page.
+        body: Undecoded response body, with ``bodies=True``.
+    """
+
+    results: list[Any]
+    next_cursor: str | None
+    body: bytes | None = None
+
+
+class ReadAheadCursorMixin(LimitedCollectMixin, CursorIterableMixin):
+    """``CursorIterableMixin`` with opt-in read-ahead of upcoming pages.
+
+    Without ``read_ahead`` the request sequence, logging and error handling
+    match bibliofabric's ``iterate``. The page loop is exposed as
+    :meth:`_cursor_pages` for iteration helpers that need page boundaries
+    or cursors.
+    """
+
+    # Provided by BaseResourceClient and the concrete client class.
+    _api_client: Any
+    _entity_path: str
+    _entity_model: type[BaseModel] | None
+    _base_url_override: str | None
+    _param_cursor: str
+    _param_page_size: str
+    _param_sort: str
+    _param_search: str
+
+    async def iterate(
+        self,
+        page_size: int = 100,
+        sort_by: str | None = None,
+        filters: BaseModel | dict[str, Any] | None = None,
+        search: str | None = None,
+        *,
+        read_ahead: int = 0,
+        checkpoint: str | os.PathLike[str] | CheckpointStore | None = None,
+        fields: Iterable[str] | None = None,
+        compact: bool = False,
+    ) -> AsyncIterator[Any]:
+        """Iterate through all entities matching the criteria using cursor pagination.
+
+        Args:
+            page_size: Number of results to fetch per API call during iteration.
+            sort_by: Field to sort by.
+            filters: Filter criteria as a Pydantic model or dictionary.
+            search: Optional free-text search query.
+            read_ahead: Pages to request ahead of the one being consumed.
+                The default of 0 fetches each page only when the previous
+                one has been consumed.
+            checkpoint: Path or :class:`CheckpointStore` recording the
+                cursor after each consumed page, so that the same query
+                resumes there after an interruption.
+            fields: Entity fields to keep, e.g. ``{"pids", "indicators"}``.
+                Entities are then parsed into a slim model with only these
+                fields (and ``id``); other keys are not validated.
+            compact: Yield each parsed entity as a compact, immutable
+                record (see ``to_compact``), which takes a fraction of the
+                memory of the model when many results are kept.
+
+        Yields:
+            Individual entities, parsed with ``_entity_model`` when set.
+
+        Raises:
+            ValueError: If *fields* names an unknown field.
+            BibliofabricError: If the API request fails during iteration.
+        """
+        parse = self._entity_parser(fields, compact=compact)
+        cursor = INITIAL_CURSOR
+        tracker = None
+        store = as_checkpoint_store(checkpoint)
+        if store is not None:
+            query = {
+                "pageSize": page_size,
+                "sortBy": sort_by,
+                "filters": self._serialize_filters(filters),  # ty: ignore[unresolved-attribute]
+                "search": search,
+            }
+            tracker = CheckpointTracker(
+                store, query_fingerprint(self._entity_path, query)
+            )
+            cursor = str(tracker.resume() or INITIAL_CURSOR)
+
+        pages = self._cursor_pages(
+            page_size=page_size,
+            sort_by=sort_by,
+            filters=filters,
+            search=search,
+            cursor=cursor,
+        )
+        async with aclosing(prefetch(pages, depth=read_ahead)) as buffered:
+            async for page in buffered:
+                for result_data in page.results:
+                    yield parse(result_data)
+                if tracker is not None:
+                    tracker.page_done(len(page.results), page.next_cursor)
+        if tracker is not None:
+            tracker.finish()
+
+    async def _cursor_pages(
+        self,
+        *,
+        page_size: int = 100,
+        sort_by: str | None = None,
+        filters: BaseModel | dict[str, Any] | None = None,
+        search: str | None = None,
+        cursor: str = INITIAL_CURSOR,
+        bodies: bool = False,
+    ) -> AsyncGenerator[CursorPage]:
+        """Yield raw result pages by following ``nextCursor`` from *cursor*.
+
+        Stops after an empty page or a page without a next cursor. With
+        *bodies* only the header of each response is decoded and pages carry
+        the undecoded body instead of results; the walk then also stops once
+        ``numFound`` records have been requested from the first page on.
+
+        Raises:
+            BibliofabricError: If the API request fails. Non-library errors
+                are wrapped.
+        """
+        if not self._entity_path:
+            raise BibliofabricError(f"{type(self).__name__} must define _entity_path")
+        entity_path = self._entity_path
+
+        filter_dict = self._serialize_filters(filters)  # ty: ignore[unresolved-attribute]
+        logger.debug(
+            f"Iterating {entity_path}: pageSize={page_size}, "
+            f"sort='{sort_by}', filters={filter_dict}"
+        )
+        params: dict[str, Any] = {
+            self._param_cursor: cursor,
+            self._param_page_size: page_size,
+        }
+        if sort_by:
+            params[self._param_sort] = self._normalize_sort(sort_by)  # ty: ignore[unresolved-attribute]
+        if filter_dict:
+            params.update(filter_dict)
+        if search is not None and self._param_search:
+            params[self._param_search] = search
+
+        unwrapper = self.response_unwrapper  # ty: ignore[unresolved-attribute]
+        requested = 0
+        while True:
+            try:
+                logger.debug(f"Iterating {entity_path} with params: {params}")
+                # Pass a copy so recorded call arguments are not mutated later.
+                response = await self._api_client.request(
+                    "GET",
+                    entity_path,
+                    params=params.copy(),
+                    base_url_override=self._base_url_override,
+                )
+                if bodies:
+                    body = response_bytes(response)
+                    response_data = {"header": unwrapper.unwrap_header(body)}
+                    results = []
+                else:
+                    body = None
+                    response_data = response_json(response)
+                    results = unwrapper.unwrap_results(response_data)
+                next_cursor = unwrapper.get_next_page_token(response_data)
+            except Exception as e:
+                if isinstance(e, BibliofabricError):
+                    raise
+                logger.exception(
+                    f"Failed during iteration of {entity_path} with params {params}"
+                )
+                raise BibliofabricError(
+                    f"Unexpected error during iteration of {entity_path}: {e}"
+                ) from e
+
+            if body is not None:
+                total = unwrapper.get_total_results(response_data)
+                if total == 0:
+                    return
+                requested += page_size
+                yield CursorPage(results, next_cursor or None, body)
+                if total is not None and requested >= total:
+                    return
+            elif not results:
+                logger.debug(f"No more results for {entity_path}, stopping iteration.")
+                return
+            else:
+                yield CursorPage(results, next_cursor or None)
+            if not next_cursor:
+                logger.debug(f"No nextCursor for {entity_path}, stopping iteration.")
+                return
+            params[self._param_cursor] = next_cursor
+
+    def _parse_entity(self, result_data: Any) -> Any:
+        """Parse one raw entity with ``_entity_model``, or return it unchanged.
+
+        Data that fails validation is logged and yielded raw, as bibliofabric
+        does.
+        """
+        return _parse_as(self._entity_model, result_data)
+
+    def _entity_parser(
+        self, fields: Iterable[str] | None, *, compact: bool = False
+    ) -> Callable[[Any], Any]:
+        """Return the entity parser, projected to *fields* when given.
+
+        With *compact* parsed entities are converted to compact records;
+        raw data (failed validation, no entity model) passes through.
+        """
+        if fields is None:
+            parse = self._parse_entity
+        else:
+            parse = partial(_parse_as, projected_entity_model(self, fields))
+        if not compact:
+            return parse
+        return lambda result_data: _as_compact(parse(result_data))
+
+
+def projected_entity_model(client: Any, fields: Iterable[str]) -> type[BaseModel]:
+    """Return the ``_entity_model`` of *client* projected to *fields*.
+
+    Raises:
+        ValueError: If the client has no entity model or a field is unknown.
+    """
+    model = client._entity_model
+    if model is None:
+        raise ValueError(f"{type(client).__name__} does not support fields=")
+    return projected_model(model, fields)
+
+
+def _as_compact(entity: Any) -> Any:
+    return to_compact(entity) if isinstance(entity, BaseModel) else entity
+
+
+def _parse_as(model: type[BaseModel] | None, result_data: Any) -> Any:
+    if model is None:
+        return result_data
+    try:
+        return model.model_validate(result_data)
+    except Exception as e:  # noqa: BLE001 — fall back to raw data
+        logger.warning(
+            f"Failed to parse entity data with {model.__name__}: {e}. "
+            "Yielding raw data."
+        )
+        return result_data
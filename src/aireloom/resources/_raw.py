@@ -0,0 +1,245 @@
+"""Raw passthrough access that skips model validation.
+
+ETL jobs that re-serialize records straight away (to Parquet, say) gain
+nothing from building Pydantic models. ``search_raw`` and ``iterate_raw``
+return the unwrapped result dicts, or with ``as_bytes=True`` each page's
+undecoded response body, through the same ``AireloomClient.request`` path
+as the parsed methods, so retries, authentication and rate limiting are
+unchanged. :meth:`RawAccessMixin.validate_batch` turns raw records (or page
+bodies) into models later, if needed.
+
+Example::
+
+    async for body in client.research_products.iterate_raw(
+        filters=filters, as_bytes=True
+    ):
+        sink.write(body)
+"""
+
+from __future__ import annotations
+
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+)
+from contextlib import aclosing
+from functools import cache, partial
+from typing import Any
+
+from bibliofabric.log_config import logger
+from pydantic import BaseModel, TypeAdapter
+
+from .._decoding import decode_json, response_bytes, response_json
+from ..models import projected_model
+from ._concurrency import prefetch, windowed
+from ._paging import projected_entity_model
+
+#: A raw record, or a page body holding several.
+RawRecord = dict[str, Any] | bytes | bytearray | str
+
+
+class RawAccessMixin:
+    """Adds ``search_raw``, ``iterate_raw`` and ``validate_batch``.
+
+    Requires the ``_search_page`` and ``_cursor_pages`` helpers of
+    ``FastSearchMixin`` and ``ReadAheadCursorMixin``.
+    """
+
+    # Provided by BaseResourceClient and the concrete client class.
+    _entity_model: type[BaseModel] | None
+
+    async def search_raw(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        sort_by: str | None = None,
+        filters: BaseModel | dict[str, Any] | None = None,
+        search: str | None = None,
+        *,
+        as_bytes: bool = False,
+    ) -> list[dict[str, Any]] | bytes:
+        """Return one page of results without validating them.
+
+        Args:
+            page: Page number (1-indexed).
+            page_size: Number of results per page.
+            sort_by: Field to sort by (e.g., 'title asc', 'date desc').
+            filters: Filter criteria as a Pydantic model or dictionary.
+            search: Optional free-text search query.
+            as_bytes: Return the undecoded response body instead.
+
+        Returns:
+            The unwrapped result dicts, or the response body.
+
+        Raises:
+            BibliofabricError: If the API request fails.
+        """
+        unwrapper = self.response_unwrapper  # ty: ignore[unresolved-attribute]
+
+        def parse(response: Any) -> list[dict[str, Any]] | bytes:
+            if as_bytes:
+                return response_bytes(response)
+            return unwrapper.unwrap_results(response_json(response))
+
+        return await self._search_page(  # ty: ignore[unresolved-attribute]
+            page, page_size, sort_by, filters, search, parse
+        )
+
+    async def iterate_raw(
+        self,
+        page_size: int = 100,
+        sort_by: str | None = None,
+        filters: BaseModel | dict[str, Any] | None = None,
+        search: str | None = None,
+        *,
+        read_ahead: int = 0,
+        as_bytes: bool = False,
+    ) -> AsyncIterator[Any]:
+        """Iterate through all matching results without validating them.
+
+        Args:
+            page_size: Number of results to fetch per API call.
+            sort_by: Field to sort by.
+            filters: Filter criteria as a Pydantic model or dictionary.
+            search: Optional free-text search query.
+            read_ahead: Pages to request ahead of the one being consumed.
+            as_bytes: Yield each page's undecoded response body instead of
+                its result dicts. Only the header is decoded, to follow the
+                cursor.
+
+        Yields:
+            Result dicts, or one ``bytes`` body per page.
+
+        Raises:
+            BibliofabricError: If the API request fails during iteration.
+        """
+        pages = self._cursor_pages(  # ty: ignore[unresolved-attribute]
+            page_size=page_size,
+            sort_by=sort_by,
+            filters=filters,
+            search=search,
+            bodies=as_bytes,
+        )
+        async with aclosing(prefetch(pages, depth=read_ahead)) as buffered:
+            async for page in buffered:
+                if as_bytes:
+                    yield page.body
+                else:
+                    for result_data in page.results:
+                        yield result_data
+
+    def validate_batch(
+        self,
+        records: Iterable[RawRecord],
+        *,
+        fields: Iterable[str] | None = None,
+        model: type[BaseModel] | None = None,
+    ) -> list[Any]:
+        """Validate raw results from ``search_raw``/``iterate_raw`` as models.
+
+        Args:
+            records: Result dicts and/or page bodies, in any mix.
+            fields: Validate into the slim model of these fields instead
+                (see ``iterate``).
+            model: Model to validate as instead of ``_entity_model``, e.g.
+                ``Relation`` for raw links.
+
+        Returns:
+            The models, in input order; raw dicts if the client has no
+            entity model.
+
+        Raises:
+            ValueError: If *fields* names an unknown field.
+            pydantic.ValidationError: If a record does not validate.
+        """
+        if model is None:
+            model = (
+                self._entity_model
+                if fields is None
+                else projected_entity_model(self, fields)
+            )
+        elif fields is not None:
+            model = projected_model(model, fields)
+        unwrapper = self.response_unwrapper  # ty: ignore[unresolved-attribute]
+        return validate_records(
+            model, flatten_records(records, unwrapper.unwrap_results)
+        )
+
+
+def flatten_records(
+    records: Iterable[RawRecord],
+    unwrap: Callable[[Any], list[dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """Expand page bodies in *records* into their result dicts."""
+    items: list[dict[str, Any]] = []
+    for record in records:
+        if isinstance(record, bytes | str):
+            items.extend(unwrap(decode_json(record)))
+        elif isinstance(record, bytearray):
+            items.extend(unwrap(decode_json(bytes(record))))
+        else:
+            items.append(record)
+    return items
+
+
+def validate_records(
+    model: type[BaseModel] | None, items: list[dict[str, Any]]
+) -> list[Any]:
+    """Validate *items* as a list of *model* in one pass."""
+    if model is None:
+        return items
+    return _list_adapter(model).validate_python(items)
+
+
+@cache
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    # One adapter for the whole list validates faster than one per item; ty
+    # cannot follow a model chosen at runtime as a type argument.
+    return TypeAdapter(list[model])  # ty: ignore[invalid-type-form]
+
+
+async def numbered_raw_pages(
+    fetch: Callable[[int], Awaitable[bytes]],
+    *,
+    first_page: int,
+    last_page: Callable[[Any], int],
+    unwrap: Callable[[Any], list[dict[str, Any]]],
+    max_concurrency: int = 1,
+    as_bytes: bool = False,
+) -> AsyncGenerator[Any]:
+    """Walk a page-numbered endpoint and yield raw results or page bodies.
+
+    The first page is decoded to learn the page count (``last_page`` returns
+    the last page number); the remaining pages are fetched with up to
+    *max_concurrency* in flight and yielded in page order. Bodies of later
+    pages are passed through undecoded with *as_bytes*.
+    """
+    body = await fetch(first_page)
+    data = decode_json(body)
+    results = unwrap(data)
+    if not results:
+        return
+    if as_bytes:
+        yield body
+    else:
+        for result_data in results:
+            yield result_data
+
+    pages = windowed(
+        (partial(fetch, page) for page in range(first_page + 1, last_page(data) + 1)),
+        window=max_concurrency,
+    )
+    async with aclosing(pages):
+        async for body in pages:
+            if as_bytes:
+                yield body
+                continue
+            results = unwrap(decode_json(body))
+            if not results:
+                logger.debug("Empty raw page, stopping iteration.")
+                return
+            for result_data in results:
+                yield result_data
@@ -0,0 +1,214 @@
+"""``get()`` and ``search()`` that decode responses with the configured JSON decoder."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from bibliofabric.exceptions import BibliofabricError
+from bibliofabric.log_config import logger
+from bibliofabric.resources import GettableMixin, SearchableMixin
+from pydantic import BaseModel
+
+from .._decoding import response_json
+from ..models import ApiResponse
+from ._paging import projected_entity_model
+
+
+class FastGetMixin(GettableMixin):
+    """``GettableMixin`` that decodes responses through :mod:`.._decoding`.
+
+    Lookup, logging and error handling match bibliofabric's ``get``; only
+    the decoding differs.
+    """
+
+    # Provided by BaseResourceClient and the concrete client class.
+    _api_client: Any
+    _entity_path: str
+    _entity_model: type[BaseModel] | None
+    _base_url_override: str | None
+    _supports_direct_get: bool
+    _param_id: str
+    _param_page_size: str
+
+    async def get(self, entity_id: str) -> Any:
+        """Retrieve a single entity by its ID.
+
+        Args:
+            entity_id: The unique identifier of the entity to retrieve.
+
+        Returns:
+            The entity parsed with ``_entity_model`` when set, otherwise the
+            raw entity data.
+
+        Raises:
+            BibliofabricError: If the entity is not found or the API request
+                fails.
+        """
+        if not self._entity_path:
+            raise BibliofabricError(f"{type(self).__name__} must define _entity_path")
+
+        logger.debug(f"Fetching entity with ID: {entity_id}")
+        unwrapper = self.response_unwrapper  # ty: ignore[unresolved-attribute]
+        try:
+            if self._supports_direct_get:
+                response = await self._api_client.request(
+                    "GET",
+                    f"{self._entity_path}/{entity_id}",
+                    params=None,
+                    base_url_override=self._base_url_override,
+                )
+                entity_data = unwrapper.unwrap_single_item(response_json(response))
+            else:
+                params = {self._param_id: entity_id, self._param_page_size: 1}
+                response = await self._api_client.request(
+                    "GET",
+                    self._entity_path,
+                    params=params,
+                    base_url_override=self._base_url_override,
+                )
+                results = unwrapper.unwrap_results(response_json(response))
+                if not results:
+                    entity_name = (
+                        self._entity_model.__name__ if self._entity_model else "Entity"
+                    )
+                    raise BibliofabricError(
+                        f"{entity_name} with ID '{entity_id}' not found."
+                    )
+                entity_data = results[0]
+            if self._entity_model is None:
+                return entity_data
+            try:
+                return self._entity_model.model_validate(entity_data)
+            except Exception as e:  # noqa: BLE001 — fall back to raw data
+                logger.warning(
+                    f"Failed to parse entity data with {self._entity_model.__name__}: "
+                    f"{e}. Returning raw data."
+                )
+                return entity_data
+        except Exception as e:
+            if isinstance(e, BibliofabricError):
+                raise
+            logger.exception(
+                f"Failed to fetch entity {entity_id} from {self._entity_path}"
+            )
+            raise BibliofabricError(
+                f"Unexpected error fetching entity {entity_id}: {e}"
+            ) from e
+
+
+class FastSearchMixin(SearchableMixin):
+    """``SearchableMixin`` that decodes responses through :mod:`.._decoding`.
+
+    Parameters, logging and error handling match bibliofabric's ``search``;
+    only the decoding differs, and ``fields=`` projects the results. Data
+    that fails validation is returned raw, as bibliofabric does.
+    """
+
+    # Provided by BaseResourceClient and the concrete client class.
+    _api_client: Any
+    _entity_path: str
+    _base_url_override: str | None
+    _search_response_model: type[BaseModel] | None
+    _param_page: str
+    _param_page_size: str
+    _param_sort: str
+    _param_search: str
+
+    async def search(
+        self,
+        page: int = 1,
+        page_size: int = 20,
+        sort_by: str | None = None,
+        filters: BaseModel | dict[str, Any] | None = None,
+        search: str | None = None,
+        *,
+        fields: Iterable[str] | None = None,
+    ) -> BaseModel | dict[str, Any]:
+        """Search for entities with pagination support.
+
+        Args:
+            page: Page number (1-indexed).
+            page_size: Number of results per page.
+            sort_by: Field to sort by (e.g., 'title asc', 'date desc').
+            filters: Filter criteria as a Pydantic model or dictionary.
+            search: Optional free-text search query.
+            fields: Entity fields to keep. Results are then parsed into a
+                slim model with only these fields (and ``id``).
+
+        Returns:
+            The response parsed with ``_search_response_model`` when set,
+            otherwise the raw response data.
+
+        Raises:
+            ValueError: If *fields* names an unknown field.
+            BibliofabricError: If the API request fails.
+        """
+        model = self._search_response_model
+        if fields is not None:
+            entity = projected_entity_model(self, fields)
+            # Parametrized with a model built at runtime, which ty cannot follow.
+            model = ApiResponse[entity]  # ty: ignore[invalid-type-form]
+
+        def parse(response: Any) -> BaseModel | dict[str, Any]:
+            data = response_json(response)
+            if model is None:
+                return data
+            try:
+                return model.model_validate(data)
+            except Exception as e:  # noqa: BLE001 — fall back to raw data
+                logger.warning(
+                    f"Failed to parse search response with {model.__name__}: {e}. "
+                    "Returning raw data."
+                )
+                return data
+
+        return await self._search_page(page, page_size, sort_by, filters, search, parse)
+
+    async def _search_page[T](
+        self,
+        page: int,
+        page_size: int,
+        sort_by: str | None,
+        filters: BaseModel | dict[str, Any] | None,
+        search: str | None,
+        parse: Callable[[Any], T],
+    ) -> T:
+        """Request one search page and return ``parse(response)``.
+
+        Raises:
+            BibliofabricError: If the request or *parse* fails. Non-library
+                errors are wrapped.
+        """
+        if not self._entity_path:
+            raise BibliofabricError(f"{type(self).__name__} must define _entity_path")
+
+        params = self._serialize_filters(filters)  # ty: ignore[unresolved-attribute]
+        params[self._param_page] = page
+        params[self._param_page_size] = page_size
+        if sort_by:
+            self._validate_sort_field(sort_by.split()[0])  # ty: ignore[unresolved-attribute]
+            params[self._param_sort] = self._normalize_sort(sort_by)  # ty: ignore[unresolved-attribute]
+        if search is not None and self._param_search:
+            params[self._param_search] = search
+        logger.debug(
+            f"Searching {self._entity_path}: page={page}, size={page_size}, "
+            f"sort='{params.get(self._param_sort)}', filters={params}"
+        )
+        try:
+            response = await self._api_client.request(
+                "GET",
+                self._entity_path,
+                params=params,
+                base_url_override=self._base_url_override,
+            )
+            return parse(response)
+        except Exception as e:
+            if isinstance(e, BibliofabricError):
+                raise
+            logger.exception(
+                f"Failed to search {self._entity_path} with params {params}"
+            )
+            raise BibliofabricError(
+                f"Unexpected error searching {self._entity_path}: {e}"
+            ) from e
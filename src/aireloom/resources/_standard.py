@@ -1,22 +1,23 @@
 # aireloom/resources/_standard.py
 """Base class for standard CRUD resource clients with batch support."""
 
-from bibliofabric import (
-    BaseResourceClient,
-    CursorIterableMixin,
-    GettableMixin,
-    SearchableMixin,
-)
+from bibliofabric import BaseResourceClient
 from bibliofabric.log_config import logger
 
 from ._batch import BatchMixin
+from ._counting import HeaderCountMixin
+from ._paging import ReadAheadCursorMixin
+from ._raw import RawAccessMixin
+from ._search import FastGetMixin, FastSearchMixin
 
 
 class StandardResourceClient(
     BatchMixin,
-    GettableMixin,
-    SearchableMixin,
-    CursorIterableMixin,
+    FastGetMixin,
+    FastSearchMixin,
+    RawAccessMixin,
+    ReadAheadCursorMixin,
+    HeaderCountMixin,
     BaseResourceClient,
 ):
     """Base for simple CRUD resource clients that only differ in class attributes.
@@ -37,6 +38,4 @@ class StandardResourceClient(
             api_client: An instance of the parent API client.
         """
         super().__init__(api_client)
-        logger.debug(
-            f"{type(self).__name__} initialized for path: {self._entity_path}"  # ty: ignore[unresolved-attribute]
-        )
+        logger.debug(f"{type(self).__name__} initialized for path: {self._entity_path}")
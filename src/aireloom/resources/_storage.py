@@ -0,0 +1,47 @@
+"""Small JSON file helpers for state persisted between runs.
+
+Used by :class:`~aireloom.resources._negative_cache.NegativeCache` and the
+iteration checkpoints. Writes go to a temporary file in the target directory
+that then replaces the target, so a crash mid-write never leaves a truncated
+file behind.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from bibliofabric.log_config import logger
+
+
+def write_json_atomic(path: Path, payload: Any) -> None:
+    """Serialize *payload* to *path*, replacing any existing file atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh)
+            fh.flush()
+            os.fsync(fh.fileno())
+        Path(tmp).replace(path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def read_json(path: Path, *, what: str) -> Any | None:
+    """Return the JSON content of *path*, or None if missing or unreadable.
+
+    Unreadable files are logged (naming them as *what*) rather than raised:
+    persisted state is an optimisation and must not break a run.
+    """
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable {what} {path}: {e}")
+        return None
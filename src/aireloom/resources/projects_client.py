@@ -3,10 +3,11 @@
 
 from ..endpoints import PROJECTS
 from ..models import Project, ProjectResponse
+from ._partition import PartitionedIterableMixin, PartitionSpec
 from ._standard import StandardResourceClient
 
 
-class ProjectsClient(StandardResourceClient):
+class ProjectsClient(PartitionedIterableMixin, StandardResourceClient):
     """Client for the OpenAIRE Projects API endpoint.
 
     Attributes:
@@ -23,3 +24,4 @@ class ProjectsClient(StandardResourceClient):
         "code": "code",
         "openaire_id": "id",
     }
+    _partition_spec = PartitionSpec("fromStartDate", "toStartDate", "startDate")
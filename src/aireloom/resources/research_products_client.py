@@ -8,28 +8,55 @@ operations like retrieving individual entities, searching, and iterating
 through result sets.
 """
 
+import os
 from collections.abc import AsyncIterator
+from contextlib import aclosing
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from bibliofabric.log_config import logger
-from bibliofabric.resources import (
-    BaseResourceClient,
-    CursorIterableMixin,
-    GettableMixin,
-    SearchableMixin,
-)
+from bibliofabric.resources import BaseResourceClient
 
+from .._decoding import response_bytes, response_json, validate_response
 from ._batch import BatchMixin
+from ._checkpoint import (
+    CheckpointStore,
+    CheckpointTracker,
+    as_checkpoint_store,
+    query_fingerprint,
+)
+from ._concurrency import windowed
+from ._counting import GroupedCountMixin, HeaderCountMixin
+from ._partition import PartitionedIterableMixin, PartitionSpec
+from ._raw import RawAccessMixin, numbered_raw_pages
+from ._search import FastGetMixin, FastSearchMixin
+from ._sync import IncrementalSyncMixin
 
 if TYPE_CHECKING:
     from ..client import AireloomClient
 from ..constants import OPENAIRE_GRAPH_API_BASE_URL, OPENAIRE_GRAPH_API_V2_BASE_URL
 from ..endpoints import LINKS, RESEARCH_PRODUCTS, LinksFilters
-from ..models import LinksResponse, Relation, ResearchProduct, ResearchProductResponse
+from ..models import (
+    ApiResponse,
+    LazyResearchProduct,
+    LazyResearchProductResponse,
+    LinksResponse,
+    Relation,
+    ResearchProduct,
+    ResearchProductResponse,
+)
 
 
 class ResearchProductsClient(
-    BatchMixin, GettableMixin, SearchableMixin, CursorIterableMixin, BaseResourceClient
+    BatchMixin,
+    FastGetMixin,
+    FastSearchMixin,
+    RawAccessMixin,
+    PartitionedIterableMixin,
+    IncrementalSyncMixin,
+    GroupedCountMixin,
+    HeaderCountMixin,
+    BaseResourceClient,
 ):
     """Client for the OpenAIRE Research Products API endpoint.
 
@@ -43,19 +70,45 @@ class ResearchProductsClient(
             since researchProducts is only available on v2.
         _entity_path (str): The API path for research products.
         _entity_model (type[ResearchProduct]): Pydantic model for a single research product.
-        _search_response_model (type[ResearchProductResponse]): Pydantic model for the
-                                                                search response envelope.
+        _search_response_model (type[ApiResponse[Any]]): Pydantic model for the
+                                                         search response envelope.
+
+    Set :attr:`lazy` to receive :class:`LazyResearchProduct` instances, which
+    validate nested sub-models only when they are first accessed.
     """
 
     _base_url_override: str | None = OPENAIRE_GRAPH_API_V2_BASE_URL
     _entity_path: str = RESEARCH_PRODUCTS
     _entity_model: type[ResearchProduct] = ResearchProduct
-    _search_response_model: type[ResearchProductResponse] = ResearchProductResponse
+    _search_response_model: type[ApiResponse[Any]] = ResearchProductResponse
     _batch_fields: dict[str, str] = {
         "doi": "pid",
         "openaire_id": "id",
         "original_id": "originalId",
     }
+    _partition_spec = PartitionSpec(
+        "fromPublicationDate", "toPublicationDate", "publicationDate"
+    )
+    _group_values: dict[str, tuple[Any, ...]] = {
+        **dict.fromkeys(
+            (
+                "influenceClass",
+                "impulseClass",
+                "popularityClass",
+                "citationCountClass",
+            ),
+            ("C1", "C2", "C3", "C4", "C5"),
+        ),
+        "openAccessColor": ("gold", "green", "hybrid", "bronze"),
+        "bestOpenAccessRightLabel": (
+            "OPEN",
+            "OPEN SOURCE",
+            "EMBARGO",
+            "RESTRICTED",
+            "CLOSED",
+            "UNKNOWN",
+        ),
+    }
 
     def __init__(self, api_client: "AireloomClient"):
         """Initializes the ResearchProductsClient.
@@ -68,7 +121,28 @@ class ResearchProductsClient(
             f"ResearchProductsClient initialized for path: {self._entity_path}"
         )
 
-    # Mixin-provided methods: get, search, iterate
+    @property
+    def lazy(self) -> bool:
+        """Whether results are parsed as :class:`LazyResearchProduct`.
+
+        Applies to ``get``, ``search``, ``iterate``, ``collect``,
+        ``parallel_iterate``, ``sync`` and the batch lookups. Worth enabling
+        when only a few fields of each record are read; ``fields=`` is
+        faster still when the fields are known up front.
+        """
+        return self._entity_model is LazyResearchProduct
+
+    @lazy.setter
+    def lazy(self, enabled: bool) -> None:
+        if enabled:
+            self._entity_model = LazyResearchProduct
+            self._search_response_model = LazyResearchProductResponse
+        else:
+            self._entity_model = ResearchProduct
+            self._search_response_model = ResearchProductResponse
+
+    # Mixin-provided methods: get, search, iterate, parallel_iterate, sync,
+    # count_grouped, search_raw, iterate_raw, validate_batch
 
     # ------------------------------------------------------------------
     # Links (v1-only endpoint)
@@ -93,59 +167,176 @@ class ResearchProductsClient(
         Returns:
             A :class:`LinksResponse` containing the matching relations.
         """
+        response = await self._links_request(filters, page, page_size)
+        return validate_response(LinksResponse, response)
+
+    async def search_links_raw(
+        self,
+        *,
+        filters: LinksFilters | None = None,
+        page: int = 1,
+        page_size: int = 20,
+        as_bytes: bool = False,
+    ) -> list[dict[str, Any]] | bytes:
+        """Like :meth:`search_links`, but without validating the relations.
+
+        Args:
+            filters: Optional :class:`LinksFilters` with filter criteria.
+            page: 1-indexed page number.
+            page_size: Number of results per page (max 100).
+            as_bytes: Return the undecoded response body instead.
+
+        Returns:
+            The unwrapped relation dicts, or the response body.
+        """
+        response = await self._links_request(filters, page, page_size)
+        if as_bytes:
+            return response_bytes(response)
+        return self.response_unwrapper.unwrap_results(response_json(response))
+
+    async def _links_request(
+        self, filters: LinksFilters | None, page: int, page_size: int
+    ) -> Any:
         params: dict[str, Any] = {"page": page, "pageSize": page_size}
         if filters is not None:
             params.update(filters.model_dump(exclude_none=True))
 
-        response = await self._api_client.request(
+        return await self._api_client.request(
             method="GET",
             path=LINKS,
             params=params,
             base_url_override=OPENAIRE_GRAPH_API_BASE_URL,
         )
-        return LinksResponse.model_validate(response.json())
 
     async def iterate_links(
         self,
         *,
         filters: LinksFilters | None = None,
         page_size: int = 100,
+        max_concurrency: int = 1,
+        ordered: bool = True,
+        checkpoint: str | os.PathLike[str] | CheckpointStore | None = None,
     ) -> AsyncIterator[Relation]:
         """Iterate through all relation links matching *filters*.
 
         Automatically handles page-based pagination using ``totalPages``
-        from the response header.
+        from the response header. Once the first page has returned, the
+        remaining pages are fetched through :meth:`search_links` with at most
+        *max_concurrency* requests in flight. Pages are only requested as
+        earlier ones are consumed, so at most *max_concurrency* pages are
+        held in memory at a time.
 
         Args:
             filters: Optional :class:`LinksFilters` with filter criteria.
             page_size: Number of results per page.
+            max_concurrency: Max page requests in flight after the first
+                page. The default of 1 fetches pages one after another.
+            ordered: Yield pages in page order (default). When False, pages
+                are yielded as they complete, which keeps every request slot
+                busy but does not preserve the API's ordering.
+            checkpoint: Path or :class:`CheckpointStore` recording the next
+                page number after each consumed page, so that the same query
+                resumes there after an interruption. Requires ``ordered``.
 
         Yields:
             :class:`Relation` objects.
-        """
-        current_page = 1
-        total_pages = 1
 
-        while current_page <= total_pages:
-            response = await self.search_links(
-                filters=filters, page=current_page, page_size=page_size
-            )
+        Raises:
+            ValueError: If *checkpoint* is combined with ``ordered=False``.
+        """
+        first_page = 1
+        tracker = None
+        store = as_checkpoint_store(checkpoint)
+        if store is not None:
+            if not ordered:
+                raise ValueError("checkpoint requires ordered=True")
+            query = {
+                "pageSize": page_size,
+                "filters": filters.model_dump(exclude_none=True) if filters else {},
+            }
+            tracker = CheckpointTracker(store, query_fingerprint(LINKS, query))
+            first_page = int(tracker.resume() or 1)
+
+        response = await self.search_links(
+            filters=filters, page=first_page, page_size=page_size
+        )
+        if not response.results:
+            if tracker is not None:
+                tracker.finish()
+            return
+        for rel in response.results:
+            yield rel
+        if tracker is not None:
+            tracker.page_done(len(response.results), first_page + 1)
+
+        total_pages = (response.header.totalPages if response.header else None) or 1
+        pages = windowed(
+            (
+                partial(
+                    self.search_links, filters=filters, page=page, page_size=page_size
+                )
+                for page in range(first_page + 1, total_pages + 1)
+            ),
+            window=max_concurrency,
+            ordered=ordered,
+        )
+        async with aclosing(pages):
+            page = first_page
+            async for response in pages:
+                page += 1
+                if not response.results:
+                    # In page order an empty page means the end; out of order,
+                    # earlier pages may still be pending.
+                    if ordered:
+                        break
+                    continue
+                for rel in response.results:
+                    yield rel
+                if tracker is not None:
+                    tracker.page_done(len(response.results), page + 1)
+        if tracker is not None:
+            tracker.finish()
+
+    async def iterate_links_raw(
+        self,
+        *,
+        filters: LinksFilters | None = None,
+        page_size: int = 100,
+        max_concurrency: int = 1,
+        as_bytes: bool = False,
+    ) -> AsyncIterator[Any]:
+        """Like :meth:`iterate_links`, but without validating the relations.
 
-            if not response.results:
-                break
+        Args:
+            filters: Optional :class:`LinksFilters` with filter criteria.
+            page_size: Number of results per page.
+            max_concurrency: Max page requests in flight after the first
+                page.
+            as_bytes: Yield each page's undecoded response body instead of
+                its relation dicts.
 
-            for rel in response.results:
-                yield rel
+        Yields:
+            Relation dicts, or one ``bytes`` body per page. Pass them to
+            ``validate_batch(..., model=Relation)`` to parse them later.
+        """
 
-            if current_page == 1 and response.header is not None:
-                total_pages = response.header.totalPages or 1
-                if total_pages == 0:
-                    break
+        async def fetch(page: int) -> bytes:
+            return response_bytes(await self._links_request(filters, page, page_size))
 
-            if current_page >= total_pages:
-                break
+        def last_page(data: Any) -> int:
+            return int((data.get("header") or {}).get("totalPages") or 1)
 
-            current_page += 1
+        pages = numbered_raw_pages(
+            fetch,
+            first_page=1,
+            last_page=last_page,
+            unwrap=self.response_unwrapper.unwrap_results,
+            max_concurrency=max_concurrency,
+            as_bytes=as_bytes,
+        )
+        async with aclosing(pages):
+            async for item in pages:
+                yield item
 
     async def get_relations_info(self) -> list[dict[str, Any]]:
         """Retrieve available relation types from the links endpoint.
@@ -161,7 +352,7 @@ class ResearchProductsClient(
             params={},
             base_url_override=OPENAIRE_GRAPH_API_BASE_URL,
         )
-        data = response.json()
+        data = response_json(response)
         if isinstance(data, list):
             return data
         return [data]
@@ -9,7 +9,10 @@ as the Scholix API has a distinct structure and pagination mechanism compared
 to the main OpenAIRE Graph API.
 """
 
-from collections.abc import AsyncIterator
+import os
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import aclosing
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from bibliofabric.log_config import logger
@@ -19,6 +22,7 @@ if TYPE_CHECKING:
 from bibliofabric.exceptions import BibliofabricError, ValidationError
 from bibliofabric.resources import BaseResourceClient
 
+from .._decoding import response_bytes, response_json, validate_response
 from ..constants import (  # SCHOLIX is now in endpoints
     DEFAULT_PAGE_SIZE,
     OPENAIRE_SCHOLIX_API_BASE_URL,
@@ -28,9 +32,18 @@ from ..models import (
     ScholixRelationship,
     ScholixResponse,
 )
+from ._checkpoint import (
+    CheckpointStore,
+    CheckpointTracker,
+    as_checkpoint_store,
+    query_fingerprint,
+)
+from ._concurrency import windowed
+from ._paging import LimitedCollectMixin
+from ._raw import RawRecord, flatten_records, numbered_raw_pages, validate_records
 
 
-class ScholixClient(BaseResourceClient):
+class ScholixClient(LimitedCollectMixin, BaseResourceClient):
     """Client for the OpenAIRE Scholexplorer API (Scholix links).
 
     This client handles requests to the Scholix API, which provides data on
@@ -117,6 +130,47 @@ class ScholixClient(BaseResourceClient):
             ValueError: If neither sourcePid nor targetPid is provided in the filters model.
             BibliofabricError: For API communication errors or unexpected issues.
         """
+        return await self._links_page(
+            page, page_size, filters, partial(validate_response, ScholixResponse)
+        )
+
+    async def search_raw(
+        self,
+        page: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        filters: ScholixFilters | None = None,
+        *,
+        as_bytes: bool = False,
+    ) -> list[dict[str, Any]] | bytes:
+        """Like :meth:`search_links`, but without validating the links.
+
+        Args:
+            page: The page number to retrieve (0-indexed).
+            page_size: The number of results per page.
+            filters: An instance of ScholixFilters with filter criteria.
+            as_bytes: Return the undecoded response body instead.
+
+        Returns:
+            The link dicts of the page, or the response body.
+
+        Raises:
+            ValueError: If neither sourcePid nor targetPid is provided in the filters model.
+            BibliofabricError: For API communication errors or unexpected issues.
+        """
+        if as_bytes:
+            return await self._links_page(page, page_size, filters, response_bytes)
+        return await self._links_page(
+            page, page_size, filters, lambda r: _unwrap_links(response_json(r))
+        )
+
+    async def _links_page(
+        self,
+        page: int,
+        page_size: int,
+        filters: ScholixFilters | None,
+        parse: Callable[[Any], Any],
+    ) -> Any:
+        """Request one page of links and return ``parse(response)``."""
         filter_dict = (
             filters.model_dump(exclude_none=True, by_alias=True) if filters else {}
         )
@@ -144,7 +198,7 @@ class ScholixClient(BaseResourceClient):
                 data=None,
                 json_data=None,
             )
-            return ScholixResponse.model_validate(response.json())
+            return parse(response)
         except Exception as e:
             if isinstance(
                 e, BibliofabricError | ValidationError
@@ -161,15 +215,26 @@ class ScholixClient(BaseResourceClient):
         self,
         page_size: int = DEFAULT_PAGE_SIZE,
         filters: ScholixFilters | None = None,  # Changed to Pydantic model
+        max_concurrency: int = 1,
+        checkpoint: str | os.PathLike[str] | CheckpointStore | None = None,
     ) -> AsyncIterator[ScholixRelationship]:
         """Iterates through all Scholexplorer relationship links matching the filters.
 
-        Handles pagination automatically based on 'total_pages'.
+        Handles pagination automatically based on 'total_pages'. The first
+        page is fetched on its own to learn the page count; the remaining
+        pages are then requested through ``search_links`` with up to
+        *max_concurrency* in flight, and their links are still yielded in
+        page order.
 
         Args:
             page_size: The number of results per page during iteration.
             filters: An instance of ScholixFilters with filter criteria.
                        `sourcePid` or `targetPid` is typically required.
+            max_concurrency: Max page requests in flight after the first
+                page. The default of 1 fetches pages one after another.
+            checkpoint: Path or :class:`CheckpointStore` recording the next
+                page number after each consumed page, so that the same query
+                resumes there after an interruption.
 
         Yields:
             ScholixRelationship objects matching the query.
@@ -185,54 +250,127 @@ class ScholixClient(BaseResourceClient):
         )
 
         current_page = 0
-        total_pages = 1  # Assume at least one page initially
-
-        while current_page < total_pages:
-            logger.debug(
-                f"Iterating Scholix page {current_page + 1}/{total_pages if total_pages > 1 else '?'}"
+        tracker = None
+        store = as_checkpoint_store(checkpoint)
+        if store is not None:
+            query = {
+                "size": page_size,
+                "filters": filters.model_dump(exclude_none=True, by_alias=True)
+                if filters
+                else {},
+            }
+            tracker = CheckpointTracker(
+                store, query_fingerprint(self._entity_path, query)
+            )
+            current_page = int(tracker.resume() or 0)
+        try:
+            response_data = await self.search_links(
+                page=current_page, page_size=page_size, filters=filters
             )
-            try:
-                # search_links now takes the ScholixFilters model directly
-                response_data = await self.search_links(
-                    page=current_page,
-                    page_size=page_size,
-                    filters=filters,
+            if not response_data.result:
+                logger.debug(
+                    "No results found on this Scholix page, stopping iteration."
                 )
-
-                if not response_data.result:
+                if tracker is not None:
+                    tracker.finish()
+                return
+            for link in response_data.result:
+                yield link
+            if tracker is not None:
+                tracker.page_done(len(response_data.result), current_page + 1)
+
+            total_pages = response_data.total_pages
+            logger.debug(f"Total pages reported by Scholix: {total_pages}")
+            pages = windowed(
+                (
+                    partial(
+                        self.search_links,
+                        page=page,
+                        page_size=page_size,
+                        filters=filters,
+                    )
+                    for page in range(current_page + 1, total_pages)
+                ),
+                window=max_concurrency,
+            )
+            async with aclosing(pages):
+                async for response_data in pages:
+                    current_page += 1
                     logger.debug(
-                        "No results found on this Scholix page, stopping iteration."
+                        f"Iterating Scholix page {current_page + 1}/{total_pages}"
                     )
-                    break
-
-                for link in response_data.result:
-                    yield link
-
-                if current_page == 0:  # Only update total_pages on the first call
-                    total_pages = response_data.total_pages
-                    logger.debug(f"Total pages reported by Scholix: {total_pages}")
-                    if total_pages == 0:  # No results at all
+                    if not response_data.result:
                         logger.debug(
-                            "Scholix reported 0 total pages. Stopping iteration."
+                            "No results found on this Scholix page, stopping iteration."
                         )
                         break
+                    for link in response_data.result:
+                        yield link
+                    if tracker is not None:
+                        tracker.page_done(len(response_data.result), current_page + 1)
+            if tracker is not None:
+                tracker.finish()
 
-                if current_page >= total_pages - 1:
-                    logger.debug("Last Scholix page processed, stopping iteration.")
-                    break
+        except Exception as e:
+            if isinstance(e, BibliofabricError | ValidationError):
+                raise
+            logger.exception(
+                f"Failed during iteration of {self._entity_path} on page {current_page}"
+            )
+            raise BibliofabricError(
+                f"Failed during iteration of {self._entity_path} on page {current_page}: {e}"
+            ) from e
+        logger.debug("Scholix iteration finished.")
+
+    async def iterate_raw(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        filters: ScholixFilters | None = None,
+        *,
+        max_concurrency: int = 1,
+        as_bytes: bool = False,
+    ) -> AsyncIterator[Any]:
+        """Like :meth:`iterate_links`, but without validating the links.
 
-                current_page += 1
+        Args:
+            page_size: The number of results per page during iteration.
+            filters: An instance of ScholixFilters with filter criteria.
+            max_concurrency: Max page requests in flight after the first page.
+            as_bytes: Yield each page's undecoded response body instead of
+                its link dicts.
 
-            except Exception as e:
-                if isinstance(e, BibliofabricError | ValidationError):
-                    raise
-                logger.exception(
-                    f"Failed during iteration of {self._entity_path} on page {current_page}"
-                )
-                raise BibliofabricError(
-                    f"Failed during iteration of {self._entity_path} on page {current_page}: {e}"
-                ) from e
-        logger.debug("Scholix iteration finished.")
+        Yields:
+            Link dicts, or one ``bytes`` body per page.
+
+        Raises:
+            ValueError: If neither sourcePid nor targetPid is provided in the filters.
+            BibliofabricError: For API communication errors or unexpected issues.
+        """
+
+        async def fetch(page: int) -> bytes:
+            return await self._links_page(page, page_size, filters, response_bytes)
+
+        pages = numbered_raw_pages(
+            fetch,
+            first_page=0,
+            last_page=lambda data: int(data.get("totalPages") or 0) - 1,
+            unwrap=_unwrap_links,
+            max_concurrency=max_concurrency,
+            as_bytes=as_bytes,
+        )
+        async with aclosing(pages):
+            async for item in pages:
+                yield item
+
+    def validate_batch(self, records: Iterable[RawRecord]) -> list[ScholixRelationship]:
+        """Validate link dicts or page bodies from the raw methods.
+
+        Raises:
+            pydantic.ValidationError: If a link does not validate.
+        """
+        return validate_records(
+            ScholixRelationship, flatten_records(records, _unwrap_links)
+        )
 
     # ── Standard-name aliases for BaseResourceClient.collect/count/first ──
 
@@ -257,3 +395,10 @@ class ScholixClient(BaseResourceClient):
         """Alias for ``iterate_links`` so ``collect``/``count`` can find it."""
         async for link in self.iterate_links(page_size=page_size, filters=filters):
             yield link
+
+
+def _unwrap_links(data: Any) -> list[dict[str, Any]]:
+    """The ``result`` list of a decoded Scholix response."""
+    if not isinstance(data, dict):
+        raise ValueError(f"Response JSON must be a dictionary, got {type(data)}")
+    return data.get("result") or []
@@ -131,7 +131,7 @@ class AireloomSession:
         Returns a ``_QueryAccessor`` bound to this session so you can call any
         convenience function without passing the session explicitly::
 
-            papers = await session.queries.publications_by_doi(
+            papers, missing = await session.queries.publications_by_doi(
                 "10.1234/..."
             )
         """
@@ -6,10 +6,17 @@ protocol from bibliofabric, enabling the generic framework to work with
 OpenAIRE's specific JSON response structure.
 """
 
+import json
+import re
 from typing import Any
 
 from bibliofabric.models import ResponseUnwrapper
 
+from ._decoding import decode_json
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
 
 class OpenAireUnwrapper(ResponseUnwrapper):
     """OpenAIRE-specific implementation of the ResponseUnwrapper protocol.
@@ -34,6 +41,8 @@ class OpenAireUnwrapper(ResponseUnwrapper):
 
     The unwrapper extracts the relevant information from this structure
     to enable generic pagination and result handling in the bibliofabric framework.
+    :meth:`unwrap_header` reads just the header from a raw response body, for
+    callers such as ``count()`` that have no use for the results.
     """
 
     def unwrap_results(self, response_json: dict[str, Any]) -> list[dict[str, Any]]:
@@ -142,3 +151,46 @@ class OpenAireUnwrapper(ResponseUnwrapper):
             return int(num_found)
         except (ValueError, TypeError):
             return None
+
+    def unwrap_header(self, raw: bytes | str) -> dict[str, Any]:
+        """Decode only the "header" object of a raw OpenAIRE response body.
+
+        OpenAIRE serializes the header before the results, so the header is
+        decoded on its own and the (possibly large) results array is never
+        parsed. Bodies in which "header" is not the first key are decoded
+        in full.
+
+        Args:
+            raw: The undecoded response body.
+
+        Returns:
+            dict[str, Any]: The header, or an empty dict if there is none.
+
+        Raises:
+            ValueError: If the body is not a JSON object.
+        """
+        text = raw.decode() if isinstance(raw, bytes) else raw
+        pos = _skip_whitespace(text, 0)
+        if text.startswith("{", pos):
+            pos = _skip_whitespace(text, pos + 1)
+            if text.startswith('"header"', pos):
+                pos = _skip_whitespace(text, pos + len('"header"'))
+                if text.startswith(":", pos):
+                    pos = _skip_whitespace(text, pos + 1)
+                    header, _ = _DECODER.raw_decode(text, pos)
+                    return header if isinstance(header, dict) else {}
+
+        response_json = decode_json(text)
+        if not isinstance(response_json, dict):
+            raise ValueError(
+                f"Response JSON must be a dictionary, got {type(response_json)}"
+            )
+        header = response_json.get("header")
+        return header if isinstance(header, dict) else {}
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    """Return the index of the first non-whitespace character from *pos*."""
+    match = _WHITESPACE.match(text, pos)
+    assert match is not None  # the pattern also matches the empty string
+    return match.end()
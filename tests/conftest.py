@@ -1,6 +1,11 @@
 # tests/conftest.py
+import asyncio
 import os
+from collections.abc import Awaitable, Callable
+from typing import Any
+from unittest.mock import AsyncMock
 
+import httpx
 import pytest
 from dotenv import load_dotenv
 
@@ -13,3 +18,35 @@ load_dotenv()
 def api_token() -> str | None:
     """Fixture to provide the OpenAIRE API token from environment variables."""
     return os.getenv("AIRELOOM_OPENAIRE_API_TOKEN")
+
+
+@pytest.fixture
+def paged_request():
+    """Factory for a fake ``AireloomClient.request`` serving numbered pages.
+
+    ``paged_request(total_pages, probe, body)`` returns a coroutine function
+    that answers ``params["page"]`` with ``body(page)`` as its JSON. Later
+    pages answer faster, so out-of-order completion shows up, and *probe*
+    tracks the requests ``"in_flight"`` and their ``"peak"``.
+    """
+
+    def factory(
+        total_pages: int,
+        probe: dict[str, int],
+        body: Callable[[int], dict[str, Any]],
+    ) -> Callable[..., Awaitable[httpx.Response]]:
+        async def request(*, params, **kwargs):
+            probe["in_flight"] += 1
+            probe["peak"] = max(probe["peak"], probe["in_flight"])
+            try:
+                page = params["page"]
+                await asyncio.sleep(0.002 * (total_pages - page))
+                response = AsyncMock(spec=httpx.Response)
+                response.json.return_value = body(page)
+                return response
+            finally:
+                probe["in_flight"] -= 1
+
+        return request
+
+    return factory
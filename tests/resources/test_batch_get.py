@@ -3,21 +3,30 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from dataclasses import dataclass, field
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from bibliofabric.exceptions import APIError, RateLimitError
 
+from aireloom.resources import NegativeCache
 from aireloom.resources._batch import (
     BATCH_GET_SIZE,
+    CHUNK_PAGE_SIZE,
+    BatchGetError,
     BatchMixin,
+    _ChunkSizer,
     _extract_results,
-    _match_pid_entity,
     _normalize_id,
     _resolve_key,
 )
-
+from aireloom.resources._identifiers import (
+    IdentifierIndex,
+    canonical_id,
+    identifier_kind,
+)
 
 # ── Simple test entities ──────────────────────────────────────────────────
 
@@ -85,50 +94,101 @@ class TestExtractResults:
 class TestResolveKey:
     def test_id_filter(self):
         entity = FakeEntity(id="doi_dedup___::abc123")
-        key = _resolve_key(entity, "id", None, [])
+        key = _resolve_key(entity, "id", None, IdentifierIndex())
         assert key == "doi_dedup___::abc123"
 
+    def test_id_filter_returns_caller_spelling(self):
+        entity = FakeEntity(id="doi_dedup___::abc123")
+        index = IdentifierIndex(["DOI_DEDUP___::ABC123"])
+        assert _resolve_key(entity, "id", None, index) == "DOI_DEDUP___::ABC123"
+
     def test_code_filter(self):
         entity = FakeEntity(code="894010")
-        key = _resolve_key(entity, "code", None, [])
+        key = _resolve_key(entity, "code", None, IdentifierIndex())
         assert key == "894010"
 
     def test_pid_filter_matches_input(self):
         entity = FakeEntity(pids=[FakePid("doi", "10.1038/nature12373")])
-        key = _resolve_key(
-            entity, "pid", None, ["10.1038/nature12373", "10.1038/nature12374"]
-        )
+        index = IdentifierIndex(["10.1038/nature12373", "10.1038/nature12374"])
+        key = _resolve_key(entity, "pid", None, index)
         assert key == "10.1038/nature12373"
 
     def test_originalId_filter(self):
         entity = FakeEntity(originalIds=["0000-0002-3411-2884"])
-        key = _resolve_key(entity, "originalId", None, [])
+        key = _resolve_key(entity, "originalId", None, IdentifierIndex())
         assert key == "0000-0002-3411-2884"
 
     def test_custom_key_fn(self):
         entity = FakeEntity(id="abc")
-        key = _resolve_key(entity, "anything", lambda e: "custom", [])
+        key = _resolve_key(entity, "anything", lambda e: "custom", IdentifierIndex())
         assert key == "custom"
 
 
-# ── Unit tests: _match_pid_entity ─────────────────────────────────────────
-
-
-class TestMatchPidEntity:
+# ── Unit tests: IdentifierIndex ───────────────────────────────────────────
+
+
+class TestCanonicalId:
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("https://dx.doi.org/10.1038/X", "10.1038/x"),
+            ("doi:10.1038/x", "10.1038/x"),
+            ("https://orcid.org/0000-0002-3411-2884", "0000-0002-3411-2884"),
+            ("http://hdl.handle.net/2066/123", "2066/123"),
+            ("hdl:2066/123", "2066/123"),
+        ],
+    )
+    def test_prefixes_stripped(self, raw, expected):
+        assert canonical_id(raw) == expected
+
+
+class TestIdentifierKind:
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            ("doi_dedup___::0123456789abcdef0123456789abcdef", "openaire_id"),
+            ("50|od______1234::0123456789abcdef0123456789abcdef", "openaire_id"),
+            ("10.1038/nature12373", "doi"),
+            ("https://doi.org/10.1038/X", "doi"),
+            ("0000-0002-3411-288X", "pid"),
+            ("https://ror.org/04wxnsj81", "pid"),
+            ("hdl:2066/123", "pid"),
+            ("oai:arXiv.org:1234.5678", "other"),
+            ("101017201", "other"),
+        ],
+    )
+    def test_kinds(self, raw, expected):
+        assert identifier_kind(raw) == expected
+
+
+class TestIdentifierIndex:
     def test_match_from_pids(self):
         entity = FakeEntity(pids=[FakePid("doi", "10.1038/nature12373")])
-        result = _match_pid_entity(entity, ["10.1038/nature12373", "10.1038/other"])
-        assert result == "10.1038/nature12373"
+        index = IdentifierIndex(["10.1038/nature12373", "10.1038/other"])
+        assert index.match(entity) == "10.1038/nature12373"
 
-    def test_match_doi_url_normalized(self):
+    def test_match_returns_caller_spelling(self):
         entity = FakeEntity(pids=[FakePid("doi", "10.1038/nature12373")])
-        result = _match_pid_entity(entity, ["https://doi.org/10.1038/nature12373"])
-        assert result == "10.1038/nature12373"
+        index = IdentifierIndex(["https://doi.org/10.1038/NATURE12373"])
+        assert index.match(entity) == "https://doi.org/10.1038/NATURE12373"
+
+    def test_match_from_original_ids(self):
+        entity = FakeEntity(originalIds=["oai:repo:1", "50|od_____::abc"])
+        assert IdentifierIndex(["50|od_____::ABC"]).match(entity) == "50|od_____::ABC"
+
+    def test_match_from_raw_dict(self):
+        entity = {"id": "x", "pids": [{"scheme": "doi", "value": "10.1/a"}]}
+        assert IdentifierIndex(["doi:10.1/A"]).match(entity) == "doi:10.1/A"
 
     def test_no_match(self):
         entity = FakeEntity(pids=[FakePid("doi", "10.1038/other")])
-        result = _match_pid_entity(entity, ["10.1038/nature12373"])
-        assert result is None
+        assert IdentifierIndex(["10.1038/nature12373"]).match(entity) is None
+
+    def test_first_spelling_wins(self):
+        index = IdentifierIndex(["10.1/A", "https://doi.org/10.1/a"])
+        assert len(index) == 1
+        assert index.lookup("10.1/a") == "10.1/A"
+        assert "doi:10.1/a" in index
 
 
 # ── Integration tests: BatchMixin.batch_get ───────────────────────────────
@@ -202,6 +262,19 @@ class TestBatchGet:
         )
         assert len(result) == 2
 
+    @pytest.mark.asyncio
+    async def test_batch_get_keys_use_caller_spelling(self):
+        class _NormalizingClient(_FakeClient):
+            async def search(self, page=1, page_size=20, filters=None, **kwargs):
+                pids = [
+                    p.lower().removeprefix("doi:") for p in filters["pid"].split(",")
+                ]
+                return await super().search(page, page_size, {"pid": ",".join(pids)})
+
+        client = _NormalizingClient()
+        result = await client.batch_get(["doi:10.1038/ABC", "10.1038/def"])
+        assert set(result) == {"doi:10.1038/ABC", "10.1038/def"}
+
     @pytest.mark.asyncio
     async def test_batch_size_clamped(self):
         client = _FakeClient()
@@ -211,6 +284,569 @@ class TestBatchGet:
         assert len(result) == 1
 
 
+class _ConcurrencyProbeClient(_FakeClient):
+    """Fake client that records how many searches run at the same time."""
+
+    def __init__(self, fail_on: str | None = None):
+        self.in_flight = 0
+        self.peak = 0
+        self.fail_on = fail_on
+
+    async def search(self, page=1, page_size=20, filters=None, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail_on and self.fail_on in (filters or {}).get("pid", ""):
+                raise RuntimeError("boom")
+            return await super().search(page, page_size, filters, **kwargs)
+        finally:
+            self.in_flight -= 1
+
+
+class TestBatchGetConcurrency:
+    @pytest.mark.asyncio
+    async def test_serial_by_default(self):
+        client = _ConcurrencyProbeClient()
+        dois = [f"10.1038/n{i}" for i in range(35)]
+        result = await client.batch_get(dois)
+        assert len(result) == 35
+        assert client.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_bounds_in_flight(self):
+        client = _ConcurrencyProbeClient()
+        dois = [f"10.1038/n{i}" for i in range(95)]
+        result = await client.batch_get(dois, max_concurrency=3)
+        assert len(result) == 95
+        assert client.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_results_merged_in_chunk_order(self):
+        client = _ConcurrencyProbeClient()
+        dois = [f"10.1038/n{i}" for i in range(25)]
+        result = await client.batch_get(dois, max_concurrency=4)
+        assert list(result) == dois
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_reports_partial_results(self):
+        client = _ConcurrencyProbeClient(fail_on="10.1038/n12")
+        dois = [f"10.1038/n{i}" for i in range(30)]
+        with pytest.raises(BatchGetError) as exc_info:
+            await client.batch_get(dois, max_concurrency=3)
+        err = exc_info.value
+        assert len(err.results) == 20
+        assert [f.index for f in err.failures] == [1]
+        assert err.failures[0].identifiers == dois[10:20]
+        assert isinstance(err.failures[0].error, RuntimeError)
+
+
+class _PoisonClient(_FakeClient):
+    """Fake client whose search rejects any filter containing *poison*."""
+
+    def __init__(self, poison: str, error: Exception | None = None):
+        self.poison = poison
+        self.error = error or APIError("400 Bad Request")
+        self.calls: list[list[str]] = []
+
+    async def search(self, page=1, page_size=20, filters=None, **kwargs):
+        values = (filters or {}).get("pid", "").split(",")
+        self.calls.append(values)
+        if self.poison in values:
+            raise self.error
+        return await super().search(page, page_size, filters, **kwargs)
+
+
+class TestAdaptiveChunks:
+    @pytest.mark.asyncio
+    async def test_bad_identifier_isolated_by_bisection(self):
+        client = _PoisonClient("bad")
+        ids = [f"10.1038/n{i}" for i in range(9)] + ["bad"]
+        with pytest.raises(BatchGetError) as exc_info:
+            await client.batch_get(ids)
+        err = exc_info.value
+        assert len(err.results) == 9
+        assert [f.identifiers for f in err.failures] == [["bad"]]
+        assert isinstance(err.failures[0].error, APIError)
+
+    @pytest.mark.asyncio
+    async def test_split_on_failure_disabled(self):
+        client = _PoisonClient("bad")
+        ids = ["10.1038/a", "bad"]
+        with pytest.raises(BatchGetError) as exc_info:
+            await client.batch_get(ids, split_on_failure=False)
+        assert exc_info.value.failures[0].identifiers == ids
+        assert client.calls == [ids]
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_not_split(self):
+        client = _PoisonClient("bad", RateLimitError("429 Too Many Requests"))
+        ids = ["10.1038/a", "bad", "10.1038/c"]
+        with pytest.raises(BatchGetError) as exc_info:
+            await client.batch_get(ids)
+        assert exc_info.value.failures[0].identifiers == ids
+        assert len(client.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_survivors_before_raising(self):
+        client = _PoisonClient("bad")
+        ids = ["10.1038/a", "bad", "10.1038/c"]
+        keys = []
+        with pytest.raises(BatchGetError):
+            async for key, _ in client.batch_stream(ids):
+                keys.append(key)
+        assert sorted(keys) == ["10.1038/a", "10.1038/c"]
+
+        # Chunks after a failed one are still dispatched and yielded, and
+        # every failure is reported at the end.
+        ids = ["10.1038/a", "bad", "10.1038/c", "bad", "10.1038/e"]
+        keys = []
+        with pytest.raises(BatchGetError) as exc_info:
+            async for key, _ in client.batch_stream(
+                ids, batch_size=1, split_on_failure=False
+            ):
+                keys.append(key)
+        assert keys == ["10.1038/a", "10.1038/c", "10.1038/e"]
+        assert [f.index for f in exc_info.value.failures] == [1, 3]
+
+    @pytest.mark.asyncio
+    async def test_long_identifiers_capped_by_url_length(self):
+        client = _PoisonClient("never")
+        ids = [f"oai:repo.example.org:{'x' * 600}{i}" for i in range(6)]
+        result = await client.batch_get(ids)
+        assert len(result) == 6
+        assert all(len(call) < 6 for call in client.calls)
+
+
+class TestChunkSizer:
+    def test_failure_halves_and_success_grows(self):
+        sizer = _ChunkSizer(8)
+        sizer.record_failure()
+        sizer.record_failure()
+        assert sizer.size == 2
+        sizer.record_success(0.1)
+        assert sizer.size == 3
+
+    def test_slow_success_shrinks(self):
+        sizer = _ChunkSizer(slow_seconds=1.0)
+        sizer.record_success(2.0)
+        assert sizer.size == BATCH_GET_SIZE - 1
+
+    def test_size_never_exceeds_hard_cap(self):
+        sizer = _ChunkSizer(50)
+        sizer.record_success(0.0)
+        assert sizer.size == BATCH_GET_SIZE
+
+    def test_chunks_follow_current_size(self):
+        sizer = _ChunkSizer(4)
+        chunks = sizer.chunks(str(i) for i in range(10))
+        assert next(chunks) == ["0", "1", "2", "3"]
+        sizer.record_failure()
+        assert next(chunks) == ["4", "5"]
+
+    def test_chunks_respect_encoded_length(self):
+        sizer = _ChunkSizer(max_value_length=20)
+        assert list(sizer.chunks(["a/b/c", "d/e/f", "g"])) == [
+            ["a/b/c"],
+            ["d/e/f", "g"],
+        ]
+
+
+class TestBatchStream:
+    @pytest.mark.asyncio
+    async def test_streams_all_pairs(self):
+        client = _ConcurrencyProbeClient()
+        dois = [f"10.1038/n{i}" for i in range(23)]
+        pairs = [pair async for pair in client.batch_stream(dois, max_concurrency=2)]
+        assert sorted(key for key, _ in pairs) == sorted(dois)
+        assert all(entity.pids[0].value == key for key, entity in pairs)
+
+    @pytest.mark.asyncio
+    async def test_accepts_lazy_iterable(self):
+        client = _ConcurrencyProbeClient()
+        dois = (f"10.1038/n{i}" for i in range(12))
+        pairs = [pair async for pair in client.batch_stream(dois)]
+        assert len(pairs) == 12
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_holds_back_dispatch(self):
+        client = _ConcurrencyProbeClient()
+        started = 0
+        original = client.search
+
+        async def counting_search(*args, **kwargs):
+            nonlocal started
+            started += 1
+            return await original(*args, **kwargs)
+
+        client.search = counting_search
+        dois = (f"10.1038/n{i}" for i in range(1000))
+        stream = client.batch_stream(dois, max_concurrency=2)
+        await anext(stream)
+        await asyncio.sleep(0.05)
+        # Two in flight, plus one refilled when the first chunk was consumed.
+        assert started <= 3
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_closing_early_cancels_in_flight_chunks(self):
+        client = _ConcurrencyProbeClient()
+        dois = (f"10.1038/n{i}" for i in range(1000))
+        stream = client.batch_stream(dois, max_concurrency=3)
+        await anext(stream)
+        await asyncio.sleep(0)
+        assert client.in_flight > 0
+
+        await stream.aclose()
+
+        assert client.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_raises(self):
+        client = _ConcurrencyProbeClient(fail_on="10.1038/n3")
+        dois = [f"10.1038/n{i}" for i in range(5)]
+        with pytest.raises(BatchGetError) as exc_info:
+            async for _ in client.batch_stream(dois, batch_size=2):
+                pass
+        assert exc_info.value.failures[0].identifiers == ["10.1038/n2", "10.1038/n3"]
+
+
+class TestBatchLoader:
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_are_coalesced(self):
+        client = _ConcurrencyProbeClient()
+        client.search = AsyncMock(side_effect=client.search)
+        loader = client.loader("doi")
+        dois = [f"10.1038/n{i}" for i in range(25)]
+        entities = await asyncio.gather(*(loader.load(d) for d in dois))
+        assert [e.pids[0].value for e in entities] == dois
+        assert client.search.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_identical_keys_deduplicated(self):
+        client = _ConcurrencyProbeClient()
+        client.search = AsyncMock(side_effect=client.search)
+        loader = client.loader("doi")
+        a, b, c = await asyncio.gather(
+            loader.load("10.1038/x"),
+            loader.load("https://doi.org/10.1038/X"),
+            loader.load("10.1038/x"),
+        )
+        assert a is b is c
+        assert client.search.await_count == 1
+        assert client.search.call_args.kwargs["filters"] == {"pid": "10.1038/x"}
+
+    @pytest.mark.asyncio
+    async def test_missing_key_resolves_to_none(self):
+        client = _FakeClient()
+        client.search = AsyncMock(return_value={"results": []})
+        assert await client.loader("doi").load("10.1038/missing") is None
+
+    @pytest.mark.asyncio
+    async def test_failed_chunk_propagates_to_waiters(self):
+        client = _ConcurrencyProbeClient(fail_on="10.1038/bad")
+        loader = client.loader("doi", batch_size=1)
+        good, bad = await asyncio.gather(
+            loader.load("10.1038/good"),
+            loader.load("10.1038/bad"),
+            return_exceptions=True,
+        )
+        assert good.pids[0].value == "10.1038/good"
+        assert isinstance(bad, BatchGetError)
+
+    @pytest.mark.asyncio
+    async def test_load_many_preserves_order(self):
+        loader = _FakeClient().loader("openaire_id")
+        ids = ["doi_dedup___::b", "doi_dedup___::a"]
+        assert [e.id for e in await loader.load_many(ids)] == ids
+
+    def test_unknown_field_rejected(self):
+        with pytest.raises(ValueError, match="cannot batch on 'code'"):
+            _FakeClient().loader("code")
+
+
+# ── Mixed-identifier resolution ───────────────────────────────────────────
+
+_DEDUP_ID = "doi_dedup___::0123456789abcdef0123456789abcdef"
+
+
+class _MixedClient(_FakeClient):
+    """Fake client that also answers ``originalId`` and records its calls."""
+
+    _batch_fields = {"doi": "pid", "openaire_id": "id", "original_id": "originalId"}
+
+    def __init__(self):
+        self.calls: list[dict[str, str]] = []
+
+    async def search(self, page=1, page_size=20, filters=None, **kwargs):
+        self.calls.append(filters)
+        if "originalId" in filters:
+            values = filters["originalId"].split(",")
+            return {
+                "results": [
+                    FakeEntity(id=f"od::{v}", originalIds=[v])
+                    for v in values
+                    if v != "oai:repo:missing"
+                ]
+            }
+        return await super().search(page, page_size, filters, **kwargs)
+
+
+class TestResolveMany:
+    @pytest.mark.asyncio
+    async def test_routes_and_merges(self):
+        client = _MixedClient()
+        ids = [
+            "oai:repo:1",
+            "https://doi.org/10.1038/A",
+            _DEDUP_ID,
+            "oai:repo:missing",
+            "10.1038/b",
+        ]
+        result = await client.resolve_many(ids)
+        assert list(result) == [
+            "oai:repo:1",
+            "https://doi.org/10.1038/A",
+            _DEDUP_ID,
+            "10.1038/b",
+        ]
+        assert sorted(next(iter(c)) for c in client.calls) == [
+            "id",
+            "originalId",
+            "pid",
+        ]
+        assert {"pid": "https://doi.org/10.1038/A,10.1038/b"} in client.calls
+
+    @pytest.mark.asyncio
+    async def test_groups_run_concurrently(self):
+        client = _ConcurrencyProbeClient()
+        ids = ["10.1038/a", _DEDUP_ID]
+        await client.resolve_many(ids)
+        assert client.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_merged_across_groups(self):
+        client = _PoisonClient("10.1038/bad")
+        with pytest.raises(BatchGetError) as exc_info:
+            await client.resolve_many(["10.1038/bad", _DEDUP_ID])
+        err = exc_info.value
+        assert list(err.results) == [_DEDUP_ID]
+        assert [f.identifiers for f in err.failures] == [["10.1038/bad"]]
+
+    def test_fallback_follows_available_fields(self):
+        class Projects(BatchMixin):
+            _batch_fields = {"code": "code", "openaire_id": "id"}
+
+        assert Projects()._classify_identifier("101017201") == "code"
+        assert Projects()._classify_identifier("10.1038/a") == "code"
+        assert _FakeClient()._classify_identifier("oai:repo:1") == "pid"
+
+
+# ── Negative cache tests ──────────────────────────────────────────────────
+
+
+class _Clock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _SparseClient(_FakeClient):
+    """Fake client that only knows DOIs ending in an even digit."""
+
+    def __init__(self):
+        self.sent: list[str] = []
+
+    async def search(self, page=1, page_size=20, filters=None, **kwargs):
+        values = filters["pid"].split(",")
+        self.sent.extend(values)
+        known = ",".join(v for v in values if int(v[-1]) % 2 == 0)
+        if not known:
+            return {"results": []}
+        return await super().search(page, page_size, {"pid": known}, **kwargs)
+
+
+class _DuplicateClient(_FakeClient):
+    """Fake client where every DOI matches *copies* records, served in pages.
+
+    With *served* set, no more than that many records are ever returned,
+    however large ``numFound`` is.
+    """
+
+    def __init__(self, copies: int = 2, served: int | None = None):
+        self.copies = copies
+        self.served = served
+        self.page_sizes: list[int] = []
+
+    async def search(self, page=1, page_size=20, filters=None, **kwargs):
+        self.page_sizes.append(page_size)
+        records = [
+            FakeEntity(id=f"rec{n}::{doi}", pids=[FakePid("doi", doi)])
+            for doi in filters["pid"].split(",")
+            for n in range(self.copies)
+        ]
+        available = records[: self.served] if self.served is not None else records
+        start = (page - 1) * page_size
+        return {
+            "header": {"numFound": len(records)},
+            "results": available[start : start + page_size],
+        }
+
+
+class TestNegativeCache:
+    def test_expiry(self):
+        clock = _Clock()
+        cache = NegativeCache(ttl=10, clock=clock)
+        cache.add("pid", ["10.1/A"])
+        assert cache.contains("pid", "https://doi.org/10.1/a")
+        assert not cache.contains("originalId", "10.1/a")
+        clock.now += 11
+        assert not cache.contains("pid", "10.1/a")
+        assert len(cache) == 0
+
+    def test_stats(self):
+        cache = NegativeCache()
+        cache.add("pid", ["x"])
+        cache.contains("pid", "x")
+        cache.contains("pid", "y")
+        cache.contains("pid", "z")
+        assert (cache.hits, cache.misses) == (1, 2)
+        assert cache.hit_rate == pytest.approx(1 / 3)
+
+    def test_rejects_non_positive_ttl(self):
+        with pytest.raises(ValueError, match="ttl"):
+            NegativeCache(ttl=0)
+
+    def test_round_trips_through_disk(self, tmp_path):
+        path = tmp_path / "sub" / "missing.json"
+        clock = _Clock()
+        cache = NegativeCache(ttl=10, path=path, clock=clock)
+        cache.add("pid", ["10.1/a", "10.1/b"])
+        clock.now += 5
+        cache.add("pid", ["10.1/c"])
+
+        clock.now += 6  # a and b expired, c still valid
+        reloaded = NegativeCache(ttl=10, path=path, clock=clock)
+        assert len(reloaded) == 1
+        assert reloaded.contains("pid", "10.1/c")
+        assert list(tmp_path.joinpath("sub").iterdir()) == [path]
+
+    def test_unreadable_file_ignored(self, tmp_path):
+        path = tmp_path / "missing.json"
+        path.write_text("{not json")
+        assert len(NegativeCache(path=path)) == 0
+        path.write_text(json.dumps({"version": 99, "entries": {}}))
+        assert len(NegativeCache(path=path)) == 0
+
+    def test_save_requires_path(self):
+        with pytest.raises(ValueError, match="no backing path"):
+            NegativeCache().save()
+
+
+class TestBatchWithNegativeCache:
+    @pytest.mark.asyncio
+    async def test_missing_ids_skipped_on_next_call(self):
+        client = _SparseClient()
+        client.negative_cache = NegativeCache()
+        dois = [f"10.1/n{i}" for i in range(6)]
+
+        first = await client.batch_get(dois)
+        assert sorted(first) == ["10.1/n0", "10.1/n2", "10.1/n4"]
+        assert len(client.negative_cache) == 3
+
+        client.sent.clear()
+        second = await client.batch_get(dois)
+        assert second == first
+        assert client.sent == ["10.1/n0", "10.1/n2", "10.1/n4"]
+        assert client.negative_cache.hits == 3
+
+    @pytest.mark.asyncio
+    async def test_file_backed_cache_saved_once_per_call(self, tmp_path):
+        client = _SparseClient()
+        client.negative_cache = NegativeCache(path=tmp_path / "missing.json")
+        saves = MagicMock(wraps=client.negative_cache.save)
+        client.negative_cache.save = saves
+        dois = [f"10.1/n{i}" for i in range(9)]
+
+        await client.batch_get(dois, batch_size=2)
+        assert saves.call_count == 1
+        _ = [p async for p in client.batch_stream(["10.1/x1", "10.1/x3"], batch_size=1)]
+        assert saves.call_count == 2
+
+        reloaded = NegativeCache(path=tmp_path / "missing.json")
+        assert len(reloaded) == 6
+
+    @pytest.mark.asyncio
+    async def test_stream_records_missing_when_closed_early(self):
+        client = _SparseClient()
+        client.negative_cache = NegativeCache()
+        stream = client.batch_stream(["10.1/n1", "10.1/n2", "10.1/n4"], batch_size=2)
+        await anext(stream)
+        await stream.aclose()
+        assert client.negative_cache.contains("pid", "10.1/n1")
+
+    @pytest.mark.asyncio
+    async def test_stream_records_missing(self):
+        client = _SparseClient()
+        client.negative_cache = NegativeCache()
+        pairs = [p async for p in client.batch_stream(["10.1/n1", "10.1/n2"])]
+        assert [key for key, _ in pairs] == ["10.1/n2"]
+        assert client.negative_cache.contains("pid", "10.1/n1")
+
+    @pytest.mark.asyncio
+    async def test_failed_ids_not_cached(self):
+        client = _PoisonClient("bad")
+        client.negative_cache = NegativeCache()
+        with pytest.raises(BatchGetError):
+            await client.batch_get(["10.1/a", "bad"])
+        assert len(client.negative_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_several_records_per_identifier_not_cached(self):
+        client = _DuplicateClient(copies=2)
+        client.negative_cache = NegativeCache()
+        dois = [f"10.1/d{i}" for i in range(10)]
+
+        result = await client.batch_get(dois)
+
+        assert sorted(result) == sorted(dois)
+        assert len(client.negative_cache) == 0
+        assert set(client.page_sizes) == {CHUNK_PAGE_SIZE}
+
+    @pytest.mark.asyncio
+    async def test_pages_followed_until_num_found(self):
+        client = _DuplicateClient(copies=15)
+        client.negative_cache = NegativeCache()
+        dois = [f"10.1/d{i}" for i in range(10)]
+
+        pairs = [p async for p in client.batch_stream(dois)]
+
+        assert len(pairs) == 150
+        assert len(client.page_sizes) == 2
+        assert len(client.negative_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_truncated_chunk_not_cached(self):
+        client = _DuplicateClient(copies=2, served=5)
+        client.negative_cache = NegativeCache()
+        dois = [f"10.1/d{i}" for i in range(10)]
+
+        result = await client.batch_get(dois)
+
+        assert len(result) == 3
+        assert len(client.negative_cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_custom_key_fn_does_not_poison_cache(self):
+        client = _SparseClient()
+        client.negative_cache = NegativeCache()
+        result = await client.batch_get(["10.1/n2"], key_fn=lambda e: e.id)
+        assert len(result) == 1
+        assert len(client.negative_cache) == 0
+
+
 # ── Auto-generation tests ─────────────────────────────────────────────────
 
 
@@ -0,0 +1,78 @@
+"""Tests for iteration checkpoints."""
+
+from __future__ import annotations
+
+import json
+
+from aireloom.resources import Checkpoint, CheckpointStore, FileCheckpointStore
+from aireloom.resources._checkpoint import (
+    CheckpointTracker,
+    as_checkpoint_store,
+    query_fingerprint,
+)
+
+
+class _MemoryStore:
+    def __init__(self, saved: Checkpoint | None = None):
+        self.saved = saved
+
+    def load(self) -> Checkpoint | None:
+        return self.saved
+
+    def save(self, checkpoint: Checkpoint) -> None:
+        self.saved = checkpoint
+
+    def clear(self) -> None:
+        self.saved = None
+
+
+class TestFileCheckpointStore:
+    def test_round_trip_and_clear(self, tmp_path):
+        store = FileCheckpointStore(tmp_path / "run" / "ckpt.json")
+        assert store.load() is None
+        store.save(Checkpoint("abc", "cursor-2", 200))
+        assert FileCheckpointStore(store.path).load() == Checkpoint(
+            "abc", "cursor-2", 200
+        )
+        assert [p.name for p in store.path.parent.iterdir()] == ["ckpt.json"]
+        store.clear()
+        assert not store.path.exists()
+        store.clear()  # clearing twice is harmless
+
+    def test_corrupt_file_ignored(self, tmp_path):
+        path = tmp_path / "ckpt.json"
+        path.write_text("{")
+        assert FileCheckpointStore(path).load() is None
+        path.write_text(json.dumps({"unexpected": 1}))
+        assert FileCheckpointStore(path).load() is None
+
+
+class TestCheckpointHelpers:
+    def test_paths_become_file_stores(self, tmp_path):
+        assert isinstance(as_checkpoint_store(tmp_path / "x"), FileCheckpointStore)
+        memory = _MemoryStore()
+        assert isinstance(memory, CheckpointStore)
+        assert as_checkpoint_store(memory) is memory
+        assert as_checkpoint_store(None) is None
+
+    def test_fingerprint_is_order_independent(self):
+        a = query_fingerprint("links", {"x": 1, "y": [1, 2]})
+        assert a == query_fingerprint("links", {"y": [1, 2], "x": 1})
+        assert a != query_fingerprint("links", {"x": 2, "y": [1, 2]})
+        assert a != query_fingerprint("other", {"x": 1, "y": [1, 2]})
+
+    def test_tracker_ignores_foreign_checkpoint(self):
+        store = _MemoryStore(Checkpoint("other", "c9", 900))
+        tracker = CheckpointTracker(store, "mine")
+        assert tracker.resume() is None
+        tracker.page_done(10, "c1")
+        assert store.saved == Checkpoint("mine", "c1", 10)
+
+    def test_tracker_resumes_item_count(self):
+        store = _MemoryStore(Checkpoint("mine", 4, 300))
+        tracker = CheckpointTracker(store, "mine")
+        assert tracker.resume() == 4
+        tracker.page_done(100, 5)
+        assert store.saved == Checkpoint("mine", 5, 400)
+        tracker.finish()
+        assert store.saved is None
@@ -0,0 +1,171 @@
+"""Tests for grouped counts."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from bibliofabric.exceptions import BibliofabricError
+
+from aireloom.client import AireloomClient
+from aireloom.endpoints import ResearchProductsFilters
+from aireloom.resources import CountCache, ResearchProductsClient
+from aireloom.unwrapper import OpenAireUnwrapper
+
+
+class _FakeCounts:
+    """Answers count probes with a number derived from the filters."""
+
+    def __init__(self):
+        self.calls: list[dict] = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def request(self, method, path, *, params, base_url_override=None):
+        self.calls.append(params)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            total = len(str(params.get("type", ""))) + int(
+                str(params.get("fromPublicationDate", "0"))[:4]
+            )
+            response = AsyncMock(spec=httpx.Response)
+            response.json.return_value = {
+                "header": {"numFound": total, "page": 1, "pageSize": 1},
+                "results": [],
+            }
+            return response
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def fake() -> _FakeCounts:
+    return _FakeCounts()
+
+
+@pytest.fixture
+def products(fake: _FakeCounts) -> ResearchProductsClient:
+    api = AsyncMock(spec=AireloomClient)
+    api._response_unwrapper = OpenAireUnwrapper()
+    api.request.side_effect = fake.request
+    return ResearchProductsClient(api_client=api)
+
+
+@pytest.mark.asyncio
+async def test_groups_by_literal_filter_values(products, fake):
+    counts = await products.count_grouped(
+        ResearchProductsFilters(countryCode="NL"), by="type"
+    )
+
+    assert counts == {"publication": 11, "dataset": 7, "software": 8, "other": 5}
+    assert all(call["countryCode"] == "NL" for call in fake.calls)
+    assert all(call["pageSize"] == 1 for call in fake.calls)
+
+
+@pytest.mark.asyncio
+async def test_groups_by_year_concurrently(products, fake):
+    counts = await products.count_grouped(
+        by="year", buckets=range(2015, 2025), max_concurrency=3
+    )
+
+    assert list(counts) == list(range(2015, 2025))
+    assert counts[2020] == 2020
+    assert fake.peak == 3
+    call = next(c for c in fake.calls if c["fromPublicationDate"] == "2020-01-01")
+    assert call["toPublicationDate"] == "2020-12-31"
+
+
+@pytest.mark.asyncio
+async def test_year_buckets_intersect_the_base_range(products, fake):
+    filters = ResearchProductsFilters(
+        fromPublicationDate="2019-06-01", toPublicationDate="2020-06-30"
+    )
+
+    counts = await products.count_grouped(
+        filters, by="year", buckets=[2018, 2019, 2020, 2021]
+    )
+
+    assert counts == {2018: 0, 2019: 2019, 2020: 2020, 2021: 0}
+    windows = sorted(
+        (c["fromPublicationDate"], c["toPublicationDate"]) for c in fake.calls
+    )
+    assert windows == [("2019-06-01", "2019-12-31"), ("2020-01-01", "2020-06-30")]
+
+
+@pytest.mark.asyncio
+async def test_known_and_boolean_buckets(products, fake):
+    assert list(await products.count_grouped(by="influenceClass")) == [
+        "C1",
+        "C2",
+        "C3",
+        "C4",
+        "C5",
+    ]
+    assert list(await products.count_grouped(by="isGreen")) == [True, False]
+    assert "OPEN" in await products.count_grouped(by="bestOpenAccessRightLabel")
+
+
+@pytest.mark.asyncio
+async def test_repeated_counts_are_cached(products, fake):
+    products.count_cache = CountCache(ttl=60)
+    await products.count_grouped(by="type")
+    await products.count_grouped(by="type", buckets=["dataset", "thesis"])
+
+    assert len(fake.calls) == 5
+    assert products.count_cache.hits == 1
+
+    await products.count_grouped(by="type", refresh=True)
+    assert len(fake.calls) == 9
+
+
+def test_count_cache_expires():
+    now = [0.0]
+    cache = CountCache(ttl=10, clock=lambda: now[0])
+    cache.put("k", 3)
+    assert cache.get("k") == 3
+    now[0] = 11
+    assert cache.get("k") is None
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_invalid_dimension(products):
+    with pytest.raises(ValueError, match="buckets="):
+        await products.count_grouped(by="publisher")
+    with pytest.raises(ValueError, match="not a filter"):
+        await products.count_grouped(by="colour", buckets=["red"])
+    with pytest.raises(ValueError, match="buckets="):
+        await products.count_grouped(by="year")
+
+
+@pytest.mark.asyncio
+async def test_count_reads_only_the_header():
+    api = AsyncMock(spec=AireloomClient)
+    api._response_unwrapper = OpenAireUnwrapper()
+    api.request.return_value = httpx.Response(
+        200, content=b'{"header": {"numFound": 4321}, "results": [{"id": truncated'
+    )
+    products = ResearchProductsClient(api_client=api)
+
+    total = await products.count(
+        filters=ResearchProductsFilters(type="dataset"), search="soil"
+    )
+
+    assert total == 4321
+    params = api.request.call_args.kwargs["params"]
+    assert params == {"type": "dataset", "page": 1, "pageSize": 1, "search": "soil"}
+
+
+@pytest.mark.asyncio
+async def test_count_wraps_malformed_responses():
+    api = AsyncMock(spec=AireloomClient)
+    api._response_unwrapper = OpenAireUnwrapper()
+    api.request.return_value = httpx.Response(200, content=b"<html>")
+    products = ResearchProductsClient(api_client=api)
+
+    with pytest.raises(BibliofabricError, match="counting"):
+        await products.count()
@@ -391,10 +391,115 @@ class TestIterateLinks:
         ]
         assert len(results) == 0
 
+    @staticmethod
+    def _links_page(total_pages: int):
+        """Page body factory for ``paged_request``: one relation per page."""
+
+        def body(page: int) -> dict:
+            return _mock_links_response(
+                relations=[_mock_relation_dict(source_doi=f"10.1/{page}")],
+                page=page,
+                total_pages=total_pages,
+            )
 
-# ===========================================================================
-# 4. get_relations_info
-# ===========================================================================
+        return body
+
+    @pytest.mark.asyncio
+    async def test_iterate_links_concurrent_ordered(
+        self,
+        research_products_client: ResearchProductsClient,
+        mock_api_client_fixture: AsyncMock,
+        paged_request,
+    ):
+        probe = {"in_flight": 0, "peak": 0}
+        mock_api_client_fixture.request.side_effect = paged_request(
+            6, probe, self._links_page(6)
+        )
+
+        results = [
+            rel
+            async for rel in research_products_client.iterate_links(max_concurrency=3)
+        ]
+
+        assert [r.source.identifiers[0].id for r in results] == [
+            f"10.1/{page}" for page in range(1, 7)
+        ]
+        assert probe["peak"] == 3
+
+    @pytest.mark.asyncio
+    async def test_iterate_links_concurrent_unordered(
+        self,
+        research_products_client: ResearchProductsClient,
+        mock_api_client_fixture: AsyncMock,
+        paged_request,
+    ):
+        probe = {"in_flight": 0, "peak": 0}
+        mock_api_client_fixture.request.side_effect = paged_request(
+            6, probe, self._links_page(6)
+        )
+
+        results = [
+            rel.source.identifiers[0].id
+            async for rel in research_products_client.iterate_links(
+                max_concurrency=5, ordered=False
+            )
+        ]
+
+        assert sorted(results) == [f"10.1/{page}" for page in range(1, 7)]
+        # Faster later pages overtake earlier ones.
+        assert results[1] != "10.1/2"
+        assert probe["peak"] == 5
+
+    # ===========================================================================
+    # 4. get_relations_info
+    # ===========================================================================
+
+    @pytest.mark.asyncio
+    async def test_iterate_links_resumes_from_checkpoint(
+        self,
+        research_products_client: ResearchProductsClient,
+        mock_api_client_fixture: AsyncMock,
+        paged_request,
+        tmp_path,
+    ):
+        checkpoint = tmp_path / "links.json"
+        probe = {"in_flight": 0, "peak": 0}
+        mock_api_client_fixture.request.side_effect = paged_request(
+            4, probe, self._links_page(4)
+        )
+        filters = LinksFilters(sourcePid="10.1/x")
+
+        seen = []
+        async for rel in research_products_client.iterate_links(
+            filters=filters, checkpoint=checkpoint, max_concurrency=2
+        ):
+            seen.append(rel.source.identifiers[0].id)
+            if len(seen) == 2:
+                break
+        assert seen == ["10.1/1", "10.1/2"]
+        mock_api_client_fixture.request.reset_mock()
+
+        resumed = [
+            rel.source.identifiers[0].id
+            async for rel in research_products_client.iterate_links(
+                filters=filters, checkpoint=checkpoint
+            )
+        ]
+
+        assert resumed == ["10.1/2", "10.1/3", "10.1/4"]
+        first_call = mock_api_client_fixture.request.call_args_list[0]
+        assert first_call.kwargs["params"]["page"] == 2
+        assert not checkpoint.exists()
+
+    @pytest.mark.asyncio
+    async def test_iterate_links_checkpoint_requires_order(
+        self, research_products_client: ResearchProductsClient, tmp_path
+    ):
+        with pytest.raises(ValueError, match="ordered"):
+            async for _ in research_products_client.iterate_links(
+                ordered=False, checkpoint=tmp_path / "links.json"
+            ):
+                pass
 
 
 class TestGetRelationsInfo:
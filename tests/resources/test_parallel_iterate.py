@@ -0,0 +1,219 @@
+"""Tests for date-partitioned parallel iteration."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import date, timedelta
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from aireloom.client import AireloomClient
+from aireloom.endpoints import ProjectsFilters, ResearchProductsFilters
+from aireloom.resources import (
+    OrganizationsClient,
+    ProjectsClient,
+    ResearchProductsClient,
+)
+from aireloom.resources._partition import DatePartition, _as_date
+from aireloom.unwrapper import OpenAireUnwrapper
+
+# ── Fake Graph API ────────────────────────────────────────────────────────
+
+
+class _FakeGraph:
+    """Serves ``records`` with search, sort, date-range and cursor paging."""
+
+    def __init__(self, records: list[dict], date_field: str, from_p: str, to_p: str):
+        self.records = records
+        self.date_field = date_field
+        self.from_p = from_p
+        self.to_p = to_p
+        self.in_flight = 0
+        self.peak = 0
+        self.cursor_requests = 0
+
+    def _matching(self, params: dict) -> list[dict]:
+        lo, hi = params.get(self.from_p), params.get(self.to_p)
+        rows = self.records
+        if lo or hi:
+            rows = [
+                r
+                for r in rows
+                if r.get(self.date_field)
+                and (not lo or r[self.date_field] >= str(lo))
+                and (not hi or r[self.date_field] <= str(hi))
+            ]
+        if "type" in params:
+            rows = [r for r in rows if r.get("type") == params["type"]]
+        return rows
+
+    async def request(self, method, path, *, params, base_url_override=None):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            rows = self._matching(params)
+            sort = params.get("sortBy")
+            if sort:
+                rows = sorted(
+                    (r for r in rows if r.get(self.date_field)),
+                    key=lambda r: r[self.date_field],
+                    reverse=sort.endswith("DESC"),
+                )
+            size = params["pageSize"]
+            header: dict = {"numFound": len(rows)}
+            if "cursor" in params:
+                self.cursor_requests += 1
+                offset = 0 if params["cursor"] == "*" else int(params["cursor"])
+                page = rows[offset : offset + size]
+                if offset + size < len(rows):
+                    header["nextCursor"] = str(offset + size)
+            else:
+                page = rows[:size]
+            response = AsyncMock(spec=httpx.Response)
+            response.json.return_value = {"header": header, "results": page}
+            return response
+        finally:
+            self.in_flight -= 1
+
+
+def _client(cls, graph: _FakeGraph):
+    api = AsyncMock(spec=AireloomClient)
+    api._response_unwrapper = OpenAireUnwrapper()
+    api.request.side_effect = graph.request
+    return cls(api_client=api)
+
+
+def _products(n: int, start: date = date(2020, 1, 1)) -> list[dict]:
+    return [
+        {
+            "id": f"rp{i}",
+            "type": "publication",
+            "publicationDate": (start + timedelta(days=i % 365)).isoformat(),
+        }
+        for i in range(n)
+    ]
+
+
+# ── Tests ─────────────────────────────────────────────────────────────────
+
+
+class TestPlanPartitions:
+    @pytest.mark.asyncio
+    async def test_partitions_are_disjoint_and_bounded(self):
+        graph = _FakeGraph(
+            _products(500),
+            "publicationDate",
+            "fromPublicationDate",
+            "toPublicationDate",
+        )
+        client = _client(ResearchProductsClient, graph)
+        partitions = await client.plan_partitions(partition_size=60)
+
+        assert sum(p.count for p in partitions) == 500
+        assert all(p.count <= 60 for p in partitions)
+        for left, right in zip(partitions, partitions[1:], strict=False):
+            assert left.end < right.start
+        assert partitions[0].start == date(2020, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_given_bounds_respected(self):
+        graph = _FakeGraph(
+            _products(365),
+            "publicationDate",
+            "fromPublicationDate",
+            "toPublicationDate",
+        )
+        client = _client(ResearchProductsClient, graph)
+        filters = ResearchProductsFilters(
+            fromPublicationDate=date(2020, 3, 1), toPublicationDate=date(2020, 3, 31)
+        )
+        partitions = await client.plan_partitions(filters, partition_size=10)
+        assert partitions[0].start == date(2020, 3, 1)
+        assert partitions[-1].end == date(2020, 3, 31)
+        assert sum(p.count for p in partitions) == 31
+
+    @pytest.mark.asyncio
+    async def test_single_day_not_split_further(self):
+        records = [{"id": f"x{i}", "publicationDate": "2021-05-05"} for i in range(30)]
+        graph = _FakeGraph(
+            records, "publicationDate", "fromPublicationDate", "toPublicationDate"
+        )
+        partitions = await _client(ResearchProductsClient, graph).plan_partitions(
+            partition_size=10
+        )
+        assert partitions == [DatePartition(date(2021, 5, 5), date(2021, 5, 5), 30)]
+
+    @pytest.mark.asyncio
+    async def test_empty_query(self):
+        graph = _FakeGraph(
+            [], "publicationDate", "fromPublicationDate", "toPublicationDate"
+        )
+        client = _client(ResearchProductsClient, graph)
+        assert await client.plan_partitions() == []
+
+    @pytest.mark.asyncio
+    async def test_undated_records_not_covered(self):
+        records = _products(20) + [{"id": "nodate"}]
+        graph = _FakeGraph(
+            records, "publicationDate", "fromPublicationDate", "toPublicationDate"
+        )
+        partitions = await _client(ResearchProductsClient, graph).plan_partitions()
+        assert sum(p.count for p in partitions) == 20
+
+
+class TestParallelIterate:
+    @pytest.mark.asyncio
+    async def test_yields_every_record_once(self):
+        graph = _FakeGraph(
+            _products(400),
+            "publicationDate",
+            "fromPublicationDate",
+            "toPublicationDate",
+        )
+        client = _client(ResearchProductsClient, graph)
+        seen = [
+            p.id
+            async for p in client.parallel_iterate(
+                ResearchProductsFilters(type="publication"),
+                page_size=25,
+                partition_size=50,
+                max_concurrency=4,
+            )
+        ]
+        assert sorted(seen) == sorted(f"rp{i}" for i in range(400))
+        assert graph.peak <= 4
+
+    @pytest.mark.asyncio
+    async def test_projects_partition_on_start_date(self):
+        records = [
+            {"id": f"p{i}", "startDate": f"{2000 + i % 20}-01-01"} for i in range(100)
+        ]
+        graph = _FakeGraph(records, "startDate", "fromStartDate", "toStartDate")
+        client = _client(ProjectsClient, graph)
+        seen = [
+            p.id
+            async for p in client.parallel_iterate(
+                ProjectsFilters(), partition_size=20, max_concurrency=3
+            )
+        ]
+        assert sorted(seen) == sorted(f"p{i}" for i in range(100))
+
+    def test_only_date_partitioned_clients(self):
+        assert not hasattr(OrganizationsClient, "parallel_iterate")
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2020-02-03", date(2020, 2, 3)),
+        ("2020-02-03T10:00:00Z", date(2020, 2, 3)),
+        ("1999", date(1999, 1, 1)),
+        ("n/a", None),
+        (None, None),
+    ],
+)
+def test_as_date(value, expected):
+    assert _as_date(value) == expected
@@ -0,0 +1,243 @@
+"""Tests for raw (unvalidated) search and iteration."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from aireloom.client import AireloomClient
+from aireloom.endpoints import LinksFilters, ScholixFilters
+from aireloom.models import (
+    Relation,
+    ResearchProduct,
+    ScholixRelationship,
+    projected_model,
+)
+from aireloom.resources import ResearchProductsClient, ScholixClient
+from aireloom.unwrapper import OpenAireUnwrapper
+
+
+def _product(n: int) -> dict:
+    return {
+        "id": f"rp{n}",
+        "mainTitle": f"Product {n}",
+        "pids": [{"scheme": "doi", "value": f"10.1/{n}"}],
+    }
+
+
+def _graph_page(ids: list[int], num_found: int, cursor: str | None) -> dict:
+    header: dict = {"numFound": num_found, "pageSize": len(ids)}
+    if cursor is not None:
+        header["nextCursor"] = cursor
+    return {"header": header, "results": [_product(n) for n in ids]}
+
+
+def _link(source: str, target: str) -> dict:
+    return {
+        "LinkProvider": [{"Name": "Test Provider"}],
+        "RelationshipType": {"Name": "References"},
+        "Source": {
+            "Identifier": [{"ID": source, "IDScheme": "doi"}],
+            "Type": "publication",
+        },
+        "Target": {
+            "Identifier": [{"ID": target, "IDScheme": "doi"}],
+            "Type": "dataset",
+        },
+    }
+
+
+def _relation(source: str, target: str) -> dict:
+    return {
+        "source": {"identifiers": [{"id": source, "idScheme": "doi"}]},
+        "target": {"identifiers": [{"id": target, "idScheme": "doi"}]},
+        "relType": {"name": "IsSupplementTo", "typeSchema": "datacite"},
+    }
+
+
+def _response(data: dict) -> httpx.Response:
+    return httpx.Response(200, content=json.dumps(data).encode())
+
+
+def _api(*pages: dict) -> AsyncMock:
+    api = AsyncMock(spec=AireloomClient)
+    api._response_unwrapper = OpenAireUnwrapper()
+    api.request.side_effect = [_response(page) for page in pages]
+    return api
+
+
+class TestGraphRaw:
+    @pytest.mark.asyncio
+    async def test_search_raw_returns_dicts_or_body(self):
+        page = _graph_page([1, 2], num_found=2, cursor=None)
+        client = ResearchProductsClient(api_client=_api(page, page))
+
+        assert await client.search_raw(page_size=2) == page["results"]
+        body = await client.search_raw(page_size=2, as_bytes=True)
+        assert json.loads(body) == page
+
+    @pytest.mark.asyncio
+    async def test_iterate_raw_follows_cursor(self):
+        api = _api(
+            _graph_page([1, 2], num_found=3, cursor="c1"),
+            _graph_page([3], num_found=3, cursor=None),
+        )
+        client = ResearchProductsClient(api_client=api)
+
+        records = [r async for r in client.iterate_raw(page_size=2)]
+
+        assert [r["id"] for r in records] == ["rp1", "rp2", "rp3"]
+        assert api.request.call_args_list[1].kwargs["params"]["cursor"] == "c1"
+
+    @pytest.mark.asyncio
+    async def test_iterate_raw_bytes_stops_at_num_found(self):
+        pages = [
+            _graph_page([1, 2], num_found=4, cursor="c1"),
+            _graph_page([3, 4], num_found=4, cursor="c2"),
+        ]
+        api = _api(*pages)
+        client = ResearchProductsClient(api_client=api)
+
+        bodies = [b async for b in client.iterate_raw(page_size=2, as_bytes=True)]
+
+        assert [json.loads(b) for b in bodies] == pages
+        assert api.request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_iterate_raw_bytes_stops_without_cursor(self):
+        api = _api(_graph_page([1], num_found=10, cursor=None))
+        client = ResearchProductsClient(api_client=api)
+
+        bodies = [b async for b in client.iterate_raw(page_size=2, as_bytes=True)]
+
+        assert len(bodies) == 1
+        assert api.request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_iterate_raw_bytes_empty_result(self):
+        client = ResearchProductsClient(
+            api_client=_api(_graph_page([], num_found=0, cursor=None))
+        )
+        assert [b async for b in client.iterate_raw(as_bytes=True)] == []
+
+    def test_validate_batch_mixes_dicts_and_bodies(self):
+        client = ResearchProductsClient(api_client=_api())
+        body = json.dumps(_graph_page([2, 3], num_found=3, cursor=None)).encode()
+
+        products = client.validate_batch([_product(1), bytearray(body)])
+
+        assert [p.id for p in products] == ["rp1", "rp2", "rp3"]
+        assert all(isinstance(p, ResearchProduct) for p in products)
+        assert products[2].doi == "10.1/3"
+
+    def test_validate_batch_with_fields(self):
+        client = ResearchProductsClient(api_client=_api())
+
+        [product] = client.validate_batch([_product(1)], fields={"pids"})
+
+        assert type(product) is projected_model(ResearchProduct, {"pids"})
+        assert not hasattr(product, "title")
+
+
+class TestLinksRaw:
+    @pytest.mark.asyncio
+    async def test_iterate_links_raw_walks_pages(self):
+        pages = [
+            {
+                "header": {"numFound": 3, "totalPages": 2},
+                "results": [
+                    _relation("10.1/a", "10.1/b"),
+                    _relation("10.1/a", "10.1/c"),
+                ],
+            },
+            {
+                "header": {"numFound": 3, "totalPages": 2},
+                "results": [
+                    _relation("10.1/a", "10.1/d"),
+                ],
+            },
+        ]
+        api = _api(*pages)
+        client = ResearchProductsClient(api_client=api)
+
+        raw = [
+            r
+            async for r in client.iterate_links_raw(
+                filters=LinksFilters(sourcePid="10.1/a"), page_size=2
+            )
+        ]
+
+        assert len(raw) == 3
+        assert [c.kwargs["params"]["page"] for c in api.request.call_args_list] == [
+            1,
+            2,
+        ]
+        relations = client.validate_batch(raw, model=Relation)
+        assert [r.target.identifiers[0].id for r in relations] == [
+            "10.1/b",
+            "10.1/c",
+            "10.1/d",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_links_raw_bytes(self):
+        page = {"header": {"numFound": 1}, "results": [_relation("10.1/a", "10.1/b")]}
+        client = ResearchProductsClient(api_client=_api(page))
+
+        body = await client.search_links_raw(as_bytes=True)
+
+        [relation] = client.validate_batch([body], model=Relation)
+        assert relation.relType.name == "IsSupplementTo"
+
+
+class TestScholixRaw:
+    FILTERS = ScholixFilters(sourcePid="10.1/a")
+
+    @staticmethod
+    def _page(n: int, links: list[dict], total_pages: int = 2) -> dict:
+        return {
+            "currentPage": n,
+            "totalPages": total_pages,
+            "totalLinks": 3,
+            "result": links,
+        }
+
+    @pytest.mark.asyncio
+    async def test_iterate_raw_bytes(self):
+        pages = [
+            self._page(0, [_link("10.1/a", "10.1/b"), _link("10.1/a", "10.1/c")]),
+            self._page(1, [_link("10.1/a", "10.1/d")]),
+        ]
+        api = _api(*pages)
+        client = ScholixClient(api_client=api)
+
+        bodies = [
+            b async for b in client.iterate_raw(filters=self.FILTERS, as_bytes=True)
+        ]
+
+        assert [json.loads(b) for b in bodies] == pages
+        assert [c.kwargs["params"]["page"] for c in api.request.call_args_list] == [
+            0,
+            1,
+        ]
+        links = client.validate_batch(bodies)
+        assert len(links) == 3
+        assert all(isinstance(link, ScholixRelationship) for link in links)
+
+    @pytest.mark.asyncio
+    async def test_iterate_raw_dicts_and_search_raw(self):
+        page = self._page(0, [_link("10.1/a", "10.1/b")], total_pages=1)
+        client = ScholixClient(api_client=_api(page, page))
+
+        raw = [r async for r in client.iterate_raw(filters=self.FILTERS)]
+        assert raw == page["result"]
+        assert await client.search_raw(filters=self.FILTERS) == page["result"]
+
+    @pytest.mark.asyncio
+    async def test_search_raw_requires_pid(self):
+        client = ScholixClient(api_client=_api())
+        with pytest.raises(ValueError, match="sourcePid"):
+            await client.search_raw(filters=ScholixFilters())
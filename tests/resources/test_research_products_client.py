@@ -1,4 +1,7 @@
 # tests/resources/test_research_products_client.py
+import asyncio
+import json
+from contextlib import aclosing
 from datetime import date
 from unittest.mock import AsyncMock, call  # Import call
 
@@ -11,9 +14,11 @@ from aireloom.constants import DEFAULT_PAGE_SIZE, OPENAIRE_GRAPH_API_V2_BASE_URL
 from aireloom.endpoints import RESEARCH_PRODUCTS, ResearchProductsFilters
 from aireloom.models import (
     Header,
+    LazyResearchProduct,
     ResearchProduct,  # Added for type hinting if needed
 )
 from aireloom.resources import ResearchProductsClient
+from aireloom.resources._paging import limited_page_size
 from aireloom.unwrapper import OpenAireUnwrapper
 
 
@@ -420,15 +425,14 @@ async def test_iterate_api_error_during_iteration(
         ]
     )
 
-    iterated_products = []
+    stream = research_products_client.iterate(
+        filters=filters_model, page_size=page_size
+    )
+    first = await anext(stream)
     with pytest.raises(BibliofabricError) as exc_info:
-        async for product in research_products_client.iterate(
-            filters=filters_model, page_size=page_size
-        ):
-            iterated_products.append(product)
+        await anext(stream)  # Only first page processed
 
-    assert len(iterated_products) == 1  # Only first page processed
-    assert iterated_products[0] == ResearchProduct.model_validate(page1_results_data[0])
+    assert first == ResearchProduct.model_validate(page1_results_data[0])
     assert "Unexpected error during iteration" in str(exc_info.value)
 
     # The mock should have been called twice, but due to the exception on the second call,
@@ -447,3 +451,238 @@ async def test_iterate_api_error_during_iteration(
         base_url_override=OPENAIRE_GRAPH_API_V2_BASE_URL,
     )
     assert expected_second_call in mock_api_client_fixture.request.mock_calls
+
+
+def _cursor_chain_request(pages: int, fetched: list[str], fail_at: int | None = None):
+    """Fake ``request`` serving *pages* one-item pages linked by cursors."""
+
+    async def request(method, path, *, params, base_url_override=None):
+        cursor = params["cursor"]
+        page = 0 if cursor == "*" else int(cursor.removeprefix("c"))
+        fetched.append(cursor)
+        await asyncio.sleep(0)
+        if page == fail_at:
+            raise RuntimeError("boom")
+        response = AsyncMock(spec=httpx.Response)
+        response.json.return_value = {
+            "header": {"nextCursor": f"c{page + 1}" if page + 1 < pages else None},
+            "results": [{"id": f"rp{page}", "title": f"Product {page}"}],
+        }
+        return response
+
+    return request
+
+
+@pytest.mark.asyncio
+async def test_iterate_read_ahead_fetches_while_consumer_works(
+    research_products_client: ResearchProductsClient, mock_api_client_fixture: AsyncMock
+):
+    """With read_ahead=K the client runs up to K pages ahead of the consumer."""
+    fetched: list[str] = []
+    mock_api_client_fixture.request.side_effect = _cursor_chain_request(10, fetched)
+
+    stream = research_products_client.iterate(page_size=1, read_ahead=2)
+    first = await anext(stream)
+    for _ in range(20):
+        await asyncio.sleep(0)
+    assert first.id == "rp0"
+    # Page 0 is being consumed; pages 1 and 2 are fetched, no further.
+    assert fetched == ["*", "c1", "c2"]
+
+    rest = [product.id async for product in stream]
+    assert rest == [f"rp{page}" for page in range(1, 10)]
+
+
+@pytest.mark.asyncio
+async def test_iterate_read_ahead_propagates_errors_in_order(
+    research_products_client: ResearchProductsClient, mock_api_client_fixture: AsyncMock
+):
+    fetched: list[str] = []
+    mock_api_client_fixture.request.side_effect = _cursor_chain_request(
+        5, fetched, fail_at=3
+    )
+
+    stream = research_products_client.iterate(page_size=1, read_ahead=4)
+    seen = [(await anext(stream)).id for _ in range(3)]
+    assert seen == ["rp0", "rp1", "rp2"]
+    with pytest.raises(BibliofabricError, match="Unexpected error during iteration"):
+        await anext(stream)
+
+
+@pytest.mark.asyncio
+async def test_iterate_read_ahead_stops_fetching_on_early_exit(
+    research_products_client: ResearchProductsClient, mock_api_client_fixture: AsyncMock
+):
+    fetched: list[str] = []
+    mock_api_client_fixture.request.side_effect = _cursor_chain_request(100, fetched)
+
+    async with aclosing(
+        research_products_client.iterate(page_size=1, read_ahead=3)
+    ) as stream:
+        async for product in stream:
+            if product.id == "rp1":
+                break
+    count = len(fetched)
+    await asyncio.sleep(0.01)
+    assert len(fetched) == count <= 5
+
+
+@pytest.mark.asyncio
+async def test_iterate_resumes_from_checkpoint(
+    research_products_client: ResearchProductsClient,
+    mock_api_client_fixture: AsyncMock,
+    tmp_path,
+):
+    checkpoint = tmp_path / "iterate.json"
+    fetched: list[str] = []
+    mock_api_client_fixture.request.side_effect = _cursor_chain_request(
+        6, fetched, fail_at=4
+    )
+    stream = research_products_client.iterate(page_size=1, checkpoint=checkpoint)
+    seen = [(await anext(stream)).id for _ in range(4)]
+    assert seen == ["rp0", "rp1", "rp2", "rp3"]
+    with pytest.raises(BibliofabricError):
+        await anext(stream)
+    assert json.loads(checkpoint.read_text())["position"] == "c4"
+
+    fetched.clear()
+    mock_api_client_fixture.request.side_effect = _cursor_chain_request(6, fetched)
+    resumed = [
+        product.id
+        async for product in research_products_client.iterate(
+            page_size=1, checkpoint=checkpoint
+        )
+    ]
+    assert resumed == ["rp4", "rp5"]
+    assert fetched[0] == "c4"
+    assert not checkpoint.exists()
+
+
+@pytest.mark.asyncio
+async def test_iterate_ignores_checkpoint_of_other_query(
+    research_products_client: ResearchProductsClient,
+    mock_api_client_fixture: AsyncMock,
+    tmp_path,
+):
+    checkpoint = tmp_path / "iterate.json"
+    fetched: list[str] = []
+    mock_api_client_fixture.request.side_effect = _cursor_chain_request(3, fetched)
+    async with aclosing(
+        research_products_client.iterate(page_size=1, checkpoint=checkpoint)
+    ) as stream:
+        await anext(stream)
+        await anext(stream)
+    assert checkpoint.exists()
+
+    fetched.clear()
+    results = [
+        p.id
+        async for p in research_products_client.iterate(
+            page_size=1, sort_by="publicationDate desc", checkpoint=checkpoint
+        )
+    ]
+    assert len(results) == 3
+    assert fetched[0] == "*"
+
+
+def _sized_pages_request(total: int, sizes: list[int]):
+    """Fake ``request`` serving *total* records in pages of ``pageSize``."""
+
+    async def request(method, path, *, params, base_url_override=None):
+        size = params["pageSize"]
+        sizes.append(size)
+        await asyncio.sleep(0)
+        offset = 0 if params["cursor"] == "*" else int(params["cursor"])
+        response = AsyncMock(spec=httpx.Response)
+        response.json.return_value = {
+            "header": {
+                "nextCursor": str(offset + size) if offset + size < total else None
+            },
+            "results": [
+                {"id": f"rp{i}", "title": f"Product {i}"}
+                for i in range(offset, min(offset + size, total))
+            ],
+        }
+        return response
+
+    return request
+
+
+@pytest.mark.parametrize(
+    ("page_size", "limit", "expected"),
+    [(100, None, 100), (100, 5, 5), (100, 100, 100), (100, 150, 75), (50, 0, 1)],
+)
+def test_limited_page_size(page_size, limit, expected):
+    assert limited_page_size(page_size, limit) == expected
+
+
+@pytest.mark.asyncio
+async def test_collect_sizes_pages_to_limit(
+    research_products_client: ResearchProductsClient, mock_api_client_fixture: AsyncMock
+):
+    sizes: list[int] = []
+    mock_api_client_fixture.request.side_effect = _sized_pages_request(1000, sizes)
+
+    products = await research_products_client.collect(limit=5)
+    assert [p.id for p in products] == [f"rp{i}" for i in range(5)]
+    assert sizes == [5]
+
+    sizes.clear()
+    products = await research_products_client.collect(limit=150)
+    assert len(products) == 150
+    assert sizes == [75, 75]
+
+    sizes.clear()
+    assert (await research_products_client.first()).id == "rp0"
+    assert sizes == [1]
+
+
+@pytest.mark.asyncio
+async def test_collect_limit_cancels_read_ahead(
+    research_products_client: ResearchProductsClient, mock_api_client_fixture: AsyncMock
+):
+    fetched: list[str] = []
+    mock_api_client_fixture.request.side_effect = _cursor_chain_request(100, fetched)
+
+    products = await research_products_client.collect(
+        limit=2, page_size=1, read_ahead=4
+    )
+    count = len(fetched)
+    await asyncio.sleep(0.01)
+
+    assert [p.id for p in products] == ["rp0", "rp1"]
+    assert len(fetched) == count <= 6
+
+
+@pytest.mark.asyncio
+async def test_lazy_results(
+    research_products_client: ResearchProductsClient, mock_api_client_fixture: AsyncMock
+):
+    """With lazy enabled, iterate and search yield LazyResearchProduct."""
+    record = {
+        "id": "lazy1",
+        "pids": [{"scheme": "doi", "value": "10.1/lazy1"}],
+        "authors": [{"fullName": "A. Author"}],
+    }
+    mock_http_response = AsyncMock(spec=httpx.Response)
+    mock_http_response.json = lambda: {
+        "header": {"numFound": 1, "nextCursor": None},
+        "results": [record],
+    }
+    mock_api_client_fixture.request = AsyncMock(return_value=mock_http_response)
+
+    assert not research_products_client.lazy
+    research_products_client.lazy = True
+    assert research_products_client.lazy
+
+    [product] = await research_products_client.collect()
+    page = await research_products_client.search()
+
+    assert isinstance(product, LazyResearchProduct)
+    assert product.doi == "10.1/lazy1"
+    assert isinstance(page.results[0], LazyResearchProduct)
+    assert page.results[0].authors[0].fullName == "A. Author"
+
+    research_products_client.lazy = False
+    [product] = await research_products_client.collect()
+    assert type(product) is ResearchProduct
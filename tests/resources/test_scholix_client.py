@@ -399,3 +399,120 @@ async def test_iterate_scholix_links_api_error(
     ]
     mock_api_client_fixture.request.assert_has_calls(expected_calls)
     assert mock_api_client_fixture.request.call_count == 2
+
+
+def _scholix_page(total_pages: int):
+    """Page body factory for ``paged_request``: one link per page."""
+
+    def body(page: int) -> dict:
+        return {
+            "currentPage": page,
+            "totalPages": total_pages,
+            "totalLinks": total_pages,
+            "result": [create_mock_scholix_link_data(f"10.src/{page}", "10.t/x")],
+        }
+
+    return body
+
+
+@pytest.mark.asyncio
+async def test_iterate_scholix_links_prefetches_in_page_order(
+    scholix_client: ScholixClient, mock_api_client_fixture: AsyncMock, paged_request
+):
+    """Pages after the first are fetched concurrently but yielded in order."""
+    probe = {"in_flight": 0, "peak": 0}
+    mock_api_client_fixture.request.side_effect = paged_request(
+        8, probe, _scholix_page(8)
+    )
+
+    links = [
+        link
+        async for link in scholix_client.iterate_links(
+            filters=ScholixFilters(targetPid="10.t/x"), max_concurrency=3
+        )
+    ]
+
+    assert [link.source.identifier[0].id_val for link in links] == [
+        f"10.src/{page}" for page in range(8)
+    ]
+    assert probe["peak"] == 3
+    assert mock_api_client_fixture.request.call_count == 8
+
+
+@pytest.mark.asyncio
+async def test_iterate_scholix_links_serial_by_default(
+    scholix_client: ScholixClient, mock_api_client_fixture: AsyncMock, paged_request
+):
+    probe = {"in_flight": 0, "peak": 0}
+    mock_api_client_fixture.request.side_effect = paged_request(
+        4, probe, _scholix_page(4)
+    )
+
+    links = [
+        link
+        async for link in scholix_client.iterate_links(
+            filters=ScholixFilters(targetPid="10.t/x")
+        )
+    ]
+
+    assert len(links) == 4
+    assert probe["peak"] == 1
+
+
+@pytest.mark.asyncio
+async def test_iterate_scholix_links_resumes_from_checkpoint(
+    scholix_client: ScholixClient,
+    mock_api_client_fixture: AsyncMock,
+    paged_request,
+    tmp_path,
+):
+    checkpoint = tmp_path / "scholix.json"
+    probe = {"in_flight": 0, "peak": 0}
+    mock_api_client_fixture.request.side_effect = paged_request(
+        5, probe, _scholix_page(5)
+    )
+    filters = ScholixFilters(targetPid="10.t/x")
+
+    seen = []
+    async for link in scholix_client.iterate_links(
+        filters=filters, checkpoint=checkpoint
+    ):
+        seen.append(link.source.identifier[0].id_val)
+        if len(seen) == 3:
+            break
+    assert seen == ["10.src/0", "10.src/1", "10.src/2"]
+    mock_api_client_fixture.request.reset_mock()
+
+    resumed = [
+        link.source.identifier[0].id_val
+        async for link in scholix_client.iterate_links(
+            filters=filters, checkpoint=checkpoint
+        )
+    ]
+
+    # The page being consumed when iteration stopped is delivered again.
+    assert resumed == ["10.src/2", "10.src/3", "10.src/4"]
+    first_call = mock_api_client_fixture.request.call_args_list[0]
+    assert first_call.kwargs["params"]["page"] == 2
+    assert not checkpoint.exists()
+
+
+@pytest.mark.asyncio
+async def test_scholix_collect_sizes_pages_to_limit(
+    scholix_client: ScholixClient, mock_api_client_fixture: AsyncMock, paged_request
+):
+    probe = {"in_flight": 0, "peak": 0}
+    mock_api_client_fixture.request.side_effect = paged_request(
+        8, probe, _scholix_page(8)
+    )
+
+    links = await scholix_client.collect(
+        filters=ScholixFilters(targetPid="10.t/x"), limit=3
+    )
+
+    assert len(links) == 3
+    sizes = {
+        c.kwargs["params"]["size"]
+        for c in mock_api_client_fixture.request.call_args_list
+    }
+    assert sizes == {3}
@@ -0,0 +1,172 @@
+"""Tests for incremental sync of research products."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from aireloom.client import AireloomClient
+from aireloom.resources import HighWaterMark, ResearchProductsClient, SyncState
+from aireloom.unwrapper import OpenAireUnwrapper
+
+
+class _FakeCollection:
+    """Serves records newest-collected first, with cursor paging."""
+
+    def __init__(self, records: list[dict]):
+        self.records = records
+        self.requests = 0
+
+    async def request(self, method, path, *, params, base_url_override=None):
+        self.requests += 1
+        assert params["sortBy"] == "dateOfCollection DESC"
+        rows = sorted(
+            self.records, key=lambda r: r.get("dateOfCollection") or "", reverse=True
+        )
+        size = params["pageSize"]
+        offset = 0 if params["cursor"] == "*" else int(params["cursor"])
+        header: dict = {"numFound": len(rows)}
+        if offset + size < len(rows):
+            header["nextCursor"] = str(offset + size)
+        response = AsyncMock(spec=httpx.Response)
+        response.json.return_value = {
+            "header": header,
+            "results": rows[offset : offset + size],
+        }
+        return response
+
+
+def _record(rid: str, collected: str | None, updated: int = 0) -> dict:
+    return {"id": rid, "dateOfCollection": collected, "lastUpdateTimeStamp": updated}
+
+
+@pytest.fixture
+def collection() -> _FakeCollection:
+    return _FakeCollection(
+        [_record(f"old{i}", f"2024-01-0{i}T00:00:00Z", 1) for i in range(1, 10)]
+    )
+
+
+@pytest.fixture
+def products(collection: _FakeCollection) -> ResearchProductsClient:
+    api = AsyncMock(spec=AireloomClient)
+    api._response_unwrapper = OpenAireUnwrapper()
+    api.request.side_effect = collection.request
+    return ResearchProductsClient(api_client=api)
+
+
+@pytest.mark.asyncio
+async def test_first_run_delivers_everything(products, collection, tmp_path):
+    received = []
+    result = await products.sync(
+        received.append, state=tmp_path / "sync.json", page_size=4
+    )
+
+    assert result.upserted == result.scanned == 9
+    assert [p.id for p in received][:2] == ["old9", "old8"]
+    assert result.mark == HighWaterMark("2024-01-09T00:00:00Z", ("old9",), 1)
+    stored = json.loads((tmp_path / "sync.json").read_text())
+    assert len(stored["marks"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_second_run_stops_at_mark(products, collection, tmp_path):
+    state = SyncState(tmp_path / "sync.json")
+    await products.sync(lambda p: None, state=state, page_size=4)
+    collection.records += [
+        _record("new1", "2024-02-01T00:00:00Z", 5),
+        _record("new2", "2024-02-02T00:00:00Z", 6),
+    ]
+    collection.requests = 0
+
+    received = []
+
+    async def sink(product):
+        received.append(product.id)
+
+    result = await products.sync(sink, state=state, page_size=2)
+
+    assert received == ["new2", "new1"]
+    assert result.upserted == 2
+    assert result.scanned == 4  # new2, new1, old9 (boundary), old8 (stop)
+    assert collection.requests == 2
+    assert result.mark == HighWaterMark("2024-02-02T00:00:00Z", ("new2",), 6)
+
+
+@pytest.mark.asyncio
+async def test_boundary_ties_and_updates(products, collection, tmp_path):
+    path = tmp_path / "sync.json"
+    await products.sync(lambda p: None, state=path)
+    collection.records += [
+        _record("tie", "2024-01-09T00:00:00Z", 1),
+        _record("old9", "2024-01-09T00:00:00Z", 7),
+    ]
+    collection.records = [
+        r
+        for r in collection.records
+        if (r["id"], r["lastUpdateTimeStamp"]) != ("old9", 1)
+    ]
+    received = []
+
+    result = await products.sync(lambda p: received.append(p.id), state=path)
+
+    assert sorted(received) == ["old9", "tie"]
+    assert result.mark == HighWaterMark("2024-01-09T00:00:00Z", ("old9", "tie"), 7)
+
+    received.clear()
+    result = await products.sync(lambda p: received.append(p.id), state=path)
+    assert received == []
+    assert result.upserted == 0
+
+
+@pytest.mark.asyncio
+async def test_marks_are_kept_per_filter_set(products, tmp_path):
+    path = tmp_path / "sync.json"
+    await products.sync(lambda p: None, state=path)
+    result = await products.sync(lambda p: None, state=path, search="graphene")
+
+    assert result.upserted == 9
+    assert len(json.loads(path.read_text())["marks"]) == 2
+
+
+@pytest.mark.asyncio
+async def test_sink_error_leaves_mark_unchanged(products, tmp_path):
+    path = tmp_path / "sync.json"
+
+    def failing_sink(product):
+        raise RuntimeError("downstream unavailable")
+
+    with pytest.raises(RuntimeError):
+        await products.sync(failing_sink, state=path)
+    assert SyncState(path).get("anything") is None
+    assert not path.exists()
+
+
+def test_unknown_state_format_ignored(tmp_path):
+    path = tmp_path / "sync.json"
+    path.write_text(json.dumps({"version": 99}))
+    assert SyncState(path).get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_collection_dates_compared_as_timestamps(products, collection, tmp_path):
+    path = tmp_path / "sync.json"
+    await products.sync(lambda p: None, state=path)
+    # The boundary instant spelled with another precision and offset sorts
+    # before the stored "2024-01-09T00:00:00Z" as a string.
+    collection.records = [
+        _record("later", "2024-01-09T00:30:00.5Z", 3),
+        _record("tie", "2024-01-09T00:00:00.000+00:00", 2),
+        _record("old9", "2024-01-09T00:00:00.000+00:00", 1),
+        _record("old8", "2024-01-08T00:00:00Z", 1),
+    ]
+    received = []
+
+    result = await products.sync(lambda p: received.append(p.id), state=path)
+
+    assert received == ["later", "tie"]
+    assert result.scanned == 4
+    assert result.mark == HighWaterMark("2024-01-09T00:30:00.5Z", ("later",), 3)
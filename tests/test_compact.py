@@ -0,0 +1,160 @@
+"""Tests for compact record types and ``compact=True`` iteration."""
+
+from __future__ import annotations
+
+import dataclasses
+import pickle
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from aireloom.client import AireloomClient
+from aireloom.models import (
+    CompactMapping,
+    LazyResearchProduct,
+    Project,
+    ResearchProduct,
+    compact_type,
+    projected_model,
+    to_compact,
+)
+from aireloom.resources import ResearchProductsClient
+from aireloom.unwrapper import OpenAireUnwrapper
+
+RECORD = {
+    "id": "rp1",
+    "mainTitle": "Compact",
+    "type": "publication",
+    "publicationDate": "2019-03-01",
+    "pids": [{"scheme": "doi", "value": "10.1/compact"}],
+    "authors": [
+        {
+            "fullName": "Ada Lovelace",
+            "rank": 1,
+            "pid": {"id": {"scheme": "orcid", "value": "0000-0001"}},
+        },
+        {"fullName": "", "rank": 2},
+    ],
+    "bestAccessRight": {"code": "c_abf2", "label": "OPEN"},
+    "indicators": {"citationImpact": {"citationCount": 5}},
+    "instances": [
+        {
+            "accessRight": {"label": "OPEN"},
+            "urls": ["https://example.org/oa"],
+            "license": "CC-BY",
+        }
+    ],
+    "keywords": "a, b",
+    "unexpected": {"kept": True},
+}
+
+
+@pytest.fixture
+def product() -> ResearchProduct:
+    return ResearchProduct.model_validate(RECORD)
+
+
+class TestCompactRecords:
+    def test_fields_and_computed_properties(self, product):
+        record = to_compact(product)
+
+        assert type(record) is compact_type(ResearchProduct)
+        assert record.id == "rp1"
+        assert record.keywords == ("a", "b")
+        assert record.authors[0].fullName == "Ada Lovelace"
+        for name in ResearchProduct.model_computed_fields:
+            assert getattr(record, name) == getattr(product, name), name
+        assert str(record) == str(product)
+        assert repr(record) == "CompactResearchProduct(id='rp1', type='publication')"
+
+    def test_slotted_and_immutable(self, product):
+        record = to_compact(product)
+
+        assert not hasattr(record, "__dict__")
+        assert not hasattr(record.authors[0], "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            record.id = "other"  # ty: ignore[invalid-assignment]
+
+    def test_extra_keys_are_kept(self, product):
+        record = to_compact(product)
+
+        assert record.model_extra == {"unexpected": {"kept": True}}
+        assert record.pids[0].model_extra is None
+
+    def test_dict_values_are_read_only_mappings(self, product):
+        record = to_compact(product)
+        pid = record.authors[0].pid
+
+        assert isinstance(pid, CompactMapping)
+        assert pid == {"id": {"scheme": "orcid", "value": "0000-0001"}}
+        assert pid["id"]["scheme"] == "orcid"
+        with pytest.raises(KeyError):
+            pid["missing"]
+        with pytest.raises(TypeError):
+            pid["id"] = {}  # ty: ignore[invalid-assignment]
+
+    def test_hashable(self, product):
+        record = to_compact(product)
+        again = to_compact(ResearchProduct.model_validate(RECORD))
+
+        assert hash(record) == hash(again)
+        assert len({record, again}) == 1
+
+    def test_default_nested_models_are_shared(self, product):
+        first = to_compact(product)
+        second = to_compact(ResearchProduct.model_validate({"id": "rp2"}))
+
+        assert first.container is second.container
+        assert first.container.name == ""
+        assert first.bestAccessRight is not second.bestAccessRight
+
+    def test_round_trip(self, product):
+        restored = to_compact(product).to_model()
+
+        assert type(restored) is ResearchProduct
+        assert restored == product
+        assert restored.model_dump_json() == product.model_dump_json()
+        assert restored.model_fields_set == product.model_fields_set
+        assert restored.authors[1].model_fields_set == {"fullName", "rank"}
+
+    def test_pickle(self, product):
+        record = to_compact(product)
+        assert pickle.loads(pickle.dumps(record)) == record
+
+    def test_other_models(self):
+        lazy = to_compact(LazyResearchProduct.model_validate(RECORD))
+        assert lazy.doi == "10.1/compact"
+        assert lazy.to_model().authors[0].fullName == "Ada Lovelace"
+
+        slim = projected_model(ResearchProduct, {"pids"})
+        record = to_compact(slim.model_validate(RECORD))
+        assert record.doi == "10.1/compact"
+        assert not hasattr(record, "authors")
+
+        project = to_compact(Project.model_validate({"id": "p1", "keywords": "x;y"}))
+        assert project.to_model() == Project.model_validate(
+            {"id": "p1", "keywords": "x;y"}
+        )
+
+
+@pytest.mark.asyncio
+async def test_iterate_and_collect_compact():
+    api = AsyncMock(spec=AireloomClient)
+    api._response_unwrapper = OpenAireUnwrapper()
+    response = AsyncMock(spec=httpx.Response)
+    response.json.return_value = {
+        "header": {"numFound": 2, "nextCursor": None},
+        "results": [RECORD, {"no": "id"}],
+    }
+    api.request.return_value = response
+    products = ResearchProductsClient(api_client=api)
+
+    record, raw = [r async for r in products.iterate(compact=True)]
+    [slim, _] = await products.collect(compact=True, fields={"pids"})
+
+    assert type(record) is compact_type(ResearchProduct)
+    assert record.doi == "10.1/compact"
+    assert raw == {"no": "id"}
+    assert slim.doi == "10.1/compact"
+    assert not hasattr(slim, "authors")
@@ -0,0 +1,125 @@
+"""Tests for the pluggable JSON decoding layer."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from bibliofabric.exceptions import BibliofabricError
+
+from aireloom import set_json_decoder
+from aireloom._decoding import (
+    decode_json,
+    get_json_decoder,
+    response_json,
+    validate_response,
+)
+from aireloom.client import AireloomClient
+from aireloom.models import ResearchProduct, ResearchProductResponse
+from aireloom.resources import ResearchProductsClient
+from aireloom.unwrapper import OpenAireUnwrapper
+
+PAGE = {
+    "header": {"numFound": 1, "pageSize": 1, "page": 1},
+    "results": [{"id": "rp1", "mainTitle": "Decoded", "type": "publication"}],
+}
+
+
+@pytest.fixture
+def recording_decoder():
+    calls: list[bytes | str] = []
+
+    def decoder(raw):
+        calls.append(raw)
+        return json.loads(raw)
+
+    set_json_decoder(decoder)
+    yield calls
+    set_json_decoder(None)
+
+
+def test_set_json_decoder_replaces_and_restores(recording_decoder):
+    assert decode_json(b'{"a": 1}') == {"a": 1}
+    assert recording_decoder == [b'{"a": 1}']
+
+    set_json_decoder(None)
+    assert get_json_decoder() is not None
+    assert decode_json('{"a": 2}') == {"a": 2}
+    assert len(recording_decoder) == 1
+
+
+def test_response_json_decodes_body_bytes(recording_decoder):
+    response = httpx.Response(200, content=json.dumps(PAGE).encode())
+
+    assert response_json(response) == PAGE
+    assert len(recording_decoder) == 1
+
+
+def test_response_json_falls_back_without_bytes_body(recording_decoder):
+    response = AsyncMock(spec=httpx.Response)
+    response.json.return_value = PAGE
+
+    assert response_json(response) == PAGE
+    assert recording_decoder == []
+
+
+def test_validate_response_builds_model():
+    response = httpx.Response(200, content=json.dumps(PAGE).encode())
+
+    parsed = validate_response(ResearchProductResponse, response)
+
+    assert isinstance(parsed, ResearchProductResponse)
+    assert parsed.results[0].title == "Decoded"
+
+
+@pytest.mark.asyncio
+async def test_search_parses_response_bytes(recording_decoder):
+    api = AsyncMock(spec=AireloomClient)
+    api._response_unwrapper = OpenAireUnwrapper()
+    api.request.return_value = httpx.Response(200, content=json.dumps(PAGE).encode())
+    client = ResearchProductsClient(api_client=api)
+
+    page = await client.search(page_size=1)
+
+    assert isinstance(page, ResearchProductResponse)
+    assert page.results[0].id == "rp1"
+    assert len(recording_decoder) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_decodes_with_configured_decoder(recording_decoder):
+    api = AsyncMock(spec=AireloomClient)
+    api._response_unwrapper = OpenAireUnwrapper()
+    api.request.return_value = httpx.Response(200, content=json.dumps(PAGE).encode())
+    client = ResearchProductsClient(api_client=api)
+
+    product = await client.get("rp1")
+
+    assert isinstance(product, ResearchProduct)
+    assert product.title == "Decoded"
+    assert len(recording_decoder) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_not_found_raises():
+    empty = {"header": {"numFound": 0}, "results": []}
+    api = AsyncMock(spec=AireloomClient)
+    api._response_unwrapper = OpenAireUnwrapper()
+    api.request.return_value = httpx.Response(200, content=json.dumps(empty).encode())
+    client = ResearchProductsClient(api_client=api)
+
+    with pytest.raises(BibliofabricError, match="'missing' not found"):
+        await client.get("missing")
+
+
+@pytest.mark.asyncio
+async def test_search_returns_raw_data_on_invalid_envelope():
+    raw = {"header": "not a header", "results": []}
+    api = AsyncMock(spec=AireloomClient)
+    api._response_unwrapper = OpenAireUnwrapper()
+    api.request.return_value = httpx.Response(200, content=json.dumps(raw).encode())
+    client = ResearchProductsClient(api_client=api)
+
+    assert await client.search() == raw
@@ -0,0 +1,118 @@
+"""Tests for interning of vocabulary fields during validation."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from aireloom import set_string_interning
+from aireloom.models import Relation, ResearchProduct, ScholixRelationship
+from aireloom.models.interning import string_interning_enabled
+
+PRODUCT = json.dumps(
+    {
+        "id": "rp1",
+        "pids": [{"scheme": "handle", "value": "11.1/abc"}],
+        "bestAccessRight": {"code": "c_abf2", "label": "OPEN", "scheme": "coar"},
+        "country": {"code": "NL", "label": "Netherlands"},
+        "language": {"code": "eng", "label": "English"},
+        "instances": [
+            {
+                "type": "Article",
+                "license": "CC-BY",
+                "accessRight": {"code": "c_abf2", "label": "OPEN"},
+                "collectedFrom": {"name": "Crossref", "id": "openaire____::crossref"},
+                "hostedBy": {"name": "Bench Journal", "id": None},
+            }
+        ],
+    }
+)
+
+
+def _distinct(value: str) -> str:
+    """An equal string that is a separate object, as a decoder would produce."""
+    return "".join(list(value))
+
+
+@pytest.fixture
+def interning_off():
+    set_string_interning(enabled=False)
+    yield
+    set_string_interning(enabled=True)
+
+
+def test_vocabulary_fields_share_one_object():
+    first = ResearchProduct.model_validate(json.loads(PRODUCT))
+    second = ResearchProduct.model_validate(json.loads(PRODUCT))
+
+    assert string_interning_enabled()
+    for path in (
+        lambda p: p.pids[0].scheme,
+        lambda p: p.bestAccessRight.label,
+        lambda p: p.country.code,
+        lambda p: p.language.label,
+        lambda p: p.instances[0].type,
+        lambda p: p.instances[0].license,
+        lambda p: p.instances[0].accessRight.code,
+        lambda p: p.instances[0].collectedFrom.name,
+        lambda p: p.instances[0].collectedFrom.id,
+        lambda p: p.instances[0].hostedBy.name,
+    ):
+        assert path(first) is path(second)
+    assert first.pids[0].value is not second.pids[0].value
+
+
+def test_values_and_safe_defaults_unchanged():
+    product = ResearchProduct.model_validate(json.loads(PRODUCT))
+
+    assert product.pids[0].scheme == "handle"
+    assert product.instances[0].hostedBy.id is None
+    assert product.language.code == "eng"
+    empty = ResearchProduct.model_validate({"id": "x", "country": {"code": None}})
+    assert empty.country.code == ""
+
+
+def test_interning_can_be_switched_off(interning_off):
+    data = {"id": "rp1", "pids": [{"scheme": _distinct("handle")}]}
+    other = {"id": "rp2", "pids": [{"scheme": _distinct("handle")}]}
+
+    first = ResearchProduct.model_validate(data)
+    second = ResearchProduct.model_validate(other)
+
+    assert not string_interning_enabled()
+    assert first.pids[0].scheme == second.pids[0].scheme
+    assert first.pids[0].scheme is not second.pids[0].scheme
+
+
+def test_scholix_and_links_fields():
+    def link() -> dict:
+        return {
+            "LinkProvider": [{"Name": _distinct("DataCite")}],
+            "RelationshipType": {
+                "Name": _distinct("IsUnknownTo"),
+                "SubTypeSchema": _distinct("datacite"),
+            },
+            "Source": {
+                "Identifier": [{"ID": "10.1/a", "IDScheme": _distinct("doi")}],
+                "Type": "publication",
+            },
+            "Target": {"Identifier": [], "Type": "dataset"},
+        }
+
+    first, second = (ScholixRelationship.model_validate(link()) for _ in range(2))
+    assert first.link_provider[0].name is second.link_provider[0].name
+    assert first.relationship_type.name is second.relationship_type.name
+    assert first.relationship_type.sub_type_schema == "datacite"
+    assert first.source.identifier[0].id_scheme is second.source.identifier[0].id_scheme
+
+    def relation() -> dict:
+        return {
+            "source": {"type": _distinct("publication")},
+            "relType": {"name": _distinct("Cites"), "type": None},
+        }
+
+    one, two = (Relation.model_validate(relation()) for _ in range(2))
+    assert one.relType.name is two.relType.name
+    assert one.source.type is two.source.type
+    assert one.relType.type is None
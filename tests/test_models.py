@@ -1,8 +1,21 @@
 """Tests for model validators and edge cases."""
 
-from aireloom.models.base import ApiResponse, BaseEntity, Header
+import dataclasses
+import pickle
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from aireloom.models.base import ApiResponse, BaseEntity, Header, computed_getter
+from aireloom.models.organization import Organization
+from aireloom.models.person import Person
 from aireloom.models.project import Project
-from aireloom.models.research_product import ResearchProduct, UsageCounts
+from aireloom.models.research_product import (
+    LazyResearchProduct,
+    LazyResearchProductResponse,
+    ResearchProduct,
+    UsageCounts,
+)
 
 # ── Header.coerce_str_to_int ──────────────────────────────────────────────
 
@@ -170,3 +183,177 @@ class TestResearchProductTitleAlias:
         """Model validator should handle non-dict data gracefully."""
         rp = ResearchProduct.model_validate({"id": "rp9", "title": "test"})
         assert rp.title == "test"
+
+
+# ── LazyResearchProduct ───────────────────────────────────────────────────
+
+LAZY_RECORD = {
+    "id": "rp10",
+    "mainTitle": "Lazy",
+    "publicationDate": "2021-03-04",
+    "pids": [{"scheme": "doi", "value": "10.1/lazy"}],
+    "authors": [{"fullName": "Ada Lovelace", "rank": 1}],
+    "indicators": {"citationImpact": {"citationCount": 7}},
+    "instances": [
+        {"accessRight": {"label": "OPEN"}, "urls": ["https://example.org/lazy"]}
+    ],
+    "container": None,
+    "keywords": "a, b",
+}
+
+
+class TestLazyResearchProduct:
+    """Cover deferred validation of nested ResearchProduct fields."""
+
+    def test_nested_fields_validated_on_first_access(self):
+        rp = LazyResearchProduct.model_validate(LAZY_RECORD)
+        assert "authors" not in rp.__dict__
+        assert rp.keywords == ["a", "b"]
+        assert rp.title == "Lazy"
+
+        authors = rp.authors
+        assert authors[0].fullName == "Ada Lovelace"
+        assert rp.authors is authors
+        assert "instances" not in rp.__dict__
+
+    def test_computed_fields_match_eager_model(self):
+        lazy = LazyResearchProduct.model_validate(LAZY_RECORD)
+        eager = ResearchProduct.model_validate(LAZY_RECORD)
+        assert isinstance(lazy, ResearchProduct)
+        assert lazy.doi == eager.doi == "10.1/lazy"
+        assert lazy.publication_year == eager.publication_year == 2021
+        assert lazy.citation_count == eager.citation_count == 7
+        assert lazy.open_access_url == eager.open_access_url
+        assert lazy.journal_name is eager.journal_name is None
+        assert str(lazy) == str(eager)
+
+    def test_serialization_matches_eager_model(self):
+        lazy = LazyResearchProduct.model_validate(LAZY_RECORD)
+        lazy.authors  # noqa: B018 — load one field out of order
+        eager = ResearchProduct.model_validate(LAZY_RECORD)
+        assert lazy.model_dump() == eager.model_dump()
+        assert lazy.model_dump_json() == eager.model_dump_json()
+        assert lazy.model_fields_set == eager.model_fields_set
+
+    def test_nested_in_response_envelope(self):
+        response = LazyResearchProductResponse.model_validate(
+            {"header": {"numFound": 1}, "results": [LAZY_RECORD]}
+        )
+        dumped = response.model_dump()
+        assert dumped["results"][0]["authors"][0]["fullName"] == "Ada Lovelace"
+
+    def test_equality_and_pickling(self):
+        first = LazyResearchProduct.model_validate(LAZY_RECORD)
+        second = LazyResearchProduct.model_validate(LAZY_RECORD)
+        assert first == second
+        restored = pickle.loads(pickle.dumps(LazyResearchProduct(**LAZY_RECORD)))
+        assert restored.authors[0].rank == 1
+
+    def test_invalid_nested_data_raises_on_access(self):
+        rp = LazyResearchProduct.model_validate(
+            {"id": "rp11", "authors": [{"rank": "first"}]}
+        )
+        with pytest.raises(ValidationError):
+            rp.authors  # noqa: B018
+
+    def test_unknown_attribute_still_raises(self):
+        rp = LazyResearchProduct.model_validate(LAZY_RECORD)
+        with pytest.raises(AttributeError):
+            rp.not_a_field  # noqa: B018
+
+
+# ── Cached computed fields ────────────────────────────────────────────────
+
+
+class TestCachedComputedFields:
+    """Cover per-instance caching of derived values on entities."""
+
+    def test_computed_once_and_cached(self):
+        rp = ResearchProduct.model_validate(LAZY_RECORD)
+        assert "doi" not in rp.__dict__
+
+        assert rp.doi == "10.1/lazy"
+        assert rp.__dict__["doi"] == "10.1/lazy"
+        # In-place changes are not detected; the cached value is kept.
+        rp.pids[0].value = "10.1/changed"
+        assert rp.doi == "10.1/lazy"
+
+    def test_model_dump_fills_and_reuses_cache(self):
+        rp = ResearchProduct.model_validate(LAZY_RECORD)
+        dumped = rp.model_dump()
+        assert dumped["publication_year"] == rp.__dict__["publication_year"] == 2021
+        assert rp.model_dump() == dumped
+
+    def test_reassigning_a_field_clears_cache(self):
+        rp = ResearchProduct.model_validate(LAZY_RECORD)
+        assert rp.publication_year == 2021
+
+        rp.publicationDate = "1999-01-01"
+        assert rp.publication_year == 1999
+
+    def test_only_inputs_clear_cache(self):
+        rp = ResearchProduct.model_validate(LAZY_RECORD)
+        assert rp.doi == "10.1/lazy"
+
+        rp.publisher = "Other"
+        assert "doi" in rp.__dict__
+        rp.pids = []
+        assert rp.doi is None
+
+    def test_models_without_cache_keep_pydantic_setattr(self):
+        class Plain(BaseEntity):
+            name: str = ""
+
+        assert Plain.__setattr__ is BaseModel.__setattr__
+        assert ResearchProduct._cache_inputs >= {"pids", "instances"}
+
+    def test_model_copy_with_update_clears_cache(self):
+        rp = ResearchProduct.model_validate(LAZY_RECORD)
+        assert rp.doi == "10.1/lazy"
+
+        copied = rp.model_copy(update={"pids": []})
+        assert copied.doi is None
+        assert rp.model_copy().__dict__["doi"] == "10.1/lazy"
+
+    def test_cache_does_not_leak_into_fields(self):
+        cached = ResearchProduct.model_validate(LAZY_RECORD)
+        fresh = ResearchProduct.model_validate(LAZY_RECORD)
+        cached.author_names  # noqa: B018
+
+        assert "author_names" not in dict(cached)
+        assert dict(cached) == dict(fresh)
+        assert cached == fresh
+        assert pickle.loads(pickle.dumps(cached)).author_names == ["Ada Lovelace"]
+
+    def test_cached_fields_per_model(self):
+        assert ResearchProduct._cached_fields == {
+            "doi",
+            "all_dois",
+            "open_access_url",
+            "license",
+            "author_names",
+            "publication_year",
+        }
+        assert LazyResearchProduct._cached_fields == ResearchProduct._cached_fields
+        assert Project._cached_fields == {"start_year", "end_year"}
+        assert Person._cached_fields == {"orcid"}
+        assert Organization._cached_fields == {"ror_id"}
+
+        person = Person.model_validate(
+            {"id": "orcid_______::0000-0002-1825-0097", "givenName": "Josiah"}
+        )
+        assert person.orcid == person.__dict__["orcid"] == "0000-0002-1825-0097"
+
+    def test_computed_getter_requires_a_getter(self):
+        info = ResearchProduct.model_computed_fields["citation_count"]
+        assert computed_getter(info)(ResearchProduct(id="rp")) is None
+
+        setter_only = dataclasses.replace(info, wrapped_property=property())
+        with pytest.raises(TypeError, match="no getter"):
+            computed_getter(setter_only)
+
+    def test_lazy_product_caches_after_loading(self):
+        rp = LazyResearchProduct.model_validate(LAZY_RECORD)
+        assert rp.open_access_url == "https://example.org/lazy"
+        assert rp.__dict__["open_access_url"] == "https://example.org/lazy"
+        assert rp.model_dump()["open_access_url"] == "https://example.org/lazy"
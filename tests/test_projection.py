@@ -0,0 +1,176 @@
+"""Tests for field projection of entity models and client results."""
+
+from __future__ import annotations
+
+from functools import cached_property
+from typing import ClassVar
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+from pydantic import computed_field
+
+from aireloom.client import AireloomClient
+from aireloom.models import (
+    BaseEntity,
+    LazyResearchProduct,
+    Project,
+    ResearchProduct,
+    projected_model,
+)
+from aireloom.resources import ResearchProductsClient, ScholixClient
+from aireloom.resources._paging import projected_entity_model
+from aireloom.unwrapper import OpenAireUnwrapper
+
+RECORD = {
+    "id": "rp1",
+    "mainTitle": "Projected",
+    "publicationDate": "2020-05-01",
+    "pids": [{"scheme": "doi", "value": "10.1/proj"}],
+    "indicators": {"citationImpact": {"citationCount": 3}},
+    "authors": [{"fullName": "Not Validated", "rank": "not-an-int"}],
+    "instances": [{"urls": ["https://example.org"]}],
+}
+FIELDS = {"pids", "publicationDate", "indicators"}
+
+
+class TestProjectedModel:
+    def test_keeps_only_projected_fields_and_id(self):
+        slim = projected_model(ResearchProduct, FIELDS)
+        assert set(slim.model_fields) == FIELDS | {"id"}
+
+        record = slim.model_validate(RECORD)
+        assert record.id == "rp1"
+        assert not hasattr(record, "authors")
+        assert record.model_extra is None
+
+    def test_computed_fields_follow_their_inputs(self):
+        slim = projected_model(ResearchProduct, FIELDS)
+        record = slim.model_validate(RECORD)
+
+        assert record.doi == "10.1/proj"
+        assert record.publication_year == 2020
+        assert record.citation_count == 3
+        assert "open_access_url" not in slim.model_computed_fields
+        assert "author_names" not in slim.model_computed_fields
+
+    def test_validators_are_carried_over(self):
+        slim = projected_model(ResearchProduct, {"mainTitle", "keywords"})
+        record = slim.model_validate({**RECORD, "keywords": "a, b"})
+        assert record.keywords == ["a", "b"]
+
+        projects = projected_model(Project, {"keywords"})
+        assert projects.model_validate({"id": "p1", "keywords": "x;y"}).keywords
+
+    def test_cached_per_field_set(self):
+        assert projected_model(ResearchProduct, ["pids"]) is projected_model(
+            ResearchProduct, {"pids"}
+        )
+
+    def test_lazy_model_projects_like_eager(self):
+        slim = projected_model(LazyResearchProduct, FIELDS)
+        record = slim.model_validate(RECORD)
+        assert record.doi == "10.1/proj"
+        assert (
+            record.model_dump()
+            == projected_model(ResearchProduct, FIELDS)
+            .model_validate(RECORD)
+            .model_dump()
+        )
+
+    def test_computed_fields_use_declared_inputs(self):
+        class Titled(BaseEntity):
+            title: str = ""
+            subtitle: str = ""
+            _computed_inputs: ClassVar = {"heading": ("title", "subtitle")}
+
+            @computed_field
+            @cached_property
+            def heading(self) -> str:
+                return self._join()
+
+            @computed_field
+            @property
+            def undeclared(self) -> str:
+                return self.title
+
+            def _join(self) -> str:
+                return f"{self.title}: {self.subtitle}"
+
+        assert "heading" not in projected_model(Titled, {"title"}).model_computed_fields
+        full = projected_model(Titled, {"title", "subtitle"})
+        assert set(full.model_computed_fields) == {"heading"}
+        record = full.model_validate({"id": "t", "title": "A", "subtitle": "B"})
+        assert record.model_dump()["heading"] == "A: B"
+
+    def test_declared_inputs_are_checked(self):
+        with pytest.raises(TypeError, match="missing"):
+
+            class Broken(BaseEntity):
+                _computed_inputs: ClassVar = {"label": ("missing",)}
+
+                @computed_field
+                @property
+                def label(self) -> str:
+                    return self.id
+
+    def test_unknown_field(self):
+        with pytest.raises(ValueError, match="nope"):
+            projected_model(ResearchProduct, {"pids", "nope"})
+
+
+@pytest.fixture
+def products() -> ResearchProductsClient:
+    api = AsyncMock(spec=AireloomClient)
+    api._response_unwrapper = OpenAireUnwrapper()
+    response = AsyncMock(spec=httpx.Response)
+    response.json.return_value = {
+        "header": {"numFound": 1, "nextCursor": None},
+        "results": [RECORD],
+    }
+    api.request.return_value = response
+    return ResearchProductsClient(api_client=api)
+
+
+@pytest.mark.asyncio
+async def test_iterate_and_collect_with_fields(products):
+    records = [r async for r in products.iterate(fields=FIELDS)]
+    collected = await products.collect(fields=FIELDS)
+
+    for record in (records[0], collected[0]):
+        assert type(record) is projected_model(ResearchProduct, FIELDS)
+        assert (record.id, record.doi, record.citation_count) == ("rp1", "10.1/proj", 3)
+
+
+@pytest.mark.asyncio
+async def test_search_with_fields(products):
+    page = await products.search(fields=["pids"])
+
+    [record] = page.results
+    assert record.doi == "10.1/proj"
+    assert not hasattr(record, "indicators")
+
+
+@pytest.mark.asyncio
+async def test_unknown_field_fails_before_requesting(products):
+    with pytest.raises(ValueError, match="nope"):
+        await products.search(fields={"nope"})
+    with pytest.raises(ValueError, match="nope"):
+        await products.collect(fields={"nope"})
+    products._api_client.request.assert_not_called()
+
+
+def test_fields_need_an_entity_model():
+    api = AsyncMock(spec=AireloomClient)
+    api._response_unwrapper = OpenAireUnwrapper()
+    scholix = ScholixClient(api_client=api)
+    with pytest.raises(ValueError, match="fields"):
+        projected_entity_model(scholix, {"id"})
+
+
+def test_cached_computed_fields_stay_cached():
+    slim = projected_model(ResearchProduct, FIELDS)
+    record = slim.model_validate(RECORD)
+
+    assert "doi" in slim._cached_fields
+    assert record.doi == record.__dict__["doi"] == "10.1/proj"
@@ -1,10 +1,19 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-
-from aireloom.models import Organization, Person, Project, ResearchProduct
+from bibliofabric.exceptions import APIError
+
+from aireloom.models import (
+    Organization,
+    Person,
+    Project,
+    ResearchProduct,
+    ScholixRelationship,
+)
 from aireloom.queries import (
     all_links,
+    citations_and_datasets,
     citing_works,
     count_publications,
     projects_by_organization,
@@ -14,6 +23,8 @@ from aireloom.queries import (
     publications_by_project,
     related_datasets,
 )
+from aireloom.resources._batch import BatchGetError, BatchMixin
+from aireloom.resources._identifiers import canonical_id
 
 
 @pytest.fixture
@@ -26,41 +37,122 @@ def session():
     return sess
 
 
+def _scholix_link(
+    source: str, target: str, name: str = "References"
+) -> ScholixRelationship:
+    return ScholixRelationship.model_validate(
+        {
+            "RelationshipType": {"Name": name},
+            "Source": {
+                "Identifier": [{"ID": source, "IDScheme": "doi"}],
+                "Type": "publication",
+            },
+            "Target": {
+                "Identifier": [{"ID": target, "IDScheme": "doi"}],
+                "Type": "dataset",
+            },
+        }
+    )
+
+
 # ---------------------------------------------------------------------------
 # publications_by_doi
 # ---------------------------------------------------------------------------
 
 
+class _DoiClient(BatchMixin):
+    """Batch client over a fake search that knows a fixed set of records."""
+
+    _batch_fields = {"doi": "pid"}
+
+    def __init__(self, known: list[tuple[str, str]]):
+        self.known = known
+        self.requests: list[list[str]] = []
+
+    async def search(self, page=1, page_size=20, filters=None, **kwargs):
+        values = filters["pid"].split(",")
+        self.requests.append(values)
+        requested = {canonical_id(v) for v in values}
+        records = [
+            ResearchProduct.model_validate(
+                {"id": rid, "pids": [{"scheme": "doi", "value": doi}]}
+            )
+            for doi, rid in self.known
+            if doi in requested
+        ]
+        start = (page - 1) * page_size
+        return {
+            "header": {"numFound": len(records)},
+            "results": records[start : start + page_size],
+        }
+
+
 class TestPublicationsByDoi:
     @pytest.mark.asyncio
     async def test_single_doi(self, session):
-        session.research_products.collect.return_value = [
-            ResearchProduct.model_validate({"id": "1", "title": "Paper"}),
-        ]
-        results = await publications_by_doi(session, "10.1234/test")
-        assert len(results) == 1
-        session.research_products.collect.assert_called_once()
-        call_kwargs = session.research_products.collect.call_args[1]
-        assert call_kwargs["filters"].pid == "10.1234/test"
+        session.research_products = _DoiClient([("10.1234/test", "1")])
+        products, missing = await publications_by_doi(session, "10.1234/test")
+        assert [p.id for p in products] == ["1"]
+        assert missing == []
+
+    @pytest.mark.asyncio
+    async def test_dois_batched_ten_per_request(self, session):
+        session.research_products = client = _DoiClient([])
+        dois = [f"10.1/{i}" for i in range(25)]
+        await publications_by_doi(session, *dois, max_concurrency=2)
+        assert [len(r) for r in client.requests] == [10, 10, 5]
+
+    @pytest.mark.asyncio
+    async def test_results_follow_input_order(self, session):
+        session.research_products = _DoiClient([("10.1/a", "1"), ("10.2/b", "2")])
+
+        result = await publications_by_doi(
+            session, "10.2/b", "10.1/a", "https://doi.org/10.1/A"
+        )
+
+        assert [r.id for r in result.products] == ["2", "1"]
+        assert result.missing == []
+
+    @pytest.mark.asyncio
+    async def test_several_records_per_doi(self, session):
+        session.research_products = _DoiClient(
+            [("10.1/a", "1"), ("10.1/a", "1b"), ("10.2/b", "2"), ("10.2/b", "2b")]
+        )
+
+        result = await publications_by_doi(session, "10.1/a", "10.2/b")
+
+        assert [r.id for r in result.products] == ["1", "1b", "2", "2b"]
+        assert result.missing == []
 
     @pytest.mark.asyncio
-    async def test_multiple_dois(self, session):
-        await publications_by_doi(session, "10.1/a", "10.2/b")
-        assert session.research_products.collect.call_count == 2
+    async def test_reports_missing(self, session):
+        session.research_products = _DoiClient([("10.1/a", "1")])
+        result = await publications_by_doi(session, "10.9/x", "10.1/a", "10.9/y")
+        assert [r.id for r in result.products] == ["1"]
+        assert result.missing == ["10.9/x", "10.9/y"]
 
     @pytest.mark.asyncio
-    async def test_aggregates_results(self, session):
-        rp1 = ResearchProduct.model_validate({"id": "1", "title": "A"})
-        rp2 = ResearchProduct.model_validate({"id": "2", "title": "B"})
-        session.research_products.collect.side_effect = [[rp1], [rp2]]
-        results = await publications_by_doi(session, "10.1/a", "10.2/b")
-        assert results == [rp1, rp2]
+    async def test_failed_batches_keep_found_products(self, session):
+        client = _DoiClient([("10.1/a", "1"), ("10.1/a", "1b")])
+        search = client.search
+
+        async def failing(page=1, page_size=20, filters=None, **kwargs):
+            if "10.9/bad" in filters["pid"]:
+                raise APIError("400 Bad Request")
+            return await search(page, page_size, filters, **kwargs)
+
+        client.search = failing
+        session.research_products = client
+
+        with pytest.raises(BatchGetError) as exc_info:
+            await publications_by_doi(session, "10.1/a", "10.9/bad")
+        assert [p.id for p in exc_info.value.results["10.1/a"]] == ["1", "1b"]
+        assert exc_info.value.failures[0].identifiers == ["10.9/bad"]
 
     @pytest.mark.asyncio
     async def test_no_dois(self, session):
-        results = await publications_by_doi(session)
-        assert results == []
-        session.research_products.collect.assert_not_called()
+        assert await publications_by_doi(session) == ([], [])
+        session.research_products.batch_stream.assert_not_called()
 
 
 # ---------------------------------------------------------------------------
@@ -481,18 +573,78 @@ class TestAllLinks:
 
     @pytest.mark.asyncio
     async def test_both_with_limit(self, session):
-        """When direction='both' and limit is set, second call respects remaining limit."""
-        link1 = MagicMock(name="link1")
-        link2 = MagicMock(name="link2")
-        session.scholix.collect.side_effect = [[link1], [link2]]
-        await all_links(session, "10.1234/test", direction="both", limit=10)
-        # First call gets limit=10, second call gets limit=9 (10 - 1 result)
+        """Both directions are fetched with the full limit; the merge is capped."""
+        links = [MagicMock(name=f"link{i}") for i in range(4)]
+        session.scholix.collect.side_effect = [links[:2], links[2:]]
+        results = await all_links(session, "10.1234/test", direction="both", limit=3)
         calls = session.scholix.collect.call_args_list
-        assert calls[0][1]["limit"] == 10
-        assert calls[1][1]["limit"] == 9
+        assert [c[1]["limit"] for c in calls] == [3, 3]
+        assert results == links[:3]
+
+    @pytest.mark.asyncio
+    async def test_both_directions_run_concurrently(self, session):
+        started = []
+        release = asyncio.Event()
+
+        async def collect(**kwargs):
+            started.append(kwargs["filters"])
+            if len(started) == 2:
+                release.set()
+            await release.wait()
+            return []
+
+        session.scholix.collect.side_effect = collect
+        await asyncio.wait_for(all_links(session, "10.1234/test"), timeout=1)
+        assert len(started) == 2
+
+    @pytest.mark.asyncio
+    async def test_both_deduplicates_links(self, session):
+        self_link = _scholix_link("10.1234/test", "10.1234/TEST", "IsIdenticalTo")
+        cites = _scholix_link("10.1234/test", "10.9/other")
+        cited_by = _scholix_link("10.9/other", "10.1234/test")
+        session.scholix.collect.side_effect = [
+            [self_link, cites],
+            [cited_by, _scholix_link("10.1234/TEST", "10.1234/test", "isidenticalto")],
+        ]
+        results = await all_links(session, "10.1234/test", limit=3)
+        assert results == [self_link, cites, cited_by]
 
     @pytest.mark.asyncio
     async def test_source_with_limit(self, session):
         await all_links(session, "10.1234/test", direction="source", limit=5)
         call_kwargs = session.scholix.collect.call_args[1]
         assert call_kwargs["limit"] == 5
+
+
+# ---------------------------------------------------------------------------
+# citations_and_datasets
+# ---------------------------------------------------------------------------
+
+
+class TestCitationsAndDatasets:
+    @pytest.mark.asyncio
+    async def test_fetches_both_lists(self, session):
+        citing = _scholix_link("10.9/citing", "10.1234/test")
+        dataset = _scholix_link("10.1234/test", "10.9/data")
+        session.scholix.collect.side_effect = [[citing, citing], [dataset]]
+
+        result = await citations_and_datasets(
+            session, "10.1234/test", source_type="Publication", limit=5
+        )
+
+        assert result.citing == [citing]
+        assert result.datasets == [dataset]
+        first, second = session.scholix.collect.call_args_list
+        assert first[1]["filters"].targetPid == "10.1234/test"
+        assert first[1]["filters"].sourceType == "Publication"
+        assert second[1]["filters"].sourcePid == "10.1234/test"
+        assert second[1]["filters"].targetType == "Dataset"
+        assert first[1]["limit"] == second[1]["limit"] == 5
+
+    @pytest.mark.asyncio
+    async def test_link_in_both_lists_kept_once(self, session):
+        self_link = _scholix_link("10.1234/test", "10.1234/test")
+        session.scholix.collect.side_effect = [[self_link], [self_link]]
+        result = await citations_and_datasets(session, "10.1234/test")
+        assert result.citing == [self_link]
+        assert result.datasets == []
@@ -232,3 +232,26 @@ def test_get_total_results_object_without_int_conversion(unwrapper):
 
     response_json = {"header": {"numFound": NonConvertible()}}
     assert unwrapper.get_total_results(response_json) is None
+
+
+def test_unwrap_header_skips_results(unwrapper):
+    # The results are deliberately malformed: they must never be decoded.
+    raw = b'{ "header" : {"numFound": 12, "nextCursor": "c1"}, "results": [{oops'
+    assert unwrapper.unwrap_header(raw) == {"numFound": 12, "nextCursor": "c1"}
+
+
+def test_unwrap_header_not_first_key(unwrapper):
+    raw = '{"results": [{"id": 1}], "header": {"numFound": 1}}'
+    assert unwrapper.unwrap_header(raw) == {"numFound": 1}
+
+
+def test_unwrap_header_missing(unwrapper):
+    assert unwrapper.unwrap_header(b'{"results": []}') == {}
+    assert unwrapper.unwrap_header(b'{"header": null, "results": []}') == {}
+
+
+def test_unwrap_header_invalid(unwrapper):
+    with pytest.raises(ValueError):
+        unwrapper.unwrap_header(b"[1, 2]")
+    with pytest.raises(ValueError):
+        unwrapper.unwrap_header(b"not json")